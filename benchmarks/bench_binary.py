@@ -0,0 +1,81 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time of loading sentences saved with
+:func:`colonel.conllu.binary.save_corpus`, compared to parsing the same
+*CoNLL-U* file with :func:`colonel.conllu.parse_file` and to
+:func:`colonel.conllu.packing.loads_sentences`, together with the size of
+each representation and the latency of random access by position with a
+:class:`colonel.conllu.CorpusReader` and a
+:class:`colonel.conllu.IndexedReader`.
+
+Run with ``python -m benchmarks.bench_binary``.
+"""
+
+import os
+import random
+import tempfile
+import time
+from functools import partial
+import colonel.conllu
+from colonel.conllu.binary import save_corpus, load_corpus
+from colonel.conllu.packing import dumps_sentences, loads_sentences
+from benchmarks.common import make_sentence, measure, report
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'corpus.conllu')
+        with open(path, 'w', encoding='utf-8') as file:
+            for number in range(20000):
+                file.write(make_sentence(number, 20))
+
+        start = time.perf_counter()
+        sentences = colonel.conllu.parse_file(path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path) / 2 ** 20
+        print(f'{"parse_file()":<20} {elapsed:>6.2f} s  {size:>6.1f} MiB')
+
+        binary_path = os.path.join(directory, 'corpus.bin')
+        save_corpus(sentences, binary_path)
+        start = time.perf_counter()
+        load_corpus(binary_path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(binary_path) / 2 ** 20
+        print(f'{"load_corpus()":<20} {elapsed:>6.2f} s  {size:>6.1f} MiB')
+
+        data = dumps_sentences(sentences)
+        start = time.perf_counter()
+        loads_sentences(data)
+        elapsed = time.perf_counter() - start
+        size = len(data) / 2 ** 20
+        print(f'{"loads_sentences()":<20} {elapsed:>6.2f} s  {size:>6.1f} MiB')
+
+        positions = random.Random(0).choices(range(len(sentences)), k=2000)
+        readers = [('CorpusReader', colonel.conllu.CorpusReader(binary_path)),
+                   ('IndexedReader', colonel.conllu.IndexedReader(path))]
+        for name, reader in readers:
+            with reader:
+                timings = [
+                    timing for position in positions
+                    for timing in measure(partial(reader.__getitem__,
+                                                  position), 1)
+                ]
+            report(f'{name}[i]', timings)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time of :func:`colonel.conllu.parse_file` with a
+:class:`colonel.conllu.ParseCache`, on the first call, which parses the file
+and stores its sentences, and on the following ones, which load them from
+the cache, compared to parsing without any cache.
+
+Run with ``python -m benchmarks.bench_cache``.
+"""
+
+import os
+import tempfile
+import time
+import colonel.conllu
+from benchmarks.common import make_sentence
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'corpus.conllu')
+        with open(path, 'w', encoding='utf-8') as file:
+            for number in range(20000):
+                file.write(make_sentence(number, 20))
+
+        cache = colonel.conllu.ParseCache(os.path.join(directory, 'cache'))
+        runs = [('no cache', None), ('cold cache', cache),
+                ('warm cache', cache), ('warm cache', cache)]
+
+        for label, run_cache in runs:
+            start = time.perf_counter()
+            colonel.conllu.parse_file(path, cache=run_cache)
+            elapsed = time.perf_counter() - start
+            print(f'{label:<12} {elapsed:>6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Latency of importing :mod:`colonel.conllu` and parsing a first sentence in
+a fresh Python process, loading the precomputed *PLY* tables versus
+generating them from the grammar rules.
+
+Run with ``python -m benchmarks.bench_cold_start``.
+"""
+
+import subprocess
+import sys
+from benchmarks.common import report
+
+_CONTENT = repr('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n')
+
+_PRECOMPUTED = f'''
+import colonel.conllu
+colonel.conllu.parse({_CONTENT})
+'''
+
+_GENERATED = f'''
+import colonel.conllu
+from colonel.conllu import parser
+parser.PARSETAB = 'colonel.conllu.missing_parsetab'
+parser.ConlluParserBuilder(optimize=False).parser.parse({_CONTENT})
+'''
+
+_TEMPLATE = '''
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+'''
+
+
+def _run(code: str) -> float:
+    output = subprocess.run(
+        [sys.executable, '-c', _TEMPLATE.format(code=code)],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True
+    ).stdout
+    return float(output)
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    repeat = 20
+    report('tables generated from the grammar',
+           [_run(_GENERATED) for _ in range(repeat)])
+    report('precomputed tables (default)',
+           [_run(_PRECOMPUTED) for _ in range(repeat)])
+
+
+if __name__ == '__main__':
+    main()
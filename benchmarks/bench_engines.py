@@ -0,0 +1,42 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parsing throughput of the ``'ply'`` and ``'fast'`` engines.
+
+Run with ``python -m benchmarks.bench_engines``.
+"""
+
+from colonel.conllu import parse, ENGINES
+from benchmarks.common import make_corpus, measure
+
+_SENTENCES = 2000
+_LENGTH = 20
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = make_corpus(_SENTENCES, _LENGTH)
+    megabytes = len(content.encode('utf-8')) / 2 ** 20
+
+    for engine in ENGINES:
+        elapsed = min(measure(lambda: parse(content, engine), 3))
+        print(f'{engine:<6} '
+              f'{_SENTENCES / elapsed:>10.0f} sentences/s  '
+              f'{_SENTENCES * _LENGTH / elapsed:>10.0f} words/s  '
+              f'{megabytes / elapsed:>6.2f} MB/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time and memory retained by parsing all the fields, compared to
+parsing only ``FORM``, ``UPOS`` and ``HEAD`` with the ``fields`` option, on
+a corpus where ``FEATS`` and ``DEPS`` values rarely repeat.
+
+Run with ``python -m benchmarks.bench_fields``.
+"""
+
+import tracemalloc
+from colonel.conllu import parse
+from benchmarks.bench_lazy_fields import _make_content
+from benchmarks.common import measure
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = _make_content()
+
+    for label, options in [
+            ('all fields', {}),
+            ('lazy_fields', {'lazy_fields': True}),
+            ('form, upos, head', {'fields': ('form', 'upos', 'head')})]:
+        elapsed = min(measure(lambda: parse(content, **options), 3))
+
+        tracemalloc.start()
+        sentences = parse(content, **options)
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        size = sum(stat.size for stat in snapshot.statistics('filename'))
+        del sentences
+
+        print(f'{label:<18} {elapsed * 1e3:>8.1f} ms  '
+              f'{size / 2 ** 20:>8.2f} MB retained')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-call latency of parsing one sentence of 10 to 60 words with
+:meth:`colonel.Sentence.from_conllu`, compared to
+:func:`colonel.conllu.parse`.
+
+Run with ``python -m benchmarks.bench_from_conllu``.
+"""
+
+from functools import partial
+from colonel import Sentence
+from colonel.conllu import parse
+from benchmarks.common import make_sentence, measure, report
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    for length in (10, 20, 40, 60):
+        content = make_sentence(0, length)
+        report(f'conllu.parse() ({length} words)',
+               measure(partial(parse, content), 5000))
+        report(f'Sentence.from_conllu() ({length} words)',
+               measure(partial(Sentence.from_conllu, content), 5000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time of a read-modify-write pipeline, which parses a *CoNLL-U*
+content, assigns a new ``DEPREL`` to every word (the same one for 90% of
+them) and serializes the sentences back, with and without the
+``keep_lines`` option of :func:`colonel.conllu.parse`.
+
+Run with ``python -m benchmarks.bench_keep_lines``.
+"""
+
+import time
+import colonel.conllu
+from benchmarks.common import make_corpus
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = make_corpus(20000, 20)
+
+    for keep_lines in (False, True):
+        start = time.perf_counter()
+        sentences = colonel.conllu.parse(content, keep_lines=keep_lines)
+        parsed = time.perf_counter()
+
+        for number, sentence in enumerate(sentences):
+            for word in sentence.words():
+                word.deprel = 'dep' if number % 10 == 0 else word.deprel
+        changed = time.perf_counter()
+
+        colonel.conllu.to_conllu(sentences)
+        end = time.perf_counter()
+
+        print(f'keep_lines={keep_lines!s:<5}  '
+              f'parse {parsed - start:>5.2f} s  '
+              f'assign {changed - parsed:>5.2f} s  '
+              f'serialize {end - changed:>5.2f} s  '
+              f'total {end - start:>5.2f} s')
+
+
+if __name__ == '__main__':
+    main()
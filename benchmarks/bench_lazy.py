@@ -0,0 +1,52 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time and memory allocated by a metadata-only pass, collecting the
+``sent_id`` comment of each sentence, with eager and lazy parsing.
+
+Run with ``python -m benchmarks.bench_lazy``.
+"""
+
+import tracemalloc
+from colonel.conllu import parse
+from benchmarks.common import make_corpus, measure
+
+_SENTENCES = 2000
+_LENGTH = 20
+
+
+def _sent_ids(content: str, lazy: bool) -> list:
+    return [s.comments[0] for s in parse(content, lazy=lazy)]
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = make_corpus(_SENTENCES, _LENGTH)
+
+    for label, lazy in [('eager', False), ('lazy', True)]:
+        elapsed = min(measure(lambda: _sent_ids(content, lazy), 3))
+
+        tracemalloc.start()
+        sentences = parse(content, lazy=lazy)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del sentences
+
+        print(f'{label:<6} {elapsed * 1e3:>8.1f} ms  '
+              f'{size / 2 ** 20:>8.2f} MB retained')
+
+
+if __name__ == '__main__':
+    main()
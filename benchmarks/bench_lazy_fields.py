@@ -0,0 +1,66 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time, number of live allocations and memory retained by parsing
+with and without the ``lazy_fields`` option, on a corpus where ``FEATS`` and
+``DEPS`` values rarely repeat.
+
+Run with ``python -m benchmarks.bench_lazy_fields``.
+"""
+
+import tracemalloc
+from colonel.conllu import parse
+from benchmarks.common import make_corpus, measure
+
+_SENTENCES = 2000
+_LENGTH = 20
+
+
+def _make_content() -> str:
+    content = make_corpus(_SENTENCES, _LENGTH)
+    lines = content.split('\n')
+    for number, line in enumerate(lines):
+        fields = line.split('\t')
+        if len(fields) == 10:
+            fields[5] = f'Case=Nom|Number=Sing|Id=X{number}'
+            fields[8] = f'{fields[6]}:{fields[7]}|{number}:ref'
+            lines[number] = '\t'.join(fields)
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = _make_content()
+
+    for label, lazy_fields in [('decoded', False), ('lazy_fields', True)]:
+        elapsed = min(measure(
+            lambda: parse(content, lazy_fields=lazy_fields), 3))
+
+        tracemalloc.start()
+        sentences = parse(content, lazy_fields=lazy_fields)
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        stats = snapshot.statistics('filename')
+        blocks = sum(stat.count for stat in stats)
+        size = sum(stat.size for stat in stats)
+        del sentences
+
+        print(f'{label:<12} {elapsed * 1e3:>8.1f} ms  '
+              f'{blocks / (_SENTENCES * _LENGTH):>6.1f} blocks/word  '
+              f'{size / 2 ** 20:>8.2f} MB retained')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time of parsing a *CoNLL-U* file with
+:func:`colonel.conllu.parse_parallel`, compared to
+:func:`colonel.conllu.parse_file`, together with the cost of sending the
+parsed sentences back to the parent process, both with plain pickling and
+with :func:`colonel.conllu.packing.loads_sentences`.
+
+Run with ``python -m benchmarks.bench_parallel``.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+import colonel.conllu
+from colonel.conllu.packing import dumps_sentences, loads_sentences
+from benchmarks.common import make_sentence
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'corpus.conllu')
+        with open(path, 'w', encoding='utf-8') as file:
+            for number in range(20000):
+                file.write(make_sentence(number, 20))
+
+        start = time.perf_counter()
+        sentences = colonel.conllu.parse_file(path)
+        elapsed = time.perf_counter() - start
+        print(f'{"parse_file(path)":<32} {elapsed:>6.2f} s')
+
+        for workers in sorted({2, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            colonel.conllu.parse_parallel(path, workers=workers)
+            elapsed = time.perf_counter() - start
+            label = f'parse_parallel(workers={workers})'
+            print(f'{label:<32} {elapsed:>6.2f} s')
+
+    data = pickle.dumps(sentences, pickle.HIGHEST_PROTOCOL)
+    start = time.perf_counter()
+    pickle.loads(data)
+    elapsed = time.perf_counter() - start
+    print(f'{"unpickle sentences":<32} {elapsed:>6.2f} s')
+
+    data = dumps_sentences(sentences)
+    start = time.perf_counter()
+    loads_sentences(data)
+    elapsed = time.perf_counter() - start
+    print(f'{"loads_sentences()":<32} {elapsed:>6.2f} s')
+
+
+if __name__ == '__main__':
+    main()
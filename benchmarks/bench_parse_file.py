@@ -0,0 +1,86 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Peak memory usage and elapsed time of parsing a whole *CoNLL-U* file with
+:func:`colonel.conllu.parse_file`, compared to reading it into a string or
+into a bytes object for :func:`colonel.conllu.parse`. Each case runs in a
+fresh Python process.
+
+Run with ``python -m benchmarks.bench_parse_file``.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Tuple
+from benchmarks.common import make_sentence
+
+_READ = '''
+with open(PATH, encoding='utf-8') as file:
+    sentences = colonel.conllu.parse(file.read())
+'''
+
+_READ_BYTES = '''
+with open(PATH, 'rb') as file:
+    sentences = colonel.conllu.parse(file.read())
+'''
+
+_PARSE_FILE = '''
+sentences = colonel.conllu.parse_file(PATH)
+'''
+
+_TEMPLATE = '''
+import resource
+import time
+import colonel.conllu
+PATH = {path!r}
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+
+def _run(path: str, code: str) -> Tuple[float, float]:
+    output = subprocess.run(
+        [sys.executable, '-c', _TEMPLATE.format(path=path, code=code)],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True
+    ).stdout
+    elapsed, max_rss = output.split()
+    return float(elapsed), int(max_rss) / 1024
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'corpus.conllu')
+        with open(path, 'w', encoding='utf-8') as file:
+            for number in range(20000):
+                file.write(make_sentence(number, 20))
+
+        size = os.path.getsize(path) / 2 ** 20
+        print(f'file size {size:.1f} MB')
+
+        for label, code in [('parse(file.read())', _READ),
+                            ('parse(binary content)', _READ_BYTES),
+                            ('parse_file(path)', _PARSE_FILE)]:
+            elapsed, max_rss = _run(path, code)
+            print(f'{label:<24} {elapsed:>6.2f} s  '
+                  f'peak RSS {max_rss:>8.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-call latency of parsing small inputs with the *PLY* engine, building
+a new parser for each call versus reusing one :class:`colonel.conllu.Parser`.
+
+Both arms use the *PLY* engine; the fresh parsers are built in
+non-optimized mode, validating the grammar as every call used to do, so
+that neither the precomputed tables nor the fast engine affect the result.
+
+Run with ``python -m benchmarks.bench_parser_reuse``.
+"""
+
+from colonel.conllu.parser import ConlluParserBuilder, Parser
+from benchmarks.common import make_corpus, measure, report
+
+
+def _parse_with_new_parser(content: str) -> None:
+    builder = ConlluParserBuilder(optimize=False)
+    builder.parser.parse(content, lexer=builder.lexer)
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = make_corpus(1)
+    parser = Parser()
+
+    report('new ConlluParserBuilder per call', measure(
+        lambda: _parse_with_new_parser(content), 200))
+
+    report('reused Parser', measure(lambda: parser.parse(content), 2000))
+
+
+if __name__ == '__main__':
+    main()
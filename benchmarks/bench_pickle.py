@@ -0,0 +1,70 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Size and elapsed time of pickling and unpickling parsed sentences with
+the compact representation of :class:`colonel.Sentence` and its elements,
+compared to the default pickling of slotted objects, which stores the name
+of every slot of every element.
+
+Run with ``python -m benchmarks.bench_pickle``.
+"""
+
+import copyreg
+import io
+import pickle
+import time
+from typing import Any, List
+import colonel.conllu
+from colonel import Sentence, Word, EmptyNode, Multiword
+from benchmarks.common import make_corpus
+
+
+def _default_reduce(obj: Any) -> Any:
+    return object.__reduce_ex__(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def _default_dumps(sentences: List[Sentence]) -> bytes:
+    stream = io.BytesIO()
+    pickler = pickle.Pickler(stream, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    for cls in (Sentence, Word, EmptyNode, Multiword):
+        pickler.dispatch_table[cls] = _default_reduce
+    pickler.dump(sentences)
+    return stream.getvalue()
+
+
+def _compact_dumps(sentences: List[Sentence]) -> bytes:
+    return pickle.dumps(sentences, pickle.HIGHEST_PROTOCOL)
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    sentences = colonel.conllu.parse(make_corpus(20000, 20))
+
+    for label, dumps in (('default', _default_dumps),
+                         ('compact', _compact_dumps)):
+        start = time.perf_counter()
+        data = dumps(sentences)
+        dumped = time.perf_counter()
+        pickle.loads(data)
+        loaded = time.perf_counter()
+
+        print(f'{label:<8} {len(data) / 2 ** 20:>6.1f} MiB  '
+              f'dump {dumped - start:>5.2f} s  '
+              f'load {loaded - dumped:>5.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time of extracting one sentence in a hundred by ``sent_id``,
+filtering the parsed sentences compared to the ``where`` option.
+
+Run with ``python -m benchmarks.bench_where``.
+"""
+
+from typing import List
+from colonel.conllu import parse
+from benchmarks.common import make_corpus, measure
+
+_SENTENCES = 10000
+_LENGTH = 20
+
+
+def _is_selected(comments: List[str]) -> bool:
+    return comments[0].endswith('00')
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = make_corpus(_SENTENCES, _LENGTH)
+
+    def parse_and_filter():
+        return [sentence for sentence in parse(content)
+                if _is_selected(sentence.comments)]
+
+    def parse_where():
+        return parse(content, where=_is_selected)
+
+    assert len(parse_and_filter()) == len(parse_where())
+
+    for label, func in [('parse() and filter', parse_and_filter),
+                        ('parse(where=...)', parse_where)]:
+        elapsed = min(measure(func, 3))
+        print(f'{label:<20} {elapsed * 1e3:>8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput and peak memory of serializing parsed sentences to a file with
+:func:`colonel.conllu.write_conllu`, compared to writing the whole output of
+:func:`colonel.conllu.to_conllu` at once.
+
+Run with ``python -m benchmarks.bench_write``.
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, IO, Any
+import colonel.conllu
+from benchmarks.common import make_corpus
+
+
+def _measure(label: str, path: str, mode: str,
+             write: Callable[[IO[Any]], object]) -> None:
+    encoding = None if 'b' in mode else 'utf-8'
+
+    with open(path, mode, encoding=encoding) as file:
+        start = time.perf_counter()
+        write(file)
+        elapsed = time.perf_counter() - start
+    size = os.path.getsize(path) / 2 ** 20
+
+    with open(path, mode, encoding=encoding) as file:
+        tracemalloc.start()
+        write(file)
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+
+    print(f'{label:<40} {size / elapsed:>7.1f} MiB/s  '
+          f'peak {peak:>7.1f} MiB')
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    sentences = colonel.conllu.parse(make_corpus(20000, 20))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'corpus.conllu')
+
+        _measure('file.write(to_conllu()), text', path, 'w',
+                 lambda file: file.write(colonel.conllu.to_conllu(sentences)))
+        _measure('file.write(to_conllu()), binary', path, 'wb',
+                 lambda file: file.write(
+                     colonel.conllu.to_conllu(sentences).encode('utf-8')))
+        _measure('write_conllu(), text', path, 'w',
+                 lambda file: colonel.conllu.write_conllu(sentences, file))
+        _measure('write_conllu(), binary', path, 'wb',
+                 lambda file: colonel.conllu.write_conllu(sentences, file))
+
+
+if __name__ == '__main__':
+    main()
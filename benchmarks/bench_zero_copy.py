@@ -0,0 +1,71 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Elapsed time and memory retained by :func:`colonel.conllu.parse_file`,
+with and without the ``zero_copy`` option, together with the time taken for
+reading the ``FORM`` of every word.
+
+Run with ``python -m benchmarks.bench_zero_copy``.
+"""
+
+import os
+import tempfile
+import tracemalloc
+from functools import partial
+from typing import List
+from colonel.conllu import parse_file
+from colonel.sentence import Sentence
+from benchmarks.common import make_corpus, measure
+
+_SENTENCES = 5000
+_LENGTH = 20
+
+
+def _read_forms(sentences: List[Sentence]) -> List[str]:
+    return [element.form for sentence in sentences
+            for element in sentence.elements]
+
+
+def main() -> None:
+    # pylint: disable=missing-docstring
+    content = make_corpus(_SENTENCES, _LENGTH).replace(
+        '\t_\n', '\tSpaceAfter=No\n')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'corpus.conllu')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+        for label, zero_copy in [('parse_file', False),
+                                 ('zero_copy', True)]:
+            elapsed = min(measure(
+                lambda: parse_file(path, zero_copy=zero_copy), 3))
+
+            tracemalloc.start()
+            sentences = parse_file(path, zero_copy=zero_copy)
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            size = sum(stat.size for stat in snapshot.statistics('filename'))
+
+            read = min(measure(partial(_read_forms, sentences), 3))
+            del sentences
+
+            print(f'{label:<12} {elapsed * 1e3:>8.1f} ms  '
+                  f'{size / (_SENTENCES * _LENGTH):>6.0f} bytes/word  '
+                  f'read forms {read * 1e3:>6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers shared by the benchmark scripts."""
+
+import time
+from typing import Callable, List
+
+_WORD_LINE = '{index}\t{form}\t{lemma}\t{upos}\t_\t{feats}\t{head}\t' \
+    '{deprel}\t{head}:{deprel}\t_\n'
+
+_UPOS = ['NOUN', 'VERB', 'ADJ', 'DET', 'PUNCT']
+
+_FEATS = ['Number=Sing', 'Mood=Ind|Tense=Pres|VerbForm=Fin', '_',
+          'Definite=Def|PronType=Art', '_']
+
+_DEPRELS = ['nsubj', 'root', 'amod', 'det', 'punct']
+
+
+def make_sentence(number: int, length: int = 10) -> str:
+    """Returns a synthetic *CoNLL-U* sentence with the given number of words.
+    """
+    lines = [f'# sent_id = s{number}\n', f'# text = sentence {number}\n']
+    for index in range(1, length + 1):
+        kind = index % 5
+        lines.append(_WORD_LINE.format(
+            index=index,
+            form=f'form{index}',
+            lemma=f'lemma{index}',
+            upos=_UPOS[kind],
+            feats=_FEATS[kind],
+            head=0 if index == 1 else 1,
+            deprel=_DEPRELS[kind]
+        ))
+    lines.append('\n')
+    return ''.join(lines)
+
+
+def make_corpus(sentences: int, length: int = 10) -> str:
+    """Returns a synthetic *CoNLL-U* content with the given number of
+    sentences.
+    """
+    return ''.join(make_sentence(i, length) for i in range(sentences))
+
+
+def measure(func: Callable[[], object], repeat: int) -> List[float]:
+    """Calls ``func`` the given number of times, returning the list of the
+    elapsed times in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def percentile(timings: List[float], value: float) -> float:
+    """Returns the given percentile (from 0 to 100) of a list of timings."""
+    ordered = sorted(timings)
+    position = min(len(ordered) - 1, int(len(ordered) * value / 100))
+    return ordered[position]
+
+
+def report(label: str, timings: List[float]) -> None:
+    """Prints a short summary of a list of timings, in microseconds."""
+    print(f'{label:<40} '
+          f'p50 {percentile(timings, 50) * 1e6:>10.1f} us  '
+          f'p99 {percentile(timings, 99) * 1e6:>10.1f} us')
@@ -15,6 +15,7 @@
 
 """Colonel - a Python 3 library for handling CoNLL data formats"""
 
+from colonel._version import __version__  # noqa: F401
 from colonel.sentence import Sentence
 from colonel.word import Word
 from colonel.emptynode import EmptyNode
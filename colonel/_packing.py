@@ -0,0 +1,147 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the compact representation of sentences and elements
+based on their slot values, shared by their pickling methods and by
+:mod:`colonel.conllu.packing`.
+
+Each sentence is reduced to a tuple composed by its class, its comments,
+the tuple of the classes of its elements, and one flat tuple with the slot
+values of all its elements, in a fixed order; objects are restored filling
+their slots directly, without calling any constructor.
+"""
+
+from typing import List, Tuple, Dict, Callable, Any
+
+__all__ = ['get_descriptors', 'pack_sentence', 'unpack_sentence',
+           'pack_element', 'unpack_element']
+
+# The names of the slots of sentence classes which can be packed.
+_SENTENCE_SLOTS = ('elements', 'comments')
+
+# The slot descriptors of each class, in a fixed order.
+_DESCRIPTORS: Dict[type, Tuple[Any, ...]] = {}
+
+# The "__get__" methods of the slot descriptors of each class.
+_GETTERS: Dict[type, Tuple[Callable[[Any], Any], ...]] = {}
+
+# The "__set__" methods of the slot descriptors of each class.
+_SETTERS: Dict[type, Tuple[Callable[[Any, Any], None], ...]] = {}
+
+
+def get_descriptors(cls: type) -> Tuple[Any, ...]:
+    """Returns the slot descriptors of a class, from its base classes on.
+
+    :raise TypeError: if the objects of the class have attributes not
+        stored in ``__slots__``
+    """
+    descriptors = _DESCRIPTORS.get(cls)
+    if descriptors is None:
+        if '__dict__' in dir(cls):
+            raise TypeError(f'Objects of type {cls.__name__} can\'t be packed')
+        descriptors = _DESCRIPTORS[cls] = tuple(
+            klass.__dict__[name]
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get('__slots__', ())
+        )
+    return descriptors
+
+
+def _get_getters(cls: type) -> Tuple[Callable[[Any], Any], ...]:
+    getters = _GETTERS.get(cls)
+    if getters is None:
+        getters = _GETTERS[cls] = tuple(
+            descriptor.__get__ for descriptor in get_descriptors(cls))
+    return getters
+
+
+def _get_setters(cls: type) -> Tuple[Callable[[Any, Any], None], ...]:
+    setters = _SETTERS.get(cls)
+    if setters is None:
+        setters = _SETTERS[cls] = tuple(
+            descriptor.__set__ for descriptor in get_descriptors(cls))
+    return setters
+
+
+def pack_sentence(sentence: Any) -> tuple:
+    """Returns the compact representation of a sentence.
+
+    :raise TypeError: if the sentence or any element has attributes not
+        stored in ``__slots__``, or any other slot than the ones of
+        :class:`colonel.Sentence`
+    """
+    sentence_class = type(sentence)
+    names = tuple(descriptor.__name__
+                  for descriptor in get_descriptors(sentence_class))
+    if names != _SENTENCE_SLOTS:
+        raise TypeError(f'Objects of type {sentence_class.__name__} '
+                        f'can\'t be packed')
+
+    classes = []
+    values: List[Any] = []
+    for element in sentence.elements:
+        element_class = type(element)
+        classes.append(element_class)
+        values.extend([getter(element)
+                       for getter in _get_getters(element_class)])
+
+    return sentence_class, sentence.comments, tuple(classes), tuple(values)
+
+
+def unpack_sentence(
+        sentence_class: type,
+        comments: List[str],
+        classes: Tuple[type, ...],
+        values: Tuple[Any, ...]
+) -> Any:
+    """Returns a sentence from its compact representation (see
+    :func:`pack_sentence`).
+    """
+    new = object.__new__
+    sentence: Any = new(sentence_class)
+    sentence.comments = comments
+    elements: List[Any] = []
+    sentence.elements = elements
+    next_value = iter(values).__next__
+
+    for element_class in classes:
+        element: Any = new(element_class)
+        for setter in _get_setters(element_class):
+            setter(element, next_value())
+        elements.append(element)
+
+    return sentence
+
+
+def pack_element(element: Any) -> tuple:
+    """Returns the compact representation of an element: its class and the
+    tuple of its slot values.
+
+    :raise TypeError: if the element has attributes not stored in
+        ``__slots__``
+    """
+    element_class = type(element)
+    return element_class, tuple(getter(element)
+                                for getter in _get_getters(element_class))
+
+
+def unpack_element(element_class: type, values: Tuple[Any, ...]) -> Any:
+    """Returns an element from its compact representation (see
+    :func:`pack_element`).
+    """
+    element: Any = object.__new__(element_class)
+    for setter, value in zip(_get_setters(element_class), values):
+        setter(element, value)
+    return element
@@ -15,7 +15,8 @@
 
 """Module providing the :class:`.BaseSentenceElement` class."""
 
-from typing import Optional
+from typing import Optional, Union, Any
+from colonel._packing import pack_element, unpack_element
 
 __all__ = ['BaseSentenceElement']
 
@@ -60,6 +61,16 @@ class BaseSentenceElement:
         """
         return True
 
+    def __reduce_ex__(self, protocol: Any) -> Union[str, tuple]:
+        # Elements are pickled as their class and the positional values of
+        # their slots (see colonel._packing), without the names of the
+        # slots; objects with attributes outside of __slots__ are pickled
+        # the default way.
+        try:
+            return unpack_element, pack_element(self)
+        except (TypeError, AttributeError):
+            return super(BaseSentenceElement, self).__reduce_ex__(protocol)
+
     def to_conllu(self):
         """Returns a *CoNLL-U* formatted representation of the element.
 
@@ -17,11 +17,45 @@
 
 In most situations it's sufficient to make use of :func:`parse` and
 :func:`to_conllu` functions, without caring too much about the implementation
-under the hood.
+under the hood; when processing large files, :func:`iter_parse` allows to
+read one sentence at a time, keeping the memory usage bounded, and
+:func:`parse_file` avoids holding a copy of the whole file content in
+memory; :func:`.aparse` does the same as :func:`iter_parse` for
+:mod:`asyncio` streams, and an :class:`.IndexedReader` (see :mod:`.index`)
+returns sentences by position, parsing only the requested ones. Input
+received in chunks of arbitrary size can be pushed to an
+:class:`.IncrementalParser` (see :mod:`.incremental`). Large files can be
+parsed by many processes at once with :func:`.parse_parallel` and
+:func:`.iter_parse_parallel`, and whole treebanks, made of many files, with
+:func:`.parse_treebank` and :func:`.iter_parse_treebank` (see
+:mod:`.parallel`). For read-only processing of large files, the
+``zero_copy`` option of :func:`parse_file` returns elements whose text
+fields are read from the memory-mapped file on access (see
+:mod:`.zerocopy`). Noisy input can be parsed with
+:func:`parse_tolerant`, which skips invalid sentences and
+collects all the errors in one pass, instead of stopping at the first one.
+Any number of sentences can be written to a file with :func:`write_conllu`,
+without building the whole *CoNLL-U* string in memory; with the
+``keep_lines`` option, the parsed elements write back their original lines
+verbatim, unless they are changed (see :mod:`.sourcelines`). Parsed
+sentences can also be saved in a compact binary format, which loads many
+times faster than *CoNLL-U* text and supports random access by position
+through a :class:`.CorpusReader` (see :mod:`.binary`); :func:`parse_file`
+and :func:`.parse_parallel` can keep them in a :class:`.ParseCache` (see
+:mod:`.cache`), parsing each file only once across many runs.
 
 In more detail, this package provides a lexical analyzer (see :mod:`.lexer`)
 and a parser (see :mod:`.parser`) to transform the raw string input into
-related :class:`colonel.Sentence` objects.
+related :class:`colonel.Sentence` objects. Building them is relatively
+expensive, so the functions of this package keep one :class:`.Parser`
+instance per thread, created on first use and reused afterwards (see
+:mod:`.engines`): the parsing functions can be called concurrently from any
+number of threads, since no parser instance is ever shared among them.
+
+By default, however, the input is processed by the much faster
+:class:`.FastParser` (see :mod:`.fastparser`), which makes use of the
+*PLY*-based parser only for reporting errors; the engine can be selected
+with the ``engine`` argument of the parsing functions (see :data:`.ENGINES`).
 
 Lexer and parser classes are implemented taking advantage of the *PLY
 (Python Lex-Yacc)* library; you can learn more from the
@@ -29,26 +63,430 @@ Lexer and parser classes are implemented taking advantage of the *PLY
 `Lex & Yacc Page <http://dinosaur.compilertools.net/>`_.
 """
 
-from typing import List
+import io
+import os
+from functools import partial
+from importlib import import_module
+from typing import List, Iterator, IO, Union, Tuple, Iterable, Callable, \
+    Optional, Any, TYPE_CHECKING
 from colonel.sentence import Sentence
-from colonel.conllu.parser import ConlluParserBuilder
+from colonel.conllu import zerocopy
+from colonel.conllu.parser import Parser
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.splitter import iter_lines, split_lines, split_text, \
+    split_buffer
+from colonel.conllu.index import SentenceIndex, IndexedReader
+from colonel.conllu.incremental import IncrementalParser
+from colonel.conllu.recovery import ErrorRecord, parse_blocks
+from colonel.conllu.engines import ENGINES, get_parser, enabled_options, \
+    get_parse_function, parse_buffer, parse_path
+
+if TYPE_CHECKING:
+    from colonel.conllu.binary import CorpusReader
+    from colonel.conllu.cache import ParseCache
+    from colonel.conllu.asyncparse import aparse
+    from colonel.conllu.parallel import parse_parallel, \
+        iter_parse_parallel, parse_treebank, iter_parse_treebank
+
+__all__ = ['Parser', 'FastParser', 'SentenceIndex', 'IndexedReader',
+           'CorpusReader', 'ParseCache', 'IncrementalParser', 'ErrorRecord',
+           'ENGINES', 'parse', 'parse_tolerant', 'parse_sentence',
+           'iter_parse', 'aparse',
+           'parse_file', 'parse_parallel', 'iter_parse_parallel',
+           'parse_treebank', 'iter_parse_treebank', 'to_conllu',
+           'write_conllu']
+
+# The names of the submodules providing the names of this package which are
+# imported on first access (see __getattr__ below), since they depend on
+# modules which are slow to import, such as asyncio and multiprocessing, and
+# which are not needed for plain parsing.
+_LAZY_NAMES = {
+    'CorpusReader': 'binary',
+    'ParseCache': 'cache',
+    'aparse': 'asyncparse',
+    'parse_parallel': 'parallel',
+    'iter_parse_parallel': 'parallel',
+    'parse_treebank': 'parallel',
+    'iter_parse_treebank': 'parallel',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the names of this package provided by the submodules listed
+    in :data:`_LAZY_NAMES` on first access.
+
+    :raise AttributeError: if the name is unknown
+    """
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()).union(_LAZY_NAMES))
+
 
+def _get_zero_copy_parser(engine: str, **options: Any) -> FastParser:
+    """Returns the parser instance used by :mod:`.zerocopy` functions for
+    reporting errors, owned by the current thread.
 
-def parse(content: str) -> List[Sentence]:
+    :raise ValueError: if the engine is not based on :class:`.FastParser`,
+        or if any of the other options is enabled
+    """
+    parser = get_parser(engine)
+    enabled = list(enabled_options(**options))
+
+    if not isinstance(parser, FastParser) or enabled:
+        names = ', '.join([f'engine {engine!r}'] + enabled)
+        raise ValueError(f'Zero-copy parsing does not support: {names}')
+
+    return parser
+
+
+def parse(
+        content: Union[str, bytes, bytearray, memoryview],
+        engine: str = 'fast',
+        lazy: bool = False,
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        encoding: str = 'utf-8',
+        zero_copy: bool = False,
+        keep_lines: bool = False
+) -> List[Sentence]:
     """Parses a *CoNLL-U* string content, returning a list of sentences.
 
+    The content can also be given as encoded binary data, which is split
+    into sentence blocks directly in the byte domain: each block is decoded
+    and parsed on its own, so that a decoded copy of the whole content is
+    never held in memory. Error line and column numbers are still reported
+    in characters. The ``encoding`` must be *UTF-8* or any other one where a
+    newline byte always represents a newline character.
+
+    With ``zero_copy`` enabled, binary content is parsed into words and empty
+    nodes whose text fields are read from the content itself on access (see
+    :mod:`.zerocopy`); :class:`bytearray` and :class:`memoryview` content is
+    copied once, so that it can't change afterwards.
+
     :raise lexer.LexerError: (any specific subclass) in case of invalid input
         breaking the rules of the *CoNLL-U* lexer
     :raise parser.ParserError: (any specific subclass) in case of invalid input
         breaking the rules of the *CoNLL-U* parser
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the given options
+    :raise TypeError: if ``zero_copy`` is enabled for string content
 
-    :param content: *CoNLL-U* formatted string to be parsed
+    :param content: *CoNLL-U* formatted string to be parsed, or its encoded
+        binary representation (a :class:`memoryview` must be
+        one-dimensional, with one byte items)
+    :param engine: the name of the parsing engine (see :data:`.ENGINES`)
+    :param lazy: whether or not to return :class:`.LazySentence` objects,
+        building their elements only on first access (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires
+        the ``'fast'`` engine
+    :param fields: the names of the fields of the word lines to process,
+        leaving the attributes related to the other ones as ``None`` (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments, called before processing its word lines
+        (see :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param encoding: the encoding used for decoding binary content
+    :param zero_copy: whether or not to return words and empty nodes backed
+        by the binary content (see :mod:`.zerocopy`); it requires the
+        ``'fast'`` engine, and it can't be combined with the other options,
+        except for ``where``
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires the ``'fast'`` engine
     :return: list of parsed :class:`colonel.Sentence` items
     """
-    return ConlluParserBuilder.build().parse(content)
+    if zero_copy:
+        if isinstance(content, str):
+            raise TypeError('Zero-copy parsing requires binary content')
+        if not isinstance(content, bytes):
+            content = bytes(content)
+        parser = _get_zero_copy_parser(engine, lazy=lazy,
+                                       lazy_fields=lazy_fields,
+                                       fields=fields, keep_lines=keep_lines)
+        return zerocopy.parse_buffer(content, encoding, parser=parser,
+                                     where=where)
+
+    parse_function = get_parse_function(
+        engine, lazy=lazy, lazy_fields=lazy_fields, fields=fields,
+        where=where, keep_lines=keep_lines)
+
+    if isinstance(content, str):
+        return parse_function(content)
+
+    return parse_buffer(content, encoding, parse_function)
+
+
+def parse_tolerant(
+        content: Union[str, bytes, bytearray, memoryview],
+        engine: str = 'fast',
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        encoding: str = 'utf-8',
+        keep_lines: bool = False
+) -> Tuple[List[Sentence], List[ErrorRecord]]:
+    """Parses a *CoNLL-U* content in error-tolerant mode, returning all the
+    valid sentences together with the records of all the errors.
+
+    Instead of stopping at the first error, as :func:`parse` does, each
+    sentence block (see :mod:`.splitter`) is parsed on its own: a block
+    containing invalid input is skipped, and parsing resumes right after
+    the blank line which terminates it. Each error is reported once, as an
+    :class:`.ErrorRecord` with absolute line and column numbers, so that all
+    the problems of a corpus can be collected in a single pass.
+
+    Binary content is handled as described in :func:`parse`; blocks which
+    cannot be decoded are skipped too, and recorded as well.
+
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the given options
+
+    :param content: *CoNLL-U* formatted string to be parsed, or its encoded
+        binary representation
+    :param engine: the name of the parsing engine (see :data:`.ENGINES`)
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires
+        the ``'fast'`` engine
+    :param fields: the names of the fields of the word lines to process,
+        leaving the attributes related to the other ones as ``None`` (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments, called before processing its word lines
+        (see :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param encoding: the encoding used for decoding binary content
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires the ``'fast'`` engine
+    :return: a pair composed by the list of parsed :class:`colonel.Sentence`
+        items, in order, and the list of :class:`.ErrorRecord` items, in
+        order
+    """
+    parse_function = get_parse_function(engine, lazy_fields=lazy_fields,
+                                        fields=fields, where=where,
+                                        keep_lines=keep_lines)
+
+    blocks: Iterable[Tuple[int, Union[str, bytes]]]
+    if not content:
+        blocks = [(1, '')]
+    elif isinstance(content, str):
+        blocks = split_text(content)
+    else:
+        blocks = (
+            (line_number, bytes(content[start:end]))
+            for line_number, start, end in split_buffer(content)
+        )
+
+    errors: List[ErrorRecord] = []
+    sentences = list(parse_blocks(blocks, parse_function, errors, encoding))
+    return sentences, errors
+
+
+def iter_parse(
+        stream: Union[IO[str], IO[bytes]],
+        encoding: str = 'utf-8',
+        engine: str = 'fast',
+        lazy: bool = False,
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        keep_lines: bool = False
+) -> Iterator[Sentence]:
+    """Parses a *CoNLL-U* file object, yielding one sentence at a time.
+
+    The input is read line by line and split at the blank lines terminating
+    each sentence, so that only the lines of the sentence being parsed are
+    kept in memory. Errors report the absolute line and column numbers
+    related to the whole input, the same way as :func:`parse` does.
+
+    Binary streams are decoded using the given ``encoding``. The yielded
+    sentences are the same ones that would be returned by :func:`parse`
+    for the whole content of the stream, including the raising of
+    :class:`.parser.IllegalEofError` for an empty input.
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the given options
+
+    :param stream: a file object opened in text or binary mode
+    :param encoding: the encoding used for decoding binary streams
+    :param engine: the name of the parsing engine (see :data:`.ENGINES`)
+    :param lazy: whether or not to return :class:`.LazySentence` objects,
+        building their elements only on first access (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires
+        the ``'fast'`` engine
+    :param fields: the names of the fields of the word lines to process,
+        leaving the attributes related to the other ones as ``None`` (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments, called before processing its word lines
+        (see :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires the ``'fast'`` engine
+    :return: an iterator of parsed :class:`colonel.Sentence` items
+    """
+    parse_function = get_parse_function(
+        engine, lazy=lazy, lazy_fields=lazy_fields, fields=fields,
+        where=where, keep_lines=keep_lines)
+    empty = True
+
+    for line_number, block in split_lines(iter_lines(stream, encoding)):
+        empty = False
+        yield from parse_function(block, line_number)
+
+    if empty:
+        parse_function('')
 
 
-def to_conllu(sentences: List[Sentence]) -> str:
+def parse_file(
+        path: Union[str, os.PathLike],
+        encoding: str = 'utf-8',
+        engine: str = 'fast',
+        lazy: bool = False,
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        zero_copy: bool = False,
+        keep_lines: bool = False,
+        cache: Optional['ParseCache'] = None
+) -> List[Sentence]:
+    """Parses a *CoNLL-U* file, returning a list of sentences.
+
+    The file is memory-mapped and split into sentence blocks directly within
+    the mapped bytes (see :func:`.splitter.split_buffer`); each block is
+    decoded and parsed on its own, so that neither the whole raw content nor
+    its decoded copy are ever held in memory. Errors report the absolute
+    line and column numbers, the same way as :func:`parse` does.
+
+    The ``encoding`` must be *UTF-8* or any other one where a newline byte
+    always represents a newline character.
+
+    With ``zero_copy`` enabled, words and empty nodes read their text fields
+    from the memory-mapped file on access (see :mod:`.zerocopy`): the file
+    stays mapped as long as any of them is in use, and it must not be
+    modified meanwhile.
+
+    With a ``cache``, the sentences are loaded from it if the file has
+    already been parsed with the same options, or parsed and stored in it
+    otherwise (see :mod:`.cache`).
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the given options, or if a ``cache`` is combined with ``lazy``,
+        ``lazy_fields``, ``where``, ``zero_copy`` or ``keep_lines``
+
+    :param path: the path of the *CoNLL-U* file
+    :param encoding: the encoding of the file
+    :param engine: the name of the parsing engine (see :data:`.ENGINES`)
+    :param lazy: whether or not to return :class:`.LazySentence` objects,
+        building their elements only on first access (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires
+        the ``'fast'`` engine
+    :param fields: the names of the fields of the word lines to process,
+        leaving the attributes related to the other ones as ``None`` (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments, called before processing its word lines
+        (see :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param zero_copy: whether or not to return words and empty nodes backed
+        by the memory-mapped file (see :mod:`.zerocopy`); it requires the
+        ``'fast'`` engine, and it can't be combined with the other options,
+        except for ``where``
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires the ``'fast'`` engine
+    :param cache: the :class:`.ParseCache` storing the parsed sentences,
+        if any
+    :return: list of parsed :class:`colonel.Sentence` items
+    """
+    if fields is not None:
+        fields = tuple(fields)  # used for the cache key and for parsing
+    if cache is not None:
+        return cache.fetch(
+            path, partial(parse_file, path, encoding, engine, fields=fields),
+            encoding, engine, fields, lazy=lazy, lazy_fields=lazy_fields,
+            where=where, zero_copy=zero_copy, keep_lines=keep_lines)
+
+    if zero_copy:
+        parser = _get_zero_copy_parser(engine, lazy=lazy,
+                                       lazy_fields=lazy_fields,
+                                       fields=fields, keep_lines=keep_lines)
+        return zerocopy.parse_file(path, encoding, parser=parser, where=where)
+
+    return parse_path(path, encoding, get_parse_function(
+        engine, lazy=lazy, lazy_fields=lazy_fields, fields=fields,
+        where=where, keep_lines=keep_lines))
+
+
+def parse_sentence(content: str, line_number: int = 1) -> Sentence:
+    """Parses the *CoNLL-U* formatted representation of one sentence,
+    returning it.
+
+    The content must contain exactly one sentence; its terminating blank
+    line, or just the final newline, can be omitted.
+
+    This is meant for parsing one sentence at a time, such as one per
+    request in online services, with the lowest possible latency: valid
+    content is processed line by line, as done by :class:`.FastParser`,
+    without creating any parser object or list of sentences. Invalid
+    content is parsed again by the *PLY*-based :class:`.Parser` of the
+    current thread, created on first use, so that errors report the same
+    positions given by :func:`parse`.
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+    :raise ValueError: if the content is empty, or if it contains more than
+        one sentence
+
+    :param content: *CoNLL-U* formatted string of one sentence
+    :param line_number: the line number of the first line of ``content``,
+        useful when it is a fragment of a larger input, so that errors can
+        still report absolute positions
+    :return: the parsed :class:`colonel.Sentence`
+    """
+    if content.endswith('\n\n'):
+        content = content[:-2]
+    elif content.endswith('\n'):
+        content = content[:-1]
+
+    if not content:
+        raise ValueError('Expected one sentence, found empty content')
+
+    lines = content.split('\n')
+    sentence = None if '' in lines else FastParser.build_sentence(lines)
+
+    if sentence is None:
+        sentences = get_parser('ply').parse(f'{content}\n\n', line_number)
+        if len(sentences) != 1:
+            raise ValueError(f'Expected one sentence, found {len(sentences)}')
+        sentence = sentences[0]
+
+    return sentence
+
+
+def to_conllu(sentences: Iterable[Sentence]) -> str:
     """Serializes a list of sentences to a formatted *CoNLL-U* string.
 
     This method simply concatenates the output of :meth:`.Sentence.to_conllu`
@@ -60,3 +498,59 @@ def to_conllu(sentences: List[Sentence]) -> str:
     :return: a *CoNLL-U* formatted representation of the sentences
     """
     return ''.join(sentence.to_conllu() for sentence in sentences)
+
+
+#: Default number of characters of serialized sentences written at once by
+#: :func:`write_conllu`.
+_WRITE_BUFFER_SIZE = 1 << 16
+
+
+def write_conllu(
+        sentences: Iterable[Sentence],
+        stream: Union[IO[str], IO[bytes]],
+        encoding: str = 'utf-8',
+        buffer_size: int = _WRITE_BUFFER_SIZE
+) -> int:
+    """Serializes sentences to a *CoNLL-U* file object, one batch at a
+    time, returning the number of sentences written.
+
+    Unlike :func:`to_conllu`, the whole output is never held in memory: the
+    sentences, which can be yielded one at a time by any iterable (e.g. by
+    :func:`iter_parse`), are serialized with :meth:`.Sentence.to_conllu`
+    and collected until they reach ``buffer_size`` characters, then written
+    with one call. The same as :func:`to_conllu`, no validity check is
+    performed.
+
+    Binary streams (any :class:`io.RawIOBase` or :class:`io.BufferedIOBase`
+    object, or any file object with a binary ``mode``) are written with the
+    given ``encoding``.
+
+    :param sentences: iterable of :class:`colonel.Sentence` items
+    :param stream: a file object opened in text or binary mode
+    :param encoding: the encoding used for writing to binary streams
+    :param buffer_size: the number of characters of serialized sentences to
+        collect before each write
+    :return: the number of written sentences
+    """
+    binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or \
+        'b' in getattr(stream, 'mode', '')
+    write = stream.write
+    batch: List[str] = []
+    size = 0
+    count = 0
+
+    for count, sentence in enumerate(sentences, 1):
+        text = sentence.to_conllu()
+        batch.append(text)
+        size += len(text)
+        if size >= buffer_size:
+            data = ''.join(batch)
+            write(data.encode(encoding) if binary else data)  # type: ignore
+            batch.clear()
+            size = 0
+
+    if batch:
+        data = ''.join(batch)
+        write(data.encode(encoding) if binary else data)  # type: ignore
+
+    return count
@@ -0,0 +1,166 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the asynchronous parsing of *CoNLL-U* content read from
+:mod:`asyncio` streams.
+
+:func:`aparse` is also available from the :mod:`colonel.conllu` package.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import List, AsyncIterator, Dict, Iterable, Callable, \
+    Optional, Any
+from colonel.sentence import Sentence
+from colonel.conllu.engines import get_parse_function
+
+__all__ = ['aparse']
+
+
+def _parse_binary_chunk(
+        chunk: bytes,
+        line_number: int,
+        encoding: str,
+        engine: str,
+        options: Dict[str, Any]
+) -> List[Sentence]:
+    """Decodes and parses a chunk of encoded *CoNLL-U* content, given the
+    line number of its first line.
+
+    The parser instance owned by the calling thread is used, so that chunks
+    can be parsed concurrently by executors, including the ones running in
+    other processes.
+    """
+    parse_function = get_parse_function(engine, **options)
+    return parse_function(chunk.decode(encoding), line_number)
+
+
+async def aparse(
+        reader: asyncio.StreamReader,
+        encoding: str = 'utf-8',
+        engine: str = 'fast',
+        lazy: bool = False,
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 2 ** 16,
+        executor_threshold: int = 2 ** 16,
+        keep_lines: bool = False
+) -> AsyncIterator[Sentence]:
+    """Parses *CoNLL-U* content read from an :class:`asyncio.StreamReader`,
+    asynchronously yielding one sentence at a time.
+
+    The stream is read in chunks of at most ``chunk_size`` bytes; as soon as
+    the terminating blank line of one or more sentences has been read, those
+    sentences are parsed and yielded, keeping only the unfinished tail of
+    the content in memory. Errors report the absolute line and column
+    numbers related to the whole input, the same way as
+    :func:`colonel.conllu.parse` does, including the raising of
+    :class:`.parser.IllegalEofError` for an empty or truncated input.
+
+    Whenever the completed sentences to parse amount to at least
+    ``executor_threshold`` bytes, the parsing is run by the given
+    ``executor`` (or by the default one of the event loop), so that the
+    event loop stays responsive; smaller amounts are parsed right away, for
+    lower latency. In case of a process-based executor, parsed sentences
+    are pickled back to the event loop process.
+
+    Usage::
+
+        async for sentence in conllu.aparse(reader):
+            ...
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the given options
+
+    :param reader: the stream to read the encoded content from
+    :param encoding: the encoding of the content; it must be *UTF-8* or any
+        other one where a newline byte always represents a newline character
+    :param engine: the name of the parsing engine (see :data:`.ENGINES`)
+    :param lazy: whether or not to return :class:`.LazySentence` objects,
+        building their elements only on first access (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires
+        the ``'fast'`` engine
+    :param fields: the names of the fields of the word lines to process,
+        leaving the attributes related to the other ones as ``None`` (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments, called before processing its word lines
+        (see :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param executor: the :class:`concurrent.futures.Executor` for parsing
+        large amounts of content; ``None`` for the default executor of the
+        event loop
+    :param chunk_size: the maximum number of bytes read at once
+    :param executor_threshold: the minimum number of bytes of completed
+        sentences for parsing them with the executor
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires the ``'fast'`` engine
+    :return: an asynchronous iterator of parsed :class:`colonel.Sentence`
+        items
+    """
+    if fields is not None:
+        fields = tuple(fields)  # used for parsing each chunk
+    options: Dict[str, Any] = {'lazy': lazy, 'lazy_fields': lazy_fields,
+                               'fields': fields, 'where': where,
+                               'keep_lines': keep_lines}
+    get_parse_function(engine, **options)  # early check of the arguments
+
+    loop = asyncio.get_running_loop()
+    buffer = bytearray()
+    line_number = 1
+    empty = True
+
+    while True:
+        chunk = await reader.read(chunk_size)
+        if chunk:
+            # the terminating blank line of the last completed sentence can
+            # only be found within the new chunk, or right before it
+            start = max(len(buffer) - 1, 0)
+            buffer += chunk
+            empty = False
+            end = buffer.rfind(b'\n\n', start)
+            if end < 0:
+                continue
+            end += 2
+        else:
+            end = len(buffer)
+            if end == 0 and not empty:
+                break
+
+        content = bytes(buffer[:end])
+        del buffer[:end]
+
+        arguments = (content, line_number, encoding, engine, options)
+        if len(content) >= executor_threshold:
+            sentences = await loop.run_in_executor(
+                executor, _parse_binary_chunk, *arguments)
+        else:
+            sentences = _parse_binary_chunk(*arguments)
+
+        for sentence in sentences:
+            yield sentence
+
+        if not chunk:
+            break
+
+        line_number += content.count(b'\n')
@@ -0,0 +1,569 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing a compact binary format for parsed sentences, much
+faster to load than *CoNLL-U* text.
+
+Training jobs which read the same treebank again and again can parse it
+once and save the sentences with :func:`save_corpus` (or
+:func:`write_corpus`, for any binary file object); :func:`load_corpus`
+returns them back many times faster than parsing the text, and a
+:class:`CorpusReader` returns single sentences by position from the
+memory-mapped file.
+
+The format is made of fixed-width columns of little-endian integers, so
+that any sentence can be located and decoded on its own:
+
+- the magic bytes ``CLNLBIN1``;
+- twelve 32-bit integers for each element, in order: its kind (word, empty
+  node or multiword token), its one or two indices, ``HEAD``, then the
+  other fields in *CoNLL-U* order (``FORM``, ``LEMMA``, ``UPOS``, ``XPOS``,
+  ``FEATS``, ``DEPREL``, ``DEPS``, ``MISC``); ``UPOS`` is stored as the
+  position of the tag within :class:`colonel.UposTag`, and the other fields
+  as positions within the value table described below;
+- one 32-bit integer for each comment, again a position within the value
+  table;
+- padding up to a multiple of 8 bytes, and two columns of 64-bit integers
+  with the position of the first element and of the first comment of each
+  sentence, each followed by the total count;
+- the value table, containing each distinct text, ``FEATS`` and ``DEPS``
+  value once, ``None`` first; each value is made of a one-byte tag
+  followed by its content: nothing for ``None`` (``N``), a 32-bit length
+  and the *UTF-8* bytes for strings (``s``), a 64-bit integer for integers
+  (``i``), and a 32-bit length followed by the items for tuples (``t``);
+- a footer with the number of sentences, elements, comments and values,
+  the size of the value table, and the magic bytes again.
+
+Since the footer comes last, sentences can be written one at a time, from
+any iterable, to files which don't support seeking. The format doesn't
+depend on the version of Python, and loading never executes any code from
+the file. Words, empty nodes and multiword tokens (including their
+subclasses, such as :class:`.LazyFieldsWord`) are stored with all their
+values, and loaded as :class:`colonel.Word`, :class:`colonel.EmptyNode`
+and :class:`colonel.Multiword` objects; sentences are loaded as
+:class:`colonel.Sentence` objects.
+"""
+
+import gc
+import os
+import struct
+import sys
+from array import array
+from contextlib import ExitStack
+from mmap import mmap, ACCESS_READ
+from typing import List, Iterable, Iterator, Union, Dict, Tuple, IO, Any
+from colonel.emptynode import EmptyNode
+from colonel.multiword import Multiword
+from colonel.sentence import Sentence
+from colonel.upostag import UposTag
+from colonel.word import Word
+
+__all__ = ['InvalidCorpusError', 'write_corpus', 'save_corpus',
+           'load_corpus', 'CorpusReader']
+
+_MAGIC = b'CLNLBIN1'
+
+#: Footer of the files: number of sentences, elements, comments and values,
+#: size of the value table, and magic bytes.
+_FOOTER = struct.Struct('<QQQQQ8s')
+
+# Lengths and integers of the value table.
+_LENGTH = struct.Struct('<I')
+_INTEGER = struct.Struct('<q')
+
+# Tags of the value table.
+_NONE_TAG = ord('N')
+_STR_TAG = ord('s')
+_INT_TAG = ord('i')
+_TUPLE_TAG = ord('t')
+
+# Number of integer columns of each element.
+_COLUMNS = 12
+
+# Element kinds.
+_WORD = 0
+_EMPTY_NODE = 1
+_MULTIWORD = 2
+
+# Integer value standing for None.
+_NONE = -2 ** 31
+
+# Maximum number of element columns buffered by write_corpus().
+_BATCH_SIZE = 2 ** 16 * _COLUMNS
+
+_UPOS_TAGS = (None,) + tuple(UposTag)
+_UPOS_CODES = {tag: code for code, tag in enumerate(_UPOS_TAGS)}
+
+
+class InvalidCorpusError(Exception):
+    """Error raised when reading a file which is not a valid binary corpus.
+    """
+
+
+def _write_column(stream: IO[bytes], column: array) -> None:
+    """Writes a column of integers in little-endian byte order."""
+    if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    stream.write(column.tobytes())
+
+
+def write_corpus(
+        sentences: Iterable[Sentence],
+        stream: IO[bytes]
+) -> int:
+    """Writes sentences in binary format to a binary file object, returning
+    the number of written sentences.
+
+    The sentences, which can be yielded one at a time by any iterable, are
+    written in batches; only the value table, the comments and the
+    positions of each sentence are kept in memory until the end.
+
+    :raise TypeError: if an element is not a :class:`colonel.Word`,
+        :class:`colonel.EmptyNode` or :class:`colonel.Multiword`, or if any
+        value is not hashable
+    :raise ValueError: if any value can't be stored, such as an ``UPOS``
+        value which is not a :class:`colonel.UposTag`, an index out of the
+        range of 32-bit integers, or any other value which is not a string,
+        an integer, ``None`` or a tuple of them
+
+    :param sentences: iterable of :class:`colonel.Sentence` items
+    :param stream: a file object opened in binary mode
+    :return: the number of written sentences
+    """
+    # pylint: disable=too-many-locals
+    values: Dict[Any, int] = {None: 0}
+    table: List[bytes] = [bytes([_NONE_TAG])]
+
+    def value_id(value: Any) -> int:
+        code = values.get(value)
+        if code is None:
+            _encode_value(value, table)
+            code = values[value] = len(values)
+        return code
+
+    rows = array('i')
+    comment_ids = array('i')
+    element_offsets = array('q', [0])
+    comment_offsets = array('q', [0])
+    element_count = 0
+
+    stream.write(_MAGIC)
+
+    for sentence in sentences:
+        for comment in sentence.comments:
+            comment_ids.append(value_id(comment))
+
+        for element in sentence.elements:
+            try:
+                rows.extend(_encode_element(element, value_id))
+            except OverflowError as error:
+                raise ValueError(f'Invalid index value: {error}') from error
+            element_count += 1
+
+        element_offsets.append(element_count)
+        comment_offsets.append(len(comment_ids))
+
+        if len(rows) >= _BATCH_SIZE:
+            _write_column(stream, rows)
+            del rows[:]
+
+    _write_column(stream, rows)
+    _write_column(stream, comment_ids)
+    if len(comment_ids) % 2:
+        stream.write(bytes(4))
+    _write_column(stream, element_offsets)
+    _write_column(stream, comment_offsets)
+
+    table_size = 0
+    for part in table:
+        stream.write(part)
+        table_size += len(part)
+    stream.write(_FOOTER.pack(len(element_offsets) - 1, element_count,
+                              len(comment_ids), len(values), table_size,
+                              _MAGIC))
+
+    return len(element_offsets) - 1
+
+
+def _encode_value(value: Any, parts: List[bytes]) -> None:
+    """Appends the encoded value to the parts of the value table."""
+    value_type = type(value)
+    if value_type is str:
+        data = value.encode('utf-8')
+        parts.extend([bytes([_STR_TAG]), _LENGTH.pack(len(data)), data])
+    elif value is None:
+        parts.append(bytes([_NONE_TAG]))
+    elif value_type is tuple:
+        parts.extend([bytes([_TUPLE_TAG]), _LENGTH.pack(len(value))])
+        for item in value:
+            _encode_value(item, parts)
+    elif value_type is int:
+        try:
+            parts.extend([bytes([_INT_TAG]), _INTEGER.pack(value)])
+        except struct.error as error:
+            raise ValueError(f'Invalid integer value: {error}') from error
+    else:
+        raise ValueError(f'Values of type {value_type.__name__} can\'t be '
+                         f'stored')
+
+
+def _decode_values(
+        buffer: Union[bytes, mmap],
+        start: int,
+        end: int,
+        count: int
+) -> tuple:
+    """Returns the values of the value table within the given range of
+    the buffer.
+
+    :raise InvalidCorpusError: if the value table is not valid
+    """
+    data = buffer[start:end]
+    position = 0
+
+    def decode() -> Any:
+        nonlocal position
+        tag = data[position]
+        position += 1
+
+        if tag == _STR_TAG:
+            (length,) = _LENGTH.unpack_from(data, position)
+            position += _LENGTH.size + length
+            if position > len(data):
+                raise ValueError('truncated string')
+            return data[position - length:position].decode('utf-8')
+        if tag == _TUPLE_TAG:
+            (length,) = _LENGTH.unpack_from(data, position)
+            position += _LENGTH.size
+            return tuple(decode() for _ in range(length))
+        if tag == _INT_TAG:
+            (value,) = _INTEGER.unpack_from(data, position)
+            position += _INTEGER.size
+            return value
+        if tag == _NONE_TAG:
+            return None
+        raise ValueError(f'unknown tag {tag}')
+
+    try:
+        values = tuple(decode() for _ in range(count))
+    except (IndexError, ValueError, struct.error, RecursionError) as error:
+        raise InvalidCorpusError(f'Invalid value table: {error}') from error
+
+    if position != len(data) or not values or values[0] is not None:
+        raise InvalidCorpusError('Invalid value table')
+    return values
+
+
+def _encode_element(element: Any, value_id: Any) -> Tuple[int, ...]:
+    """Returns the integer columns of an element."""
+    if isinstance(element, Multiword):
+        return (_MULTIWORD, _int(element.first_index),
+                _int(element.last_index), _NONE, value_id(element.form),
+                0, 0, 0, 0, 0, 0, value_id(element.misc))
+
+    if isinstance(element, Word):
+        kind, first, second, head = \
+            _WORD, _int(element.index), 0, _int(element.head)
+        deprel = value_id(element.deprel)
+    elif isinstance(element, EmptyNode):
+        kind, first, second, head = _EMPTY_NODE, \
+            _int(element.main_index), _int(element.sub_index), _NONE
+        deprel = 0
+    else:
+        raise TypeError(f'Objects of type {type(element).__name__} can\'t '
+                        f'be stored')
+
+    upos = _UPOS_CODES.get(element.upos)
+    if upos is None:
+        raise ValueError(f'Invalid UPOS value {element.upos!r}')
+
+    return (kind, first, second, head, value_id(element.form),
+            value_id(element.lemma), upos, value_id(element.xpos),
+            value_id(element.feats), deprel, value_id(element.deps),
+            value_id(element.misc))
+
+
+def _int(value: Any) -> int:
+    return _NONE if value is None else value
+
+
+def save_corpus(
+        sentences: Iterable[Sentence],
+        path: Union[str, os.PathLike]
+) -> int:
+    """Writes sentences in binary format to a file (see
+    :func:`write_corpus`), returning the number of written sentences.
+
+    The file is first written under a temporary name and then renamed, so
+    that concurrent readers never see a partially written file.
+
+    :param sentences: iterable of :class:`colonel.Sentence` items
+    :param path: the path of the file
+    :return: the number of written sentences
+    """
+    temp_path = f'{os.fspath(path)}.{os.getpid()}.tmp'
+
+    try:
+        with open(temp_path, 'wb') as file:
+            count = write_corpus(sentences, file)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    os.replace(temp_path, path)
+    return count
+
+
+class _Columns:  # pylint: disable=too-few-public-methods
+    """The columns and the value table of a binary corpus buffer."""
+
+    __slots__ = ('rows', 'comment_ids', 'element_offsets', 'comment_offsets',
+                 'values', '_views')
+
+    def __init__(self, buffer: Union[bytes, mmap], name: str) -> None:
+        size = len(buffer)
+        if size < len(_MAGIC) + _FOOTER.size or \
+                buffer[:len(_MAGIC)] != _MAGIC:
+            raise InvalidCorpusError(f'Invalid corpus file {name}')
+
+        sentence_count, element_count, comment_count, value_count, \
+            table_size, magic = _FOOTER.unpack_from(buffer,
+                                                    size - _FOOTER.size)
+        if magic != _MAGIC:
+            raise InvalidCorpusError(f'Invalid corpus file {name}')
+
+        # The end of each column; the comment column is followed by padding
+        rows_end = len(_MAGIC) + 4 * _COLUMNS * element_count
+        comments_end = rows_end + 4 * comment_count
+        offsets_size = 8 * (sentence_count + 1)
+        element_offsets_end = comments_end + 4 * (comment_count % 2) + \
+            offsets_size
+        comment_offsets_end = element_offsets_end + offsets_size
+        if comment_offsets_end + table_size + _FOOTER.size != size:
+            raise InvalidCorpusError(f'Truncated corpus file {name}')
+
+        self._views: List[memoryview] = []
+        try:
+            self.rows = self._column(buffer, 'i', len(_MAGIC), rows_end)
+            self.comment_ids = self._column(buffer, 'i', rows_end,
+                                            comments_end)
+            self.element_offsets = self._column(
+                buffer, 'q', element_offsets_end - offsets_size,
+                element_offsets_end)
+            self.comment_offsets = self._column(
+                buffer, 'q', comment_offsets_end - offsets_size,
+                comment_offsets_end)
+
+            if self.element_offsets[-1] != element_count or \
+                    self.comment_offsets[-1] != comment_count:
+                raise InvalidCorpusError(f'Invalid corpus file {name}')
+
+            self.values = _decode_values(
+                buffer, comment_offsets_end,
+                comment_offsets_end + table_size, value_count)
+        except BaseException:
+            self.release()
+            raise
+
+    def _column(
+            self,
+            buffer: Union[bytes, mmap],
+            typecode: str,
+            start: int,
+            end: int
+    ) -> Any:
+        """Returns a sequence of integers of the given type, backed by the
+        buffer itself if the byte order of the machine allows it.
+        """
+        if sys.byteorder == 'big':
+            column = array(typecode, buffer[start:end])
+            column.byteswap()
+            return column
+        if not self._views:
+            self._views.append(memoryview(buffer))
+        view = self._views[0][start:end].cast(typecode)  # type: ignore
+        self._views.append(view)
+        return view
+
+    def release(self) -> None:
+        """Releases the views of the buffer."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+
+    def sentences(self, start: int, stop: int) -> Iterator[Sentence]:
+        """Yields the sentences within the given range of positions."""
+        # pylint: disable=too-many-locals
+        new = object.__new__
+        values = self.values
+        upos_tags = _UPOS_TAGS
+        element_offsets = self.element_offsets
+        comment_offsets = self.comment_offsets
+        comment_ids = self.comment_ids
+
+        element: Any
+        position = element_offsets[start]
+        row_iterator = iter(self.rows[position * _COLUMNS:
+                                      element_offsets[stop] * _COLUMNS]
+                            .tolist())
+        rows = zip(*[row_iterator] * _COLUMNS)
+
+        for number in range(start, stop):
+            try:
+                comments = [values[code] for code in comment_ids[
+                    comment_offsets[number]:comment_offsets[number + 1]]]
+                elements: List[Any] = []
+                append = elements.append
+                end = element_offsets[number + 1]
+
+                while position < end:
+                    kind, first, second, head, form, lemma, upos, xpos, \
+                        feats, deprel, deps, misc = next(rows)
+                    position += 1
+
+                    # Slots are filled directly, as FastParser does
+                    if kind == _WORD:
+                        element = new(Word)
+                        element.index = None if first == _NONE else first
+                        element.head = None if head == _NONE else head
+                        element.deprel = values[deprel]
+                    elif kind == _EMPTY_NODE:
+                        element = new(EmptyNode)
+                        element.main_index = \
+                            None if first == _NONE else first
+                        element.sub_index = \
+                            None if second == _NONE else second
+                    else:
+                        element = new(Multiword)
+                        element.first_index = \
+                            None if first == _NONE else first
+                        element.last_index = \
+                            None if second == _NONE else second
+                        element.form = values[form]
+                        element.misc = values[misc]
+                        append(element)
+                        continue
+
+                    element.form = values[form]
+                    element.lemma = values[lemma]
+                    element.upos = upos_tags[upos]
+                    element.xpos = values[xpos]
+                    element.feats = values[feats]
+                    element.deps = values[deps]
+                    element.misc = values[misc]
+                    append(element)
+            except (StopIteration, IndexError) as error:
+                raise InvalidCorpusError(
+                    f'Invalid data of sentence {number}') from error
+
+            yield Sentence(elements, comments)
+
+
+def load_corpus(path: Union[str, os.PathLike]) -> List[Sentence]:
+    """Reads all the sentences from a binary corpus file (see
+    :func:`save_corpus`).
+
+    The cyclic garbage collector is paused meanwhile, as done by
+    :func:`.packing.loads_sentences`.
+
+    :raise InvalidCorpusError: if the file is not a valid binary corpus
+
+    :param path: the path of the file
+    :return: list of :class:`colonel.Sentence` items
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    columns = _Columns(data, os.fspath(path))
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return list(columns.sentences(0, len(columns.element_offsets) - 1))
+    finally:
+        if enabled:
+            gc.enable()
+        columns.release()
+
+
+class CorpusReader:
+    """Random access reader of the sentences of a binary corpus file (see
+    :func:`save_corpus`).
+
+    Sentences are returned by position, like items of a read-only sequence
+    (``reader[i]``, ``reader[i:j]``), or many at once with :meth:`take`,
+    decoding only the related rows of the memory-mapped file; only the
+    value table is loaded up front. Each request returns new objects.
+
+    The instances of this class should be closed after use, either with
+    :meth:`close` or using them as context managers.
+
+    :raise InvalidCorpusError: if the file is not a valid binary corpus
+
+    :param path: the path of the file
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        with ExitStack() as stack:
+            file = stack.enter_context(open(path, 'rb'))
+            if not os.fstat(file.fileno()).st_size:
+                raise InvalidCorpusError(f'Invalid corpus file {path}')
+            buffer = stack.enter_context(
+                mmap(file.fileno(), 0, access=ACCESS_READ))
+            self._columns = _Columns(buffer, os.fspath(path))
+            # The file and the buffer stay open until close()
+            self._resources = stack.pop_all()
+
+    def __len__(self) -> int:
+        return len(self._columns.element_offsets) - 1
+
+    def __getitem__(
+            self,
+            key: Union[int, slice]
+    ) -> Union[Sentence, List[Sentence]]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return list(self._columns.sentences(start, max(start, stop)))
+            return self.take(range(start, stop, step))
+        return self._get(key)
+
+    def __iter__(self) -> Iterator[Sentence]:
+        return self._columns.sentences(0, len(self))
+
+    def take(self, indices: Iterable[int]) -> List[Sentence]:
+        """Returns the sentences at the given positions, in the same order.
+
+        :raise IndexError: if any position is out of range
+        """
+        return [self._get(position) for position in indices]
+
+    def _get(self, position: int) -> Sentence:
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError('sentence index out of range')
+        return next(self._columns.sentences(position, position + 1))
+
+    def close(self) -> None:
+        """Releases the memory-mapped file."""
+        self._columns.release()
+        self._resources.close()
+
+    def __enter__(self) -> 'CorpusReader':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
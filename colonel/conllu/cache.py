@@ -0,0 +1,248 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing an on-disk cache of parsed *CoNLL-U* files.
+
+Jobs which parse the same files again and again can pass a
+:class:`ParseCache` to :func:`colonel.conllu.parse_file` or
+:func:`colonel.conllu.parse_parallel` (``cache`` argument): the sentences
+of each file are parsed only the first time, and saved in the binary format
+of :mod:`.binary`; later calls load them from the cache, skipping lexing
+and parsing entirely.
+
+Each entry is identified by the version of this library, the encoding and
+the processed fields, together with either the path, size and modification
+time of the file, or, with ``hash_content`` enabled, the *SHA-256* hash of
+its content, so that entries stay valid when files are moved or copied.
+
+Entries are written under temporary names and then renamed, so that many
+processes can share the same cache directory: readers never see partially
+written entries, and concurrent writers of the same entry just replace
+each other's identical content. Each hit refreshes the modification time of
+its entry; when the total size of the entries exceeds the given maximum,
+the least recently used ones are removed.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from functools import partial
+from typing import List, Iterable, Optional, Union, Callable, Any
+from colonel._version import __version__
+from colonel.conllu.binary import write_corpus, load_corpus, \
+    InvalidCorpusError
+from colonel.conllu.engines import enabled_options, get_parse_function
+from colonel.sentence import Sentence
+
+__all__ = ['ParseCache']
+
+_SUFFIX = '.bin'
+_TEMP_SUFFIX = '.tmp'
+
+# Age in seconds after which temporary files are considered left over by
+# crashed processes, and removed.
+_TEMP_MAX_AGE = 3600
+
+# Size of the blocks read for hashing file contents.
+_HASH_BLOCK_SIZE = 2 ** 20
+
+
+class ParseCache:
+    """On-disk cache of the sentences parsed from *CoNLL-U* files, stored
+    in the given directory, which is created if missing.
+
+    :param directory: the path of the cache directory
+    :param max_size: the maximum total size of the entries, in bytes, or
+        ``None`` for no limit
+    :param hash_content: whether or not to identify files by the hash of
+        their content, instead of their path, size and modification time
+    """
+
+    def __init__(
+            self,
+            directory: Union[str, os.PathLike],
+            max_size: Optional[int] = 2 ** 30,
+            hash_content: bool = False
+    ) -> None:
+        #: The path of the cache directory.
+        self.directory: str = os.fspath(directory)
+
+        #: The maximum total size of the entries, in bytes, or ``None``.
+        self.max_size: Optional[int] = max_size
+
+        #: Whether or not files are identified by the hash of their content.
+        self.hash_content: bool = hash_content
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(
+            self,
+            path: Union[str, os.PathLike],
+            encoding: str = 'utf-8',
+            fields: Optional[Iterable[str]] = None
+    ) -> str:
+        """Returns the key of the entry related to a file parsed with the
+        given options.
+
+        The key should be computed before parsing the file, so that an
+        entry stored while the file is being changed never matches its new
+        content.
+        """
+        digest = hashlib.sha256()
+        # no field name is "*", so all the fields never share the key of
+        # an explicit selection, including the empty one
+        fields_id = '*' if fields is None else ','.join(sorted(fields))
+        digest.update(f'{__version__}\0{encoding}\0{fields_id}\0'
+                      .encode('utf-8'))
+
+        if self.hash_content:
+            with open(path, 'rb') as file:
+                for block in iter(partial(file.read, _HASH_BLOCK_SIZE), b''):
+                    digest.update(block)
+        else:
+            stat = os.stat(path)
+            digest.update(f'{os.path.abspath(path)}\0{stat.st_size}\0'
+                          f'{stat.st_mtime_ns}'.encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[List[Sentence]]:
+        """Returns the sentences of the entry with the given key, or
+        ``None`` if it is missing; invalid entries are removed.
+        """
+        path = self._entry_path(key)
+        try:
+            sentences = load_corpus(path)
+        except FileNotFoundError:
+            return None
+        except InvalidCorpusError:
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # evicted meanwhile
+        return sentences
+
+    def store(self, key: str, sentences: Iterable[Sentence]) -> None:
+        """Stores the sentences in the entry with the given key, then
+        removes the least recently used entries, if the maximum size is
+        exceeded.
+        """
+        descriptor, temp_path = tempfile.mkstemp(
+            suffix=_TEMP_SUFFIX, dir=self.directory)
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                write_corpus(sentences, file)
+            os.replace(temp_path, self._entry_path(key))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+        if self.max_size is not None:
+            self.evict(self.max_size)
+
+    def fetch(
+            self,
+            path: Union[str, os.PathLike],
+            parse_function: Callable[[], List[Sentence]],
+            encoding: str = 'utf-8',
+            engine: str = 'fast',
+            fields: Optional[Iterable[str]] = None,
+            **options: Any
+    ) -> List[Sentence]:
+        """Returns the sentences of a *CoNLL-U* file parsed with the given
+        options, loading them from the cache, or calling the parse function
+        and storing its result on a miss.
+
+        Options set to ``False`` or ``None`` are ignored, as done by
+        :func:`.engines.get_parse_function`.
+
+        :raise ValueError: if the engine is unknown, or if it does not
+            support the fields, or if any of the other options is enabled,
+            since their results can't be stored in the cache
+        """
+        enabled = enabled_options(**options)
+        if enabled:
+            names = ', '.join(enabled)
+            raise ValueError(f'Cached parsing does not support: {names}')
+        if fields is not None:
+            fields = tuple(fields)  # used for the key and for the check
+        get_parse_function(engine, fields=fields)  # early check
+
+        # the key is computed first, so that changes made to the file while
+        # it is being parsed never go unnoticed
+        key = self.key(path, encoding, fields)
+        sentences = self.load(key)
+        if sentences is None:
+            sentences = parse_function()
+            self.store(key, sentences)
+        return sentences
+
+    def evict(self, max_size: int) -> None:
+        """Removes the least recently used entries until their total size
+        does not exceed the given one, together with temporary files left
+        over by crashed processes.
+        """
+        entries = []
+        now = time.time()
+
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # removed meanwhile
+                if entry.name.endswith(_SUFFIX):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                elif entry.name.endswith(_TEMP_SUFFIX) and \
+                        now - stat.st_mtime > _TEMP_MAX_AGE:
+                    self._remove(entry.path)
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Removes all the entries."""
+        self.evict(0)
+
+    @property
+    def size(self) -> int:
+        """The total size of the entries, in bytes."""
+        total_size = 0
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(_SUFFIX):
+                    try:
+                        total_size += entry.stat().st_size
+                    except OSError:
+                        pass  # removed meanwhile
+        return total_size
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # already removed, or still open on some systems
@@ -0,0 +1,154 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the parsing engines and the parser instances shared by
+the parsing functions of :mod:`colonel.conllu` and of its submodules.
+
+Parser instances are relatively expensive to build, and they are not
+thread-safe, so :func:`get_parser` keeps one instance per engine and per
+thread, created on first use and reused afterwards.
+"""
+
+import os
+import threading
+from functools import partial
+from mmap import mmap, ACCESS_READ
+from typing import List, Union, Dict, Type, Callable, Optional, Any
+from colonel.sentence import Sentence
+from colonel.conllu.parser import Parser
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.splitter import split_buffer
+
+__all__ = ['ENGINES', 'get_parser', 'enabled_options', 'get_parse_function',
+           'parse_buffer', 'parse_path']
+
+#: The available parsing engines, by name.
+#:
+#: Both engines return the same sentences and raise the same errors, however
+#: the ``'fast'`` engine (see :class:`.FastParser`) is several times faster,
+#: switching to the ``'ply'`` one (see :class:`.Parser`) only for
+#: reporting errors.
+ENGINES: Dict[str, Type[Union[FastParser, Parser]]] = {
+    'fast': FastParser,
+    'ply': Parser,
+}
+
+# Parser instances are not thread-safe, so each thread owns its instances,
+# stored by engine name in the "parsers" attribute.
+_THREAD_LOCAL = threading.local()
+
+
+def get_parser(engine: str = 'fast') -> Union[FastParser, Parser]:
+    """Returns the parser instance for the given engine owned by the
+    current thread, creating it on first use.
+
+    :raise ValueError: if the engine is unknown
+
+    :param engine: the name of the parsing engine (see :data:`ENGINES`)
+    :return: a :class:`.FastParser` or :class:`.Parser` instance
+    """
+    try:
+        parsers: Dict[str, Union[FastParser, Parser]] = _THREAD_LOCAL.parsers
+    except AttributeError:
+        parsers = _THREAD_LOCAL.parsers = {}
+
+    parser = parsers.get(engine)
+    if parser is None:
+        if engine not in ENGINES:
+            raise ValueError(f'Unknown parsing engine {engine!r}')
+        parser = parsers[engine] = ENGINES[engine]()
+    return parser
+
+
+def enabled_options(**options: Any) -> Dict[str, Any]:
+    """Returns the given options which are enabled, that is, the ones not
+    set to ``False`` or ``None``.
+    """
+    return {name: value for name, value in options.items()
+            if value is not None and value is not False}
+
+
+def get_parse_function(
+        engine: str = 'fast',
+        parser: Optional[Union[FastParser, Parser]] = None,
+        **options: Any
+) -> Callable[..., List[Sentence]]:
+    """Returns a function parsing a *CoNLL-U* string content, and optionally
+    the line number of its first line, with the given parser instance of
+    the given engine (by default, the one owned by the current thread) and
+    the given options.
+
+    Options set to ``False`` or ``None`` are disabled, and are ignored;
+    only the ``'fast'`` engine supports enabled options (see
+    :meth:`.FastParser.parse`). The ``fields`` iterable, if any, is
+    materialized, since the function is called once per sentence block.
+
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the options
+    """
+    if parser is None:
+        parser = get_parser(engine)
+    enabled = enabled_options(**options)
+
+    if not enabled:
+        return parser.parse
+
+    if not isinstance(parser, FastParser):
+        names = ', '.join(enabled)
+        raise ValueError(f'Parsing engine {engine!r} does not support: '
+                         f'{names}')
+
+    if 'fields' in enabled:
+        enabled['fields'] = tuple(enabled['fields'])
+    return partial(parser.parse, **enabled)
+
+
+def parse_buffer(
+        buffer: Union[bytes, bytearray, memoryview, mmap],
+        encoding: str,
+        parse_function: Callable[..., List[Sentence]],
+        line_number: int = 1
+) -> List[Sentence]:
+    """Parses an encoded *CoNLL-U* binary buffer, decoding and parsing one
+    sentence block at a time (see :func:`.splitter.split_buffer`), given
+    the line number of its first line.
+    """
+    if not buffer:
+        return parse_function('')
+
+    sentences: List[Sentence] = []
+
+    for line_number, start, end in split_buffer(buffer, line_number):
+        content = str(buffer[start:end], encoding)
+        sentences.extend(parse_function(content, line_number))
+
+    return sentences
+
+
+def parse_path(
+        path: Union[str, os.PathLike],
+        encoding: str,
+        parse_function: Callable[..., List[Sentence]]
+) -> List[Sentence]:
+    """Parses a *CoNLL-U* file with :func:`parse_buffer`, memory-mapping
+    it for the time being.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # an empty file can't be memory-mapped
+            return parse_function('')
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+            return parse_buffer(buffer, encoding, parse_function)
@@ -0,0 +1,618 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the :class:`.FastParser` class.
+
+The *PLY*-based :class:`.Parser` creates a :class:`.LexToken` for each field
+and separator of every word line, switching among many lexer states and
+dispatching each token through the *LALR* tables. The same result can be
+obtained much faster processing the input one line at a time, simply
+splitting each word line at tab characters and validating each field on its
+own, which is what :class:`FastParser` does.
+
+The fields are validated with the same patterns defined by
+:class:`.ConlluLexerBuilder`, or with equivalent plain string checks for the
+simplest of them. Whenever a sentence breaks any rule, the *PLY*-based
+:class:`.Parser` is run on that sentence, so that the raised error is exactly
+the same one, with the same line and column numbers.
+
+Jobs which need only a few fields of each word line can ask the parser to
+process just those ones (see the ``fields`` argument of
+:meth:`FastParser.parse`): the values of the other fields are replaced with
+``_`` before validation, so that they are neither checked nor converted,
+and the related attributes are left as ``None``.
+
+Similarly, a predicate on the comments of each sentence can be given (see
+the ``where`` argument of :meth:`FastParser.parse`): the comment lines at
+the beginning of each sentence block are read first, and the word lines of
+the rejected sentences are never processed at all.
+"""
+
+import re
+from functools import partial
+from typing import List, Optional, Dict, Callable, Pattern, Any, \
+    Iterable, Tuple, FrozenSet, Type
+from colonel.base_sentence_element import BaseSentenceElement
+from colonel.base_rich_sentence_element import BaseRichSentenceElement
+from colonel.conllu.lexer import ConlluLexerBuilder
+from colonel.conllu.lazyfields import LazyFieldsWord, LazyFieldsEmptyNode
+from colonel.conllu.lazysentence import LazySentence
+from colonel.conllu import lexer, sourcelines
+from colonel.conllu.parser import Parser
+from colonel.sentence import Sentence
+from colonel.word import Word
+from colonel.emptynode import EmptyNode
+from colonel.multiword import Multiword
+from colonel.upostag import UposTag
+
+__all__ = ['FastParser', 'FIELDS']
+
+#: Pattern for the ID field, matching the alternative ID patterns in the same
+#: order as the *PLY* lexer does.
+_ID = re.compile(
+    f'(?P<range>{ConlluLexerBuilder.RANGE_ID_PATTERN})|'
+    f'(?P<decimal>{ConlluLexerBuilder.DECIMAL_ID_PATTERN})|'
+    f'(?P<integer>{ConlluLexerBuilder.INTEGER_ID_PATTERN})',
+    re.VERBOSE
+)
+
+#: Pattern for the HEAD field.
+_HEAD = re.compile(ConlluLexerBuilder.HEAD_PATTERN, re.VERBOSE)
+
+#: Pattern for the FEATS field.
+_FEATS = re.compile(ConlluLexerBuilder.FEATS_PATTERN, re.VERBOSE)
+
+#: Pattern for the DEPS field.
+_DEPS = re.compile(ConlluLexerBuilder.DEPS_PATTERN, re.VERBOSE)
+
+#: Mapping of the valid values of the UPOS field.
+_UPOS = {tag.name: tag for tag in UposTag}
+
+#: Maximum number of entries of each cache of decoded field values.
+_CACHE_SIZE = 4096
+
+
+def _cached_decoder(
+        pattern: Pattern,
+        decode: Callable[[str], Any]
+) -> Callable[[str], Optional[Any]]:
+    """Returns a function which validates a field value against the given
+    pattern, as the *PLY* lexer does, returning the result of ``decode`` for
+    valid values, or ``None`` otherwise.
+
+    The same values occur again and again in a treebank, and the decoded
+    ones are immutable, so the results are kept in a bounded cache and
+    shared among elements.
+    """
+    cache: Dict[str, Any] = {}
+
+    def decoder(value: str) -> Optional[Any]:
+        try:
+            return cache[value]
+        except KeyError:
+            pass
+        match = pattern.match(value)
+        if match is None or match.end() != len(value):
+            return None
+        if len(cache) >= _CACHE_SIZE:
+            cache.clear()
+        result = cache[value] = decode(value)
+        return result
+
+    return decoder
+
+
+_decode_feats = _cached_decoder(_FEATS, lexer.decode_feats)
+_decode_deps = _cached_decoder(_DEPS, lexer.decode_deps)
+
+# Validation only, for keeping the raw values (see :mod:`.lazyfields`)
+_validate_feats = _cached_decoder(_FEATS, str)
+_validate_deps = _cached_decoder(_DEPS, str)
+
+
+_new = object.__new__
+
+
+def _word_builder(cls: Type[Word]) -> Callable[..., Word]:
+    """Returns a function creating a new word of the given class, filling
+    its slots directly: the chain of keyword arguments through the
+    constructors of its base classes costs several times more than the
+    assignments themselves.
+    """
+    def new_word(
+            index: Optional[int],
+            form: str,
+            lemma: str,
+            upos: Optional[UposTag],
+            xpos: Optional[str],
+            feats: Optional[Any],
+            head: Optional[int],
+            deprel: Optional[str],
+            deps: Optional[Any],
+            misc: Optional[str]
+    ) -> Word:
+        # pylint: disable=too-many-arguments
+        word = _new(cls)
+        word.index = index
+        word.form = form
+        word.lemma = lemma
+        word.upos = upos
+        word.xpos = xpos
+        word.feats = feats
+        word.head = head
+        word.deprel = deprel
+        word.deps = deps
+        word.misc = misc
+        return word
+    return new_word
+
+
+def _empty_node_builder(cls: Type[EmptyNode]) -> Callable[..., EmptyNode]:
+    """Returns a function creating a new empty node of the given class, as
+    :func:`_word_builder` does.
+    """
+    def new_empty_node(
+            main_index: Optional[int],
+            sub_index: Optional[int],
+            form: str,
+            lemma: str,
+            upos: Optional[UposTag],
+            xpos: Optional[str],
+            feats: Optional[Any],
+            deps: Optional[Any],
+            misc: Optional[str]
+    ) -> EmptyNode:
+        # pylint: disable=too-many-arguments
+        node = _new(cls)
+        node.main_index = main_index
+        node.sub_index = sub_index
+        node.form = form
+        node.lemma = lemma
+        node.upos = upos
+        node.xpos = xpos
+        node.feats = feats
+        node.deps = deps
+        node.misc = misc
+        return node
+    return new_empty_node
+
+
+#: Functions decoding FEATS and DEPS, and functions creating words, empty
+#: nodes and multiword tokens, as used by :meth:`FastParser.build_sentence`
+_BUILDERS = (_decode_feats, _decode_deps, _word_builder(Word),
+             _empty_node_builder(EmptyNode), Multiword)
+
+#: The same as :data:`_BUILDERS`, for the ``lazy_fields`` mode
+_LAZY_FIELDS_BUILDERS = (_validate_feats, _validate_deps, LazyFieldsWord,
+                         LazyFieldsEmptyNode, Multiword)
+
+#: The same as :data:`_BUILDERS`, for the ``keep_lines`` mode
+_KEEP_LINES_BUILDERS = (_decode_feats, _decode_deps,
+                        _word_builder(sourcelines.NewWord),
+                        _empty_node_builder(sourcelines.NewEmptyNode),
+                        sourcelines.NewMultiword)
+
+
+#: The names of the fields of a word line which can be selected with the
+#: ``fields`` argument of :meth:`FastParser.parse`, in column order; the ID
+#: field is always processed.
+FIELDS = ('form', 'lemma', 'upos', 'xpos', 'feats', 'head', 'deprel', 'deps',
+          'misc')
+
+# Projections already built by _get_projection, by requested fields.
+_PROJECTIONS: Dict[FrozenSet[str], Tuple[int, ...]] = {}
+
+
+def _get_projection(fields: Iterable[str]) -> Tuple[int, ...]:
+    """Returns the column indices of the fields which are not among the
+    given ones (see :data:`FIELDS`), whose names are case-insensitive.
+
+    :raise ValueError: if any field name is unknown
+    """
+    requested = frozenset(name.lower() for name in fields)
+    projection = _PROJECTIONS.get(requested)
+    if projection is None:
+        unknown = requested.difference(FIELDS, ('id',))
+        if unknown:
+            names = ', '.join(sorted(unknown))
+            raise ValueError(f'Unknown fields: {names}')
+        projection = _PROJECTIONS[requested] = tuple(
+            column for column, name in enumerate(FIELDS, 1)
+            if name not in requested)
+    return projection
+
+
+def _is_value(value: str) -> bool:
+    """Returns whether or not a field value for XPOS, DEPREL or MISC is valid.
+
+    It is equivalent to the ``[^\\n\\t ]+`` pattern of the lexer, given that
+    a field never contains newline or tab characters.
+    """
+    return value != '' and ' ' not in value
+
+
+class FastParser:  # pylint: disable=too-few-public-methods
+    """*CoNLL-U* parser processing the input one line at a time, without
+    making use of *PLY* in case of valid input.
+
+    It provides the same interface of :class:`.Parser` and returns the same
+    sentences, elements and values. In case of invalid input, the failing
+    sentence is processed again by a :class:`.Parser` instance, created on
+    first use, so that exactly the same errors are raised.
+
+    The instances of this class are not thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._parser: Optional[Parser] = None
+
+    def parse(
+            self,
+            content: str,
+            line_number: int = 1,
+            lazy: bool = False,
+            lazy_fields: bool = False,
+            fields: Optional[Iterable[str]] = None,
+            where: Optional[Callable[[List[str]], bool]] = None,
+            keep_lines: bool = False
+    ) -> List[Sentence]:
+        """Parses a *CoNLL-U* string content, returning a list of sentences.
+
+        In *lazy* mode, only the comments of each sentence are extracted, and
+        :class:`.LazySentence` objects are returned, keeping the original
+        text and building their elements only on first access; errors
+        related to the word lines are raised only at that time.
+
+        With ``lazy_fields`` enabled, words and empty nodes are returned as
+        :class:`.LazyFieldsWord` and :class:`.LazyFieldsEmptyNode` objects,
+        which keep the validated ``FEATS`` and ``DEPS`` values as raw
+        strings, decoding them only on first access.
+
+        When ``fields`` are given, only those fields of each word line are
+        validated and converted; the other ones are only required to be
+        there, so that each line still has ten fields and a valid ID, and
+        the related attributes are set to ``None``. Serializing such
+        elements writes ``_`` for all the missing values.
+
+        When ``where`` is given, it is called with the list of comments of
+        each sentence, in order, before processing its word lines: the
+        sentences for which it returns a false value are skipped, without
+        even splitting their word lines, and no error is raised for any
+        invalid word line of theirs. Since it is called once per sentence,
+        in order, it can keep track of the comments of previous sentences,
+        such as ``newdoc`` ones.
+
+        With ``keep_lines`` enabled, all the elements are returned as
+        :class:`.SourceLineWord`, :class:`.SourceLineEmptyNode` and
+        :class:`.SourceLineMultiword` objects, which keep their original
+        line and serialize it back verbatim until any of their attributes is
+        changed. It can't be combined with ``lazy_fields`` nor ``fields``,
+        since the line already holds the raw values of all the fields.
+
+        :raise lexer.LexerError: (any specific subclass) in case of invalid
+            input breaking the rules of the *CoNLL-U* lexer
+        :raise parser.ParserError: (any specific subclass) in case of invalid
+            input breaking the rules of the *CoNLL-U* parser
+        :raise ValueError: if any of the ``fields`` is unknown, or if
+            ``keep_lines`` is combined with ``lazy_fields`` or ``fields``
+
+        :param content: *CoNLL-U* formatted string to be parsed
+        :param line_number: the line number of the first line of ``content``,
+            useful when it is a fragment of a larger input, so that errors
+            can still report absolute positions
+        :param lazy: whether or not to return :class:`.LazySentence` objects
+        :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+            values only on first access
+        :param fields: the names of the fields to process (see
+            :data:`FIELDS`), case-insensitive; by default, all of them
+        :param where: a function returning whether or not a sentence should
+            be parsed, given its comments (see :attr:`.Sentence.comments`)
+        :param keep_lines: whether or not to keep the original line of each
+            element, for serializing it back verbatim (see
+            :mod:`.sourcelines`)
+        :return: list of parsed :class:`colonel.Sentence` items
+        """
+        if keep_lines and (lazy_fields or fields is not None):
+            raise ValueError('The keep_lines option can\'t be combined with '
+                             'lazy_fields or fields')
+
+        if lazy or where is not None:
+            return self._parse_blocks(content, line_number, lazy, lazy_fields,
+                                      fields, where, keep_lines)
+
+        builders: tuple
+        if keep_lines:
+            builders = _KEEP_LINES_BUILDERS
+        elif lazy_fields:
+            builders = _LAZY_FIELDS_BUILDERS
+        else:
+            builders = _BUILDERS
+        skipped = () if fields is None else _get_projection(fields)
+
+        lines = content.split('\n')
+        tail = lines.pop()  # the text following the last newline, if any
+        sentences: List[Sentence] = []
+        start = 0
+
+        while True:
+            try:
+                end = lines.index('', start)
+            except ValueError:
+                break
+
+            sentence = self.build_sentence(lines[start:end], builders,
+                                           skipped, keep_lines)
+
+            if sentence is None:
+                sentences.extend(self._fallback(
+                    '\n'.join(lines[start:end + 1]) + '\n',
+                    line_number + start
+                ))
+            else:
+                sentences.append(sentence)
+
+            start = end + 1
+
+        if start < len(lines) or tail or not content:
+            lines.append(tail)
+            sentences.extend(self._fallback(
+                '\n'.join(lines[start:]), line_number + start))
+
+        return sentences
+
+    def _parse_blocks(
+            self,
+            content: str,
+            line_number: int,
+            lazy: bool,
+            lazy_fields: bool,
+            fields: Optional[Iterable[str]] = None,
+            where: Optional[Callable[[List[str]], bool]] = None,
+            keep_lines: bool = False
+    ) -> List[Sentence]:
+        """Parses a *CoNLL-U* string content one sentence block at a time,
+        extracting the comments of each sentence first, returning a list of
+        sentences.
+
+        Each sentence block is only checked for being composed by comment
+        lines followed by at least one word line; the blocks rejected by
+        ``where`` are skipped, and the other ones are either turned into
+        :class:`.LazySentence` objects, in *lazy* mode, or parsed.
+        """
+        if fields is not None:
+            fields = tuple(fields)
+            _get_projection(fields)  # early check of the field names
+        parse = partial(self.parse, lazy=False, lazy_fields=lazy_fields,
+                        fields=fields, keep_lines=keep_lines)
+        options = {'lazy_fields': lazy_fields, 'fields': fields,
+                   'keep_lines': keep_lines}
+        sentences: List[Sentence] = []
+        position = 0
+        size = len(content)
+
+        while position < size:
+            end = content.find('\n\n', position)
+            if end < 0 or content[position] == '\n':
+                break  # the fallback below is expected to raise an error
+            end += 2
+
+            comments: List[str] = []
+            start = position
+            while content[start] == '#':
+                newline = content.index('\n', start)
+                comments.append(content[start + 1:newline].strip())
+                start = newline + 1
+
+            if content[start] == '\n' or content.find('\n#', start, end) >= 0:
+                break
+
+            block = content[position:end]
+            if where is None or where(comments):
+                if lazy:
+                    sentences.append(
+                        LazySentence(block, line_number, comments, options))
+                else:
+                    sentences.extend(parse(block, line_number))
+            line_number += block.count('\n')
+            position = end
+
+        if position < size or not content:
+            sentences.extend(
+                self._fallback(content[position:], line_number))
+
+        return sentences
+
+    def _fallback(self, content: str, line_number: int) -> List[Sentence]:
+        """Parses the given content with the *PLY*-based :class:`.Parser`.
+
+        This is expected to raise the error related to the content which
+        could not be parsed by :class:`FastParser`.
+        """
+        if self._parser is None:
+            self._parser = Parser()
+        return self._parser.parse(content, line_number)
+
+    @classmethod
+    def build_sentence(
+            cls,
+            lines: List[str],
+            builders: tuple = _BUILDERS,
+            skipped: Tuple[int, ...] = (),
+            keep_lines: bool = False
+    ) -> Optional[Sentence]:
+        """Returns a new sentence from the given comment and word lines,
+        without the terminating blank line, or ``None`` in case of invalid
+        input.
+
+        The ``builders`` are the functions validating ``FEATS`` and ``DEPS``
+        values and the functions creating words, empty nodes and multiword
+        tokens (see :data:`_BUILDERS`).
+
+        The fields at the ``skipped`` column indices (see
+        :func:`_get_projection`) are neither validated nor converted.
+
+        With ``keep_lines``, each element, created by the builders of
+        :data:`_KEEP_LINES_BUILDERS`, is given its original line.
+        """
+        comments: List[str] = []
+        elements: List[BaseSentenceElement] = []
+
+        for line in lines:
+            if line[0] == '#':
+                if elements:
+                    return None
+                comments.append(line[1:].strip())
+            else:
+                element = cls._build_element(line, builders, skipped)
+                if element is None:
+                    return None
+                if keep_lines:
+                    sourcelines.set_line(element, line)
+                elements.append(element)
+
+        if not elements:
+            return None
+
+        # "_" is a legitimate FORM or LEMMA value, so it is kept as it is
+        # by _build_element
+        if skipped and skipped[0] == 1:
+            for element in elements:
+                element.form = None
+        if 2 in skipped:
+            for element in elements:
+                if isinstance(element, BaseRichSentenceElement):
+                    element.lemma = None
+
+        return Sentence(elements, comments)
+
+    @staticmethod
+    def _build_element(
+            line: str,
+            builders: tuple = _BUILDERS,
+            skipped: Tuple[int, ...] = ()
+    ) -> Optional[BaseSentenceElement]:
+        """Returns a new sentence element from the given word line, or
+        ``None`` in case of invalid input.
+
+        The fields at the ``skipped`` column indices are replaced with ``_``
+        before validation, so that the related attributes are set to
+        ``None``, except for ``FORM`` and ``LEMMA`` (see
+        :meth:`build_sentence`).
+        """
+        # pylint: disable=too-many-return-statements,too-many-branches
+        # pylint: disable=too-many-locals,too-many-boolean-expressions
+        fields = line.split('\t')
+        if len(fields) != 10:
+            return None
+
+        for column in skipped:
+            fields[column] = '_'
+
+        id_, form, lemma, upos, xpos, feats, head, deprel, deps, misc = fields
+
+        match = _ID.match(id_)
+        if match is None or match.end() != len(id_):
+            return None
+        kind = match.lastgroup
+
+        if not form or not lemma or not _is_value(misc):
+            return None
+
+        decode_feats, decode_deps, new_word, new_empty_node, new_multiword = \
+            builders
+
+        if kind == 'range':
+            if lemma != '_' or upos != '_' or xpos != '_' or feats != '_' \
+                    or head != '_' or deprel != '_' or deps != '_':
+                return None
+            first_index, last_index = id_.split('-')
+            return new_multiword(
+                first_index=int(first_index),
+                last_index=int(last_index),
+                form=form,
+                misc=None if misc == '_' else misc
+            )
+
+        if upos == '_':
+            upos_value = None
+        else:
+            upos_value = _UPOS.get(upos)
+            if upos_value is None:
+                return None
+
+        if not _is_value(xpos):
+            return None
+
+        if feats == '_':
+            feats_value = None
+        else:
+            feats_value = decode_feats(feats)
+            if feats_value is None:
+                return None
+
+        # DEPS is decoded only once all the previous fields are known to be
+        # valid, since the decoding could raise errors of its own
+        if kind == 'decimal':
+            if head != '_' or deprel != '_':
+                return None
+            if deps == '_':
+                deps_value = None
+            else:
+                deps_value = decode_deps(deps)
+                if deps_value is None:
+                    return None
+            main_index, sub_index = id_.split('.')
+            return new_empty_node(
+                main_index=int(main_index),
+                sub_index=int(sub_index),
+                form=form,
+                lemma=lemma,
+                upos=upos_value,
+                xpos=None if xpos == '_' else xpos,
+                feats=feats_value,
+                deps=deps_value,
+                misc=None if misc == '_' else misc
+            )
+
+        if head == '_':
+            head_value = None
+        else:
+            match = _HEAD.match(head)
+            if match is None or match.end() != len(head):
+                return None
+            head_value = int(head)
+
+        if not _is_value(deprel):
+            return None
+
+        if deps == '_':
+            deps_value = None
+        else:
+            deps_value = decode_deps(deps)
+            if deps_value is None:
+                return None
+
+        return new_word(
+            index=int(id_),
+            form=form,
+            lemma=lemma,
+            upos=upos_value,
+            xpos=None if xpos == '_' else xpos,
+            feats=feats_value,
+            head=head_value,
+            deprel=None if deprel == '_' else deprel,
+            deps=deps_value,
+            misc=None if misc == '_' else misc
+        )
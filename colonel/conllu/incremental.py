@@ -0,0 +1,229 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the :class:`.IncrementalParser` class, for parsing
+*CoNLL-U* input pushed in chunks of arbitrary size.
+"""
+
+import codecs
+from typing import List, Union, Callable, Optional, Iterable
+from colonel.sentence import Sentence
+from colonel.conllu.parser import Parser
+from colonel.conllu.fastparser import FastParser
+
+__all__ = ['IncrementalParser']
+
+
+class _ChunkDecoder:
+    """Decoder of the chunks of input of an :class:`IncrementalParser`,
+    which must be either all text or all binary ones.
+
+    :param encoding: the encoding used for decoding binary chunks
+    """
+
+    __slots__ = ('_decoder', '_binary')
+
+    def __init__(self, encoding: str) -> None:
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._binary: Optional[bool] = None
+
+    def decode(self, chunk: Union[str, bytes, bytearray]) -> str:
+        """Returns the text of a chunk, keeping any incomplete encoded
+        character at its end for the next one.
+
+        :raise UnicodeDecodeError: in case of invalid binary input
+        :raise TypeError: when mixing text and binary chunks
+        """
+        binary = not isinstance(chunk, str)
+        if self._binary is None:
+            self._binary = binary
+        elif self._binary != binary:
+            raise TypeError('Text and binary chunks cannot be mixed')
+
+        if isinstance(chunk, str):
+            return chunk
+        return self._decoder.decode(chunk)
+
+    def flush(self) -> str:
+        """Returns the text left over by the binary chunks, at the end of
+        the input.
+
+        :raise UnicodeDecodeError: if the input ends within an encoded
+            character
+        """
+        if self._binary:
+            return self._decoder.decode(b'', final=True)
+        return ''
+
+
+class IncrementalParser:
+    """Push-style *CoNLL-U* parser, returning sentences as soon as the
+    chunks of input given to :meth:`feed` complete them.
+
+    Chunks can be split anywhere, even in the middle of a line or of an
+    encoded multi-byte character; only the text following the last
+    complete sentence is kept in memory, and each sentence is parsed as soon
+    as its terminating blank line is received. Errors report the absolute
+    line and column numbers, as if the whole input was parsed at once.
+
+    Once all the input has been fed, :meth:`close` must be called, so that
+    any truncated content is reported.
+
+    :param callback: a function called with each completed sentence, in
+        order, in addition to returning them
+    :param encoding: the encoding used for decoding binary chunks; any
+        encoding supported by :func:`codecs.getincrementaldecoder` is allowed
+    :param parser: the parser instance; by default, a new :class:`.FastParser`
+    :param lazy: whether or not to return :class:`.LazySentence` objects
+        (see :meth:`.FastParser.parse`); it requires a :class:`.FastParser`
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires a
+        :class:`.FastParser`
+    :param fields: the names of the fields of the word lines to process
+        (see :meth:`.FastParser.parse`); it requires a :class:`.FastParser`
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments (see :meth:`.FastParser.parse`); it
+        requires a :class:`.FastParser`
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires a :class:`.FastParser`
+
+    :raise ValueError: if the parser does not support the given options
+    """
+
+    def __init__(
+            self,
+            callback: Optional[Callable[[Sentence], None]] = None,
+            encoding: str = 'utf-8',
+            parser: Optional[Union[FastParser, Parser]] = None,
+            lazy: bool = False,
+            lazy_fields: bool = False,
+            fields: Optional[Iterable[str]] = None,
+            where: Optional[Callable[[List[str]], bool]] = None,
+            keep_lines: bool = False
+    ) -> None:
+        if parser is None:
+            parser = FastParser()
+
+        self._parse: Callable[[str, int], List[Sentence]] = parser.parse
+        if lazy or lazy_fields or fields is not None or where is not None \
+                or keep_lines:
+            if not isinstance(parser, FastParser):
+                raise ValueError(f'{type(parser).__name__} does not support '
+                                 f'the given parsing options')
+            fast_parser = parser
+            if fields is not None:
+                fields = tuple(fields)
+
+            def parse(content: str, line_number: int) -> List[Sentence]:
+                return fast_parser.parse(content, line_number, lazy=lazy,
+                                         lazy_fields=lazy_fields,
+                                         fields=fields, where=where,
+                                         keep_lines=keep_lines)
+
+            self._parse = parse
+
+        #: Function called with each completed sentence, if any
+        self.callback: Optional[Callable[[Sentence], None]] = callback
+
+        self._decoder = _ChunkDecoder(encoding)
+        self._pieces: List[str] = []
+        self._line_number = 1
+        self._empty = True
+        self._closed = False
+
+    def feed(self, chunk: Union[str, bytes, bytearray]) -> List[Sentence]:
+        """Adds a chunk of input, returning the sentences it completes.
+
+        All the chunks must be either text or binary ones.
+
+        :raise lexer.LexerError: (any specific subclass) in case of invalid
+            input breaking the rules of the *CoNLL-U* lexer
+        :raise parser.ParserError: (any specific subclass) in case of invalid
+            input breaking the rules of the *CoNLL-U* parser
+        :raise UnicodeDecodeError: in case of invalid binary input
+        :raise TypeError: when mixing text and binary chunks
+        :raise ValueError: if the parser is already closed
+
+        :param chunk: the next portion of the *CoNLL-U* input
+        :return: list of the completed :class:`colonel.Sentence` items,
+            possibly empty
+        """
+        text = self._decode(chunk)
+        if not text:
+            return []
+        self._empty = False
+
+        pieces = self._pieces
+        end = text.rfind('\n\n')
+        if end >= 0:
+            end += 2
+        elif text[0] == '\n' and pieces and pieces[-1][-1] == '\n':
+            end = 1
+        else:
+            pieces.append(text)
+            return []
+
+        pieces.append(text[:end])
+        content = ''.join(pieces)
+        pieces.clear()
+        if end < len(text):
+            pieces.append(text[end:])
+
+        return self._parse_content(content)
+
+    def close(self) -> List[Sentence]:
+        """Signals the end of the input, returning the sentences completed
+        by the remaining content, if any.
+
+        :raise lexer.LexerError: (any specific subclass) in case of invalid
+            input breaking the rules of the *CoNLL-U* lexer
+        :raise parser.ParserError: (any specific subclass) in case of invalid
+            input breaking the rules of the *CoNLL-U* parser, such as a
+            :class:`.IllegalEofError` for truncated (or empty) input
+        :raise UnicodeDecodeError: if the binary input ends within an encoded
+            character
+        :raise ValueError: if the parser is already closed
+
+        :return: list of the completed :class:`colonel.Sentence` items,
+            possibly empty
+        """
+        if self._closed:
+            raise ValueError('IncrementalParser is already closed')
+        self._closed = True
+
+        self._pieces.append(self._decoder.flush())
+
+        content = ''.join(self._pieces)
+        self._pieces.clear()
+        if not content and not self._empty:
+            return []
+        return self._parse_content(content)
+
+    def _decode(self, chunk: Union[str, bytes, bytearray]) -> str:
+        if self._closed:
+            raise ValueError('IncrementalParser is already closed')
+        return self._decoder.decode(chunk)
+
+    def _parse_content(self, content: str) -> List[Sentence]:
+        sentences = self._parse(content, self._line_number)
+        self._line_number += content.count('\n')
+
+        callback = self.callback
+        if callback is not None:
+            for sentence in sentences:
+                callback(sentence)
+
+        return sentences
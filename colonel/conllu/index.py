@@ -0,0 +1,330 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing random access to the sentences of *CoNLL-U* files.
+
+A :class:`SentenceIndex` records where each sentence block (see
+:mod:`.splitter`) of a file begins and ends, and the number of its first
+line; it is built with one quick scan of the raw bytes, without parsing
+anything, and it can be saved to a *sidecar* file next to the *CoNLL-U* file
+itself, so that the scan is not repeated.
+
+An :class:`IndexedReader` makes use of an index for returning sentences by
+position, parsing only the related slices of the memory-mapped file.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from contextlib import ExitStack
+from mmap import mmap, ACCESS_READ
+from typing import List, Tuple, Iterable, Union, Optional, Any
+from colonel.sentence import Sentence
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.splitter import split_buffer
+
+__all__ = ['SIDECAR_SUFFIX', 'InvalidIndexError', 'SentenceIndex',
+           'IndexedReader']
+
+#: Suffix appended to the path of a *CoNLL-U* file for obtaining the path of
+#: its sidecar index file.
+SIDECAR_SUFFIX = '.idx'
+
+#: Header of the sidecar index files: magic bytes, size and modification
+#: time (in nanoseconds) of the indexed file, and number of sentences.
+_HEADER = struct.Struct('<8sQQQ')
+
+_MAGIC = b'CLNLIDX1'
+
+
+class InvalidIndexError(Exception):
+    """Error raised when loading a sidecar index file which is malformed, or
+    which does not match the current state of the indexed file.
+    """
+
+
+class SentenceIndex:
+    """Byte offsets and first line numbers of the sentence blocks of a
+    *CoNLL-U* file.
+
+    Sentence blocks are contiguous, so the ``n``-th block spans from
+    ``offsets[n]`` to ``offsets[n + 1]``; the last offset is the size of the
+    whole content. The index is built without parsing the sentences, so
+    any error is only raised when a sentence is actually parsed.
+    """
+
+    def __init__(
+            self,
+            offsets: array,
+            line_numbers: array,
+            file_size: int = 0,
+            file_mtime_ns: int = 0
+    ) -> None:
+        #: Start offset of each block, followed by the size of the content
+        self.offsets: array = offsets
+
+        #: Number of the first line of each block
+        self.line_numbers: array = line_numbers
+
+        #: Size of the indexed file, in bytes
+        self.file_size: int = file_size
+
+        #: Modification time of the indexed file, in nanoseconds
+        self.file_mtime_ns: int = file_mtime_ns
+
+    def __len__(self) -> int:
+        return len(self.line_numbers)
+
+    def span(self, position: int) -> Tuple[int, int, int]:
+        """Returns the line number of the first line, and the start and end
+        byte offsets, of the sentence block at the given position.
+
+        :raise IndexError: if the position is out of range
+        """
+        line_number = self.line_numbers[position]
+        if position < 0:
+            position += len(self)
+        return line_number, self.offsets[position], self.offsets[position + 1]
+
+    @classmethod
+    def build(
+            cls,
+            buffer: Union[bytes, bytearray, mmap]
+    ) -> 'SentenceIndex':
+        """Builds the index of an encoded *CoNLL-U* binary buffer.
+
+        :param buffer: the encoded *CoNLL-U* content
+        :return: a new :class:`SentenceIndex`
+        """
+        offsets = array('Q')
+        line_numbers = array('Q')
+
+        for line_number, start, _ in split_buffer(buffer):
+            offsets.append(start)
+            line_numbers.append(line_number)
+
+        offsets.append(len(buffer))
+        return cls(offsets, line_numbers)
+
+    @classmethod
+    def build_from_file(cls, path: Union[str, os.PathLike]) -> 'SentenceIndex':
+        """Builds the index of a *CoNLL-U* file.
+
+        :param path: the path of the *CoNLL-U* file
+        :return: a new :class:`SentenceIndex`
+        """
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            if stat.st_size == 0:
+                index = cls.build(b'')
+            else:
+                with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+                    index = cls.build(buffer)
+
+        index.file_size = stat.st_size
+        index.file_mtime_ns = stat.st_mtime_ns
+        return index
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Writes the index to a sidecar file.
+
+        The file is first written under a temporary name and then renamed,
+        so that concurrent readers never see a partially written index.
+
+        :param path: the path of the sidecar file
+        """
+        temp_path = f'{os.fspath(path)}.{os.getpid()}.tmp'
+
+        with open(temp_path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, self.file_size,
+                                    self.file_mtime_ns, len(self)))
+            for values in (self.offsets, self.line_numbers):
+                if sys.byteorder == 'big':
+                    values = array('Q', values)
+                    values.byteswap()
+                values.tofile(file)
+
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(
+            cls,
+            path: Union[str, os.PathLike],
+            file_path: Optional[Union[str, os.PathLike]] = None
+    ) -> 'SentenceIndex':
+        """Reads an index from a sidecar file.
+
+        :raise InvalidIndexError: if the sidecar file is malformed, or if
+            ``file_path`` is given and that file was modified after the index
+            was built
+
+        :param path: the path of the sidecar file
+        :param file_path: the path of the indexed *CoNLL-U* file, for
+            checking that the index is up to date
+        :return: a new :class:`SentenceIndex`
+        """
+        with open(path, 'rb') as file:
+            header = file.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise InvalidIndexError(f'Truncated index file {path}')
+
+            magic, file_size, file_mtime_ns, count = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise InvalidIndexError(f'Invalid index file {path}')
+
+            if file_path is not None:
+                stat = os.stat(file_path)
+                if stat.st_size != file_size or \
+                        stat.st_mtime_ns != file_mtime_ns:
+                    raise InvalidIndexError(
+                        f'Index file {path} is out of date')
+
+            offsets = array('Q')
+            line_numbers = array('Q')
+            data = file.read((2 * count + 1) * offsets.itemsize)
+            if len(data) != (2 * count + 1) * offsets.itemsize:
+                raise InvalidIndexError(f'Truncated index file {path}')
+
+        offsets.frombytes(data[:(count + 1) * offsets.itemsize])
+        line_numbers.frombytes(data[(count + 1) * offsets.itemsize:])
+
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+            line_numbers.byteswap()
+
+        return cls(offsets, line_numbers, file_size, file_mtime_ns)
+
+
+class IndexedReader:
+    """Random access reader of the sentences of a *CoNLL-U* file.
+
+    Sentences are returned by position, like items of a read-only sequence
+    (``reader[i]``, ``reader[i:j]``), or many at once with :meth:`take`,
+    parsing only the related slices of the memory-mapped file. Errors report
+    the absolute line and column numbers.
+
+    The most recently returned sentences are kept in a bounded *LRU* cache,
+    so that requesting them again does not involve any parsing; be aware
+    that the cached objects are shared, so any change made to a returned
+    sentence is visible the next time it is requested.
+
+    The instances of this class are not thread-safe, and should be closed
+    after use, either with :meth:`close` or using them as context managers.
+
+    :param path: the path of the *CoNLL-U* file
+    :param index: the index of the file; when missing, it is built (or
+        loaded, see ``sidecar``)
+    :param sidecar: when ``True`` and no ``index`` is given, the index is
+        loaded from the sidecar file (see :data:`SIDECAR_SUFFIX`), if it
+        exists and is up to date, otherwise it is built and saved there
+    :param encoding: the encoding of the file
+    :param cache_size: the maximum number of cached sentences
+    """
+
+    def __init__(
+            self,
+            path: Union[str, os.PathLike],
+            index: Optional[SentenceIndex] = None,
+            sidecar: bool = False,
+            encoding: str = 'utf-8',
+            cache_size: int = 1024
+    ) -> None:
+        if index is None:
+            index = self._get_index(path, sidecar)
+
+        #: The index of the file
+        self.index: SentenceIndex = index
+
+        self._encoding = encoding
+        self._cache_size = cache_size
+        self._cache: 'OrderedDict[int, Sentence]' = OrderedDict()
+        self._parser = FastParser()
+
+        with ExitStack() as stack:
+            file = stack.enter_context(open(path, 'rb'))
+            self._buffer: Union[bytes, mmap] = b''
+            if os.fstat(file.fileno()).st_size > 0:
+                self._buffer = stack.enter_context(
+                    mmap(file.fileno(), 0, access=ACCESS_READ))
+            # The file and the buffer stay open until close()
+            self._resources = stack.pop_all()
+
+    @staticmethod
+    def _get_index(
+            path: Union[str, os.PathLike],
+            sidecar: bool
+    ) -> SentenceIndex:
+        if not sidecar:
+            return SentenceIndex.build_from_file(path)
+
+        index_path = f'{os.fspath(path)}{SIDECAR_SUFFIX}'
+        try:
+            return SentenceIndex.load(index_path, path)
+        except (FileNotFoundError, InvalidIndexError):
+            index = SentenceIndex.build_from_file(path)
+            index.save(index_path)
+            return index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(
+            self,
+            key: Union[int, slice]
+    ) -> Union[Sentence, List[Sentence]]:
+        if isinstance(key, slice):
+            return self.take(range(len(self))[key])
+        return self._get(key)
+
+    def take(self, indices: Iterable[int]) -> List[Sentence]:
+        """Returns the sentences at the given positions, in the same order.
+
+        :raise IndexError: if any position is out of range
+        """
+        return [self._get(position) for position in indices]
+
+    def _get(self, position: int) -> Sentence:
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError('sentence index out of range')
+
+        cache = self._cache
+        sentence = cache.get(position)
+        if sentence is not None:
+            cache.move_to_end(position)
+            return sentence
+
+        line_number, start, end = self.index.span(position)
+        content = self._buffer[start:end].decode(self._encoding)
+        sentence = self._parser.parse(content, line_number)[0]
+
+        cache[position] = sentence
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+        return sentence
+
+    def close(self) -> None:
+        """Releases the memory-mapped file."""
+        self._resources.close()
+
+    def __enter__(self) -> 'IndexedReader':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
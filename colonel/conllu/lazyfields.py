@@ -0,0 +1,174 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing sentence elements which decode their *CoNLL-U* ``FEATS``
+and ``DEPS`` fields only when accessed.
+
+Splitting every ``FEATS`` and ``DEPS`` value into nested tuples is a waste
+for the many applications which never make use of morphological features or
+enhanced dependencies. The classes of this module, returned by
+:meth:`.FastParser.parse` when ``lazy_fields`` is enabled, keep those values
+as the original, already validated, strings: each one is decoded, into the
+same structure built by :class:`.ConlluLexerBuilder`, the first time the
+related attribute is read, and it is never decoded at all if the element is
+just serialized back to *CoNLL-U*.
+"""
+
+from typing import Optional, Any
+from colonel.base_rich_sentence_element import BaseRichSentenceElement
+from colonel.conllu.lexer import decode_feats, decode_deps
+from colonel.emptynode import EmptyNode
+from colonel.word import Word
+
+__all__ = ['LazyFieldsWord', 'LazyFieldsEmptyNode']
+
+# Descriptors of the slots where the values of the fields are stored,
+# either raw or decoded; they are shadowed by the properties below.
+_FEATS_SLOT: Any = BaseRichSentenceElement.__dict__['feats']
+_DEPS_SLOT: Any = BaseRichSentenceElement.__dict__['deps']
+
+# Bound accessors of the slots above
+_get_feats = _FEATS_SLOT.__get__
+_set_feats = _FEATS_SLOT.__set__
+_get_deps = _DEPS_SLOT.__get__
+_set_deps = _DEPS_SLOT.__set__
+
+# Flags of :attr:`_LazyFieldsMixin._raw_fields`
+_RAW_FEATS = 1
+_RAW_DEPS = 2
+
+
+class _LazyFieldsMixin:
+    """Mixin for :class:`.BaseRichSentenceElement` subclasses, replacing the
+    :attr:`feats` and :attr:`deps` attributes with properties which decode
+    raw *CoNLL-U* values on first access.
+
+    The concrete classes must define the ``_raw_fields`` slot, holding the
+    flags of the fields whose value is still raw.
+    """
+
+    # mypy can't tell that the slot is provided by the concrete classes,
+    # hence the "type: ignore" comments for each assignment below
+    __slots__ = ()
+
+    _raw_fields: int
+
+    def _init_raw_fields(
+            self,
+            feats: Optional[str],
+            deps: Optional[str]
+    ) -> None:
+        """Stores the given raw values; it must be called at the end of the
+        initialization of the element.
+        """
+        _set_feats(self, feats)
+        _set_deps(self, deps)
+        raw_fields = _RAW_FEATS if feats is not None else 0
+        if deps is not None:
+            raw_fields |= _RAW_DEPS
+        self._raw_fields = raw_fields  # type: ignore
+
+    @property
+    def feats(self) -> Optional[Any]:
+        """Morphological features (see
+        :attr:`.BaseRichSentenceElement.feats`), decoded on first access.
+        """
+        if self._raw_fields & _RAW_FEATS:
+            _set_feats(self, decode_feats(_get_feats(self)))
+            self._raw_fields &= ~_RAW_FEATS  # type: ignore
+        return _get_feats(self)
+
+    @feats.setter
+    def feats(self, value: Optional[Any]) -> None:
+        _set_feats(self, value)
+        self._raw_fields &= ~_RAW_FEATS  # type: ignore
+
+    @property
+    def deps(self) -> Optional[Any]:
+        """Enhanced dependency graph (see
+        :attr:`.BaseRichSentenceElement.deps`), decoded on first access.
+        """
+        if self._raw_fields & _RAW_DEPS:
+            _set_deps(self, decode_deps(_get_deps(self)))
+            self._raw_fields &= ~_RAW_DEPS  # type: ignore
+        return _get_deps(self)
+
+    @deps.setter
+    def deps(self, value: Optional[Any]) -> None:
+        _set_deps(self, value)
+        self._raw_fields &= ~_RAW_DEPS  # type: ignore
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether or not both :attr:`feats` and :attr:`deps` have already
+        been decoded (or replaced).
+        """
+        return not self._raw_fields
+
+    def _feats_to_conllu(self) -> str:
+        """Returns a *CoNLL-U*-compatible representation of :attr:`feats`,
+        without decoding a raw value (see
+        :meth:`.BaseRichSentenceElement._feats_to_conllu`).
+        """
+        if self._raw_fields & _RAW_FEATS:
+            return _get_feats(self)
+        # pylint: disable=no-member
+        return super(_LazyFieldsMixin, self)._feats_to_conllu()  # type: ignore
+
+    def _deps_to_conllu(self) -> str:
+        """Returns a *CoNLL-U*-compatible representation of :attr:`deps`,
+        without decoding a raw value (see
+        :meth:`.BaseRichSentenceElement._deps_to_conllu`).
+        """
+        if self._raw_fields & _RAW_DEPS:
+            return _get_deps(self)
+        # pylint: disable=no-member
+        return super(_LazyFieldsMixin, self)._deps_to_conllu()  # type: ignore
+
+
+class LazyFieldsWord(_LazyFieldsMixin, Word):  # type: ignore
+    """A :class:`colonel.Word` whose ``feats`` and ``deps`` are given as raw,
+    valid *CoNLL-U* strings (or ``None``), decoded only on first access.
+    """
+
+    __slots__ = ('_raw_fields',)
+
+    def __init__(
+            self,
+            feats: Optional[str] = None,
+            deps: Optional[str] = None,
+            **kwargs
+    ) -> None:
+        self._raw_fields = 0
+        super(LazyFieldsWord, self).__init__(**kwargs)
+        self._init_raw_fields(feats, deps)
+
+
+class LazyFieldsEmptyNode(_LazyFieldsMixin, EmptyNode):  # type: ignore
+    """A :class:`colonel.EmptyNode` whose ``feats`` and ``deps`` are given as
+    raw, valid *CoNLL-U* strings (or ``None``), decoded only on first access.
+    """
+
+    __slots__ = ('_raw_fields',)
+
+    def __init__(
+            self,
+            feats: Optional[str] = None,
+            deps: Optional[str] = None,
+            **kwargs
+    ) -> None:
+        self._raw_fields = 0
+        super(LazyFieldsEmptyNode, self).__init__(**kwargs)
+        self._init_raw_fields(feats, deps)
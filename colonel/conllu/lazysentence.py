@@ -0,0 +1,123 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the :class:`.LazySentence` class."""
+
+from typing import List, Optional, Dict, Any
+from colonel.base_sentence_element import BaseSentenceElement
+from colonel.sentence import Sentence
+
+__all__ = ['LazySentence']
+
+
+class LazySentence(Sentence):
+    """A :class:`colonel.Sentence` which keeps the original *CoNLL-U* text,
+    building its :attr:`elements` only the first time they are accessed.
+
+    Lazy sentences are returned by :meth:`.FastParser.parse` in *lazy* mode.
+    Only the comments are extracted while parsing, so that jobs interested
+    just in the comments of each sentence (or in the number of sentences)
+    can skip the processing of the word lines altogether.
+
+    Since the word lines are parsed only on first access to
+    :attr:`elements`, any error related to them, with its absolute line and
+    column numbers, is raised at that time, rather than while parsing.
+
+    The word lines are parsed by the :class:`.FastParser` instance owned by
+    the thread accessing :attr:`elements` (see :func:`.engines.get_parser`),
+    so that lazy sentences can be materialized by any thread, regardless of
+    the one which created them.
+
+    As long as :attr:`elements` have never been accessed and
+    :attr:`comments` are left unchanged, :meth:`to_conllu` returns the
+    original text exactly as it was.
+
+    :param content: the original *CoNLL-U* text of the sentence
+    :param line_number: the number of the first line of ``content``
+    :param comments: the comments of the sentence
+    :param options: the options of :meth:`.FastParser.parse` used for
+        building :attr:`elements`, other than ``lazy``
+    """
+
+    __slots__ = ('_elements', '_content', '_line_number', '_options')
+
+    def __init__(
+            self,
+            content: str,
+            line_number: int,
+            comments: List[str],
+            options: Optional[Dict[str, Any]] = None
+    ) -> None:
+        # pylint: disable=super-init-not-called
+        self._elements: Optional[List[BaseSentenceElement]] = None
+
+        #: Original *CoNLL-U* text of the sentence, including comment lines
+        #: and the terminating blank line
+        self._content: str = content
+
+        #: Number of the first line of :attr:`_content`
+        self._line_number: int = line_number
+
+        #: Options of :meth:`.FastParser.parse` for building :attr:`elements`
+        self._options: Dict[str, Any] = options or {}
+
+        self.comments: List[str] = comments
+
+    @property
+    def elements(self) -> List[BaseSentenceElement]:  # type: ignore
+        """Ordered list of words, tokens and nodes which form the sentence
+        (see :attr:`colonel.Sentence.elements`), built on first access.
+
+        :raise lexer.LexerError: (any specific subclass) in case of word lines
+            breaking the rules of the *CoNLL-U* lexer
+        :raise parser.ParserError: (any specific subclass) in case of word
+            lines breaking the rules of the *CoNLL-U* parser
+        """
+        if self._elements is None:
+            # pylint: disable=import-outside-toplevel,cyclic-import
+            from colonel.conllu.engines import get_parser
+            sentences = get_parser('fast').parse(
+                self._content, self._line_number, **self._options)
+            self._elements = sentences[0].elements
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: List[BaseSentenceElement]) -> None:
+        self._elements = elements
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether or not :attr:`elements` have already been built."""
+        return self._elements is not None
+
+    def to_conllu(self) -> str:
+        """Returns a *CoNLL-U* formatted representation of the sentence.
+
+        The original text is returned if :attr:`elements` have never been
+        accessed and :attr:`comments` are unchanged; otherwise, the sentence
+        is serialized as described in :meth:`colonel.Sentence.to_conllu`.
+        """
+        if self._elements is None and self.comments == self._raw_comments():
+            return self._content
+        return super(LazySentence, self).to_conllu()
+
+    def _raw_comments(self) -> List[str]:
+        """Returns the comments extracted from the original text."""
+        comments = []
+        for line in self._content.split('\n'):
+            if not line.startswith('#'):
+                break
+            comments.append(line[1:].strip())
+        return comments
@@ -17,13 +17,25 @@
 exception classes.
 """
 
+import copyreg
 from ply.lex import LexToken, TOKEN, Lexer, lex  # type: ignore
 from colonel.upostag import UposTag
 
+#: Name of the module containing the precomputed lexer tables, shipped
+#: within this package and generated with
+#: :meth:`.ConlluLexerBuilder.write_table`.
+LEXTAB = 'colonel.conllu.lextab'
+
 
 class LexerError(Exception):
     """Generic error class for :class:`.ConlluLexerBuilder`."""
-    pass
+
+    def __reduce__(self) -> tuple:
+        # The constructors of the subclasses expect PLY objects, so errors
+        # are unpickled (e.g. when raised by another process) restoring
+        # their attributes, without calling any constructor.
+        state = dict(self.__dict__, args=self.args)
+        return copyreg.__newobj__, (type(self),), state  # type: ignore
 
 
 class IllegalCharacterError(LexerError):
@@ -51,6 +63,29 @@ class IllegalCharacterError(LexerError):
         )
 
 
+def decode_feats(value: str) -> tuple:
+    """Given a valid, not empty *CoNLL-U* ``FEATS`` value, it returns a tuple
+    of feature name and values pairs, where the values are in turn a tuple of
+    strings.
+    """
+    feats = []
+    for feat in value.split('|'):
+        name, _, values = feat.partition('=')
+        feats.append((name, tuple(values.split(','))))
+    return tuple(feats)
+
+
+def decode_deps(value: str) -> tuple:
+    """Given a valid, not empty *CoNLL-U* ``DEPS`` value, it returns a tuple
+    of integer head and string deprel pairs.
+    """
+    deps = []
+    for dep in value.split('|'):
+        head, _, deprel = dep.partition(':')
+        deps.append((int(head), deprel))
+    return tuple(deps)
+
+
 # We disable pylint invalid names complaints due to PLY lexer naming convention
 # pylint: disable=invalid-name
 
@@ -62,6 +97,11 @@ class ConlluLexerBuilder:
     a *PLY* :class:`.Lexer`; such lexer instance is ready to process your
     input, making use of the rules provided by the :class:`ConlluLexerBuilder`
     class itself.
+
+    By default, the lexer is built in *PLY* optimized mode, loading the
+    precomputed tables from the :data:`LEXTAB` module instead of validating
+    the rules and compiling them from scratch; whenever the rules are
+    modified, such tables must be regenerated with :meth:`write_table`.
     """
 
     states = (
@@ -110,6 +150,27 @@ class ConlluLexerBuilder:
     #: Pattern for a nullable Universal part-of-speech tag
     _upos = r'({0}|_)'.format('|'.join(tag.name for tag in UposTag))
 
+    # The following patterns are shared with FastParser, which validates
+    # each field on its own.
+
+    #: Pattern for the ID of a multiword token (range of word indexes)
+    RANGE_ID_PATTERN = r'[1-9][0-9]*-[1-9][0-9]*'
+
+    #: Pattern for the ID of an empty node (decimal number)
+    DECIMAL_ID_PATTERN = r'([1-9][0-9]+|[0-9])\.[1-9][0-9]*'
+
+    #: Pattern for the ID of a word (positive integer number)
+    INTEGER_ID_PATTERN = r'[1-9][0-9]*'
+
+    #: Pattern for a nullable head
+    HEAD_PATTERN = _dep_head + '|_'
+
+    #: Pattern for a nullable list of morphological features
+    FEATS_PATTERN = _feats
+
+    #: Pattern for a nullable list of head+deprel pairs
+    DEPS_PATTERN = _deps
+
     def t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB(self, token: LexToken) -> LexToken:
         r'\t'
         self._tab_count += 1
@@ -123,22 +184,25 @@ class ConlluLexerBuilder:
         return token
 
     @staticmethod
+    @TOKEN(RANGE_ID_PATTERN)
     def t_RANGE_ID(token: LexToken) -> LexToken:
-        r'[1-9][0-9]*-[1-9][0-9]*'
+        # pylint: disable=missing-docstring
         token.value = tuple(map(int, token.value.split('-')))
         token.lexer.begin('v0')
         return token
 
     @staticmethod
+    @TOKEN(DECIMAL_ID_PATTERN)
     def t_DECIMAL_ID(token: LexToken) -> LexToken:
-        r'([1-9][0-9]+|[0-9])\.[1-9][0-9]*'
+        # pylint: disable=missing-docstring
         token.value = tuple(map(int, token.value.split('.')))
         token.lexer.begin('v0')
         return token
 
     @staticmethod
+    @TOKEN(INTEGER_ID_PATTERN)
     def t_INTEGER_ID(token: LexToken) -> LexToken:
-        r'[1-9][0-9]*'
+        # pylint: disable=missing-docstring
         token.value = int(token.value)
         token.lexer.begin('v0')
         return token
@@ -174,16 +238,15 @@ class ConlluLexerBuilder:
     @TOKEN(_feats)
     def t_c5_FEATS(token: LexToken) -> LexToken:
         # pylint: disable=missing-docstring
-        token.value = None if token.value == '_' else tuple(
-            (x[:x.index('=')], tuple(x[x.index('=')+1:].split(',')))
-            for x in token.value.split('|')
-        )
+        token.value = None if token.value == '_' else \
+            decode_feats(token.value)
         token.lexer.begin('v5')
         return token
 
     @staticmethod
+    @TOKEN(HEAD_PATTERN)
     def t_c6_HEAD(token: LexToken) -> LexToken:
-        r'([1-9][0-9]+|[0-9])|_'
+        # pylint: disable=missing-docstring
         token.value = None if token.value == '_' else int(token.value)
         token.lexer.begin('v6')
         return token
@@ -199,10 +262,8 @@ class ConlluLexerBuilder:
     @TOKEN(_deps)
     def t_c8_DEPS(token: LexToken) -> LexToken:
         # pylint: disable=missing-docstring
-        token.value = None if token.value == '_' else tuple(
-            (int(x[:x.index(':')]), x[x.index(':')+1:])
-            for x in token.value.split('|')
-        )
+        token.value = None if token.value == '_' else \
+            decode_deps(token.value)
         token.lexer.begin('v8')
         return token
 
@@ -215,7 +276,10 @@ class ConlluLexerBuilder:
 
     def t_INITIAL_v9_NEWLINE(self, token: LexToken) -> LexToken:
         r'\n'
-        token.lexer.lineno += 1
+        lexer = token.lexer
+        lexer.lineno += 1
+        lexer.line_start = lexer.lexpos
+        lexer.line_start_data = lexer.lexdata
         self._tab_count = 0
         token.lexer.begin('INITIAL')
         return token
@@ -228,13 +292,33 @@ class ConlluLexerBuilder:
     @staticmethod
     def find_column(token: LexToken) -> int:
         """Given a :class:`.LexToken`, it returns the related column number.
+
+        Lexers built by this class keep track of the position where the
+        current line begins, so that the text preceding the token does not
+        have to be searched; the search is only performed for tokens of the
+        first line of the input, or for newline tokens.
         """
-        line_start = token.lexer.lexdata.rfind('\n', 0, token.lexpos) + 1
+        lexer = token.lexer
+        line_start = getattr(lexer, 'line_start', 0)
+        if line_start > token.lexpos or \
+                getattr(lexer, 'line_start_data', None) is not lexer.lexdata:
+            line_start = lexer.lexdata.rfind('\n', 0, token.lexpos) + 1
         return (token.lexpos - line_start) + 1
 
-    def __init__(self) -> None:
-        self.lexer: Lexer = lex(module=self)
+    def __init__(self, optimize: bool = True) -> None:
+        self.lexer: Lexer = lex(module=self, optimize=optimize, lextab=LEXTAB)
+        self._tab_count = 0
+
+    def reset(self, line_number: int = 1) -> None:
+        """Brings :attr:`lexer` back to its initial state, so that it can be
+        reused for processing a new input.
+
+        :param line_number: the line number assigned to the first line of the
+            next input
+        """
         self._tab_count = 0
+        self.lexer.begin('INITIAL')
+        self.lexer.lineno = line_number
 
     @classmethod
     def build(cls) -> Lexer:
@@ -244,3 +328,15 @@ class ConlluLexerBuilder:
         :class:`ConlluLexerBuilder`.
         """
         return cls().lexer
+
+    @classmethod
+    def write_table(cls, outputdir: str) -> None:
+        """Builds a lexer from the rules defined by :class:`ConlluLexerBuilder`
+        and writes its tables to the ``lextab.py`` module in the given
+        directory.
+
+        :param outputdir: the directory where the module is written; in
+            order to update the tables shipped with this package, it must be
+            the directory of the :mod:`colonel.conllu` package
+        """
+        cls(optimize=False).lexer.writetab(LEXTAB, outputdir)
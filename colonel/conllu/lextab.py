@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('COMMENT', 'DECIMAL_ID', 'DEPREL', 'DEPS', 'FEATS', 'FORM', 'HEAD', 'INTEGER_ID', 'LEMMA', 'MISC', 'NEWLINE', 'RANGE_ID', 'TAB', 'UPOS', 'XPOS'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'v0': 'exclusive', 'v1': 'exclusive', 'v2': 'exclusive', 'v3': 'exclusive', 'v4': 'exclusive', 'v5': 'exclusive', 'v6': 'exclusive', 'v7': 'exclusive', 'v8': 'exclusive', 'v9': 'exclusive', 'c1': 'exclusive', 'c2': 'exclusive', 'c3': 'exclusive', 'c4': 'exclusive', 'c5': 'exclusive', 'c6': 'exclusive', 'c7': 'exclusive', 'c8': 'exclusive', 'c9': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_COMMENT>[#][^\\n]*)|(?P<t_RANGE_ID>[1-9][0-9]*-[1-9][0-9]*)|(?P<t_DECIMAL_ID>([1-9][0-9]+|[0-9])\\.[1-9][0-9]*)|(?P<t_INTEGER_ID>[1-9][0-9]*)|(?P<t_INITIAL_v9_NEWLINE>\\n)', [None, ('t_COMMENT', 'COMMENT'), ('t_RANGE_ID', 'RANGE_ID'), ('t_DECIMAL_ID', 'DECIMAL_ID'), None, ('t_INTEGER_ID', 'INTEGER_ID'), ('t_INITIAL_v9_NEWLINE', 'NEWLINE')])], 'v0': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v1': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v2': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v3': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v4': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v5': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v6': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v7': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v8': [('(?P<t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB>\\t)', [None, ('t_v0_v1_v2_v3_v4_v5_v6_v7_v8_TAB', 'TAB')])], 'v9': [('(?P<t_INITIAL_v9_NEWLINE>\\n)', [None, ('t_INITIAL_v9_NEWLINE', 'NEWLINE')])], 'c1': [('(?P<t_c1_FORM>[^\\n\\t]+)', [None, ('t_c1_FORM', 'FORM')])], 'c2': [('(?P<t_c2_LEMMA>[^\\n\\t]+)', [None, ('t_c2_LEMMA', 'LEMMA')])], 'c3': [('(?P<t_c3_UPOS>(ADJ|ADP|ADV|AUX|CCONJ|DET|INTJ|NOUN|NUM|PART|PRON|PROPN|PUNCT|SCONJ|SYM|VERB|X|_))', [None, ('t_c3_UPOS', 'UPOS')])], 'c4': [('(?P<t_c4_XPOS>[^\\n\\t ]+)', [None, ('t_c4_XPOS', 'XPOS')])], 'c5': [('(?P<t_c5_FEATS>([A-Z0-9][A-Z0-9a-z]*(\\[[a-z0-9]+\\])?=[A-Z0-9][a-zA-Z0-9]*(,[A-Z0-9][a-zA-Z0-9]*)*([|][A-Z0-9][A-Z0-9a-z]*(\\[[a-z0-9]+\\])?=[A-Z0-9][a-zA-Z0-9]*(,[A-Z0-9][a-zA-Z0-9]*)*)*)|_)', [None, ('t_c5_FEATS', 'FEATS')])], 'c6': [('(?P<t_c6_HEAD>([1-9][0-9]+|[0-9])|_)', [None, ('t_c6_HEAD', 'HEAD')])], 'c7': [('(?P<t_c7_DEPREL>[^\\n\\t ]+)', [None, ('t_c7_DEPREL', 'DEPREL')])], 'c8': [('(?P<t_c8_DEPS>(([1-9][0-9]+|[0-9]):[^\\n\\t ]+([|]([1-9][0-9]+|[0-9]):[^\\n\\t ]+)*)|_)', [None, ('t_c8_DEPS', 'DEPS')])], 'c9': [('(?P<t_c9_MISC>[^\\n\\t ]+)', [None, ('t_c9_MISC', 'MISC')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_ANY_error', 'v0': 't_ANY_error', 'v1': 't_ANY_error', 'v2': 't_ANY_error', 'v3': 't_ANY_error', 'v4': 't_ANY_error', 'v5': 't_ANY_error', 'v6': 't_ANY_error', 'v7': 't_ANY_error', 'v8': 't_ANY_error', 'v9': 't_ANY_error', 'c1': 't_ANY_error', 'c2': 't_ANY_error', 'c3': 't_ANY_error', 'c4': 't_ANY_error', 'c5': 't_ANY_error', 'c6': 't_ANY_error', 'c7': 't_ANY_error', 'c8': 't_ANY_error', 'c9': 't_ANY_error'}
+_lexstateeoff = {}
@@ -0,0 +1,96 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing a compact representation of parsed sentences, cheap to
+pickle and to turn back into objects.
+
+Pickling sentence objects the default way stores the name of every attribute
+of every element, and rebuilding them involves many function calls per
+object; that easily costs as much as parsing the *CoNLL-U* text again, which
+defeats the purpose of parsing in other processes (see
+:func:`colonel.conllu.parse_parallel`). :func:`pack_sentences` reduces the
+elements of each sentence to their classes and the plain values of their
+slots, and :func:`unpack_sentences` restores the objects filling their slots
+directly, without calling any constructor. :func:`dumps_sentences` and
+:func:`loads_sentences` combine them with :mod:`pickle`.
+
+The same representation is used whenever :class:`colonel.Sentence` objects
+and their elements are pickled (or deep-copied) on their own, one tuple per
+sentence; :func:`loads_sentences` is still faster for large amounts of
+sentences, since it also pauses the cyclic garbage collector.
+
+Only objects whose attributes are all stored in ``__slots__``, such as the
+ones returned by :class:`.FastParser` and :class:`.Parser`, can be packed
+(:class:`.LazySentence` objects can't).
+"""
+
+import gc
+import pickle
+from typing import Iterable, List
+from colonel._packing import pack_sentence, unpack_sentence
+from colonel.sentence import Sentence
+
+__all__ = ['pack_sentences', 'unpack_sentences', 'dumps_sentences',
+           'loads_sentences']
+
+
+def pack_sentences(sentences: Iterable[Sentence]) -> List[tuple]:
+    """Returns the compact representation of the given sentences.
+
+    Each sentence is reduced to a tuple composed by its class, its comments,
+    the tuple of the classes of its elements, and one flat tuple with the
+    slot values of all its elements; having few containers makes both
+    pickling and unpickling faster. The slot values are read directly, so
+    that, for example, the raw ``FEATS`` values of
+    :class:`.LazyFieldsWord` objects are not decoded.
+
+    :raise TypeError: if any sentence or element has attributes not stored
+        in ``__slots__``
+    """
+    return [pack_sentence(sentence) for sentence in sentences]
+
+
+def unpack_sentences(packed: Iterable[tuple]) -> List[Sentence]:
+    """Returns the sentences from their compact representation (see
+    :func:`pack_sentences`).
+    """
+    return [unpack_sentence(*item) for item in packed]
+
+
+def dumps_sentences(sentences: Iterable[Sentence]) -> bytes:
+    """Returns the pickled compact representation of the given sentences
+    (see :func:`pack_sentences`).
+
+    :raise TypeError: if any sentence or element has attributes not stored
+        in ``__slots__``
+    """
+    return pickle.dumps(pack_sentences(sentences), pickle.HIGHEST_PROTOCOL)
+
+
+def loads_sentences(data: bytes) -> List[Sentence]:
+    """Returns the sentences from their pickled compact representation (see
+    :func:`dumps_sentences`).
+
+    The cyclic garbage collector is paused meanwhile: the restored objects
+    never form reference cycles, yet creating so many of them would trigger
+    many pointless collections, taking as much time as the whole unpacking.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return unpack_sentences(pickle.loads(data))
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,414 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the functions parsing large *CoNLL-U* files, and whole
+treebanks made of many files, using many processes.
+
+Files are split into ranges of whole sentence blocks (see
+:func:`.splitter.split_ranges`), which are read and parsed by the worker
+processes; the parsed sentences are sent back in the compact form provided
+by :mod:`.packing`, which costs much less than parsing them. All these
+functions are also available from the :mod:`colonel.conllu` package.
+"""
+
+import glob
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from mmap import mmap, ACCESS_READ
+from typing import List, Iterator, Union, Tuple, Iterable, Callable, \
+    Optional
+from colonel.sentence import Sentence
+from colonel.conllu.cache import ParseCache
+from colonel.conllu.engines import get_parse_function, parse_path
+from colonel.conllu.packing import dumps_sentences, loads_sentences
+from colonel.conllu.splitter import split_buffer, split_ranges
+
+__all__ = ['parse_parallel', 'iter_parse_parallel', 'parse_treebank',
+           'iter_parse_treebank']
+
+
+def _parse_file_range(
+        path: Union[str, os.PathLike],
+        start: int,
+        end: int,
+        line_number: int,
+        encoding: str,
+        engine: str,
+        lazy_fields: bool,
+        fields: Optional[Tuple[str, ...]],
+        where: Optional[Callable[[List[str]], bool]],
+        keep_lines: bool
+) -> Tuple[bytes, Optional[Exception]]:
+    """Parses a range of whole sentence blocks of a *CoNLL-U* file, given
+    the line number of its first line, returning the sentences pickled with
+    :func:`.packing.dumps_sentences`, together with the error raised by the
+    first invalid sentence block, if any.
+
+    The error is returned, rather than raised, so that the sentences
+    preceding the invalid block are not lost.
+
+    This is the function run by the worker processes of
+    :func:`iter_parse_parallel`.
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        buffer = file.read(end - start)
+
+    parse_function = get_parse_function(engine, lazy_fields=lazy_fields,
+                                        fields=fields, where=where,
+                                        keep_lines=keep_lines)
+    sentences: List[Sentence] = []
+    try:
+        if not buffer:
+            sentences.extend(parse_function(''))
+        for line_number, start, end in split_buffer(buffer, line_number):
+            content = str(buffer[start:end], encoding)
+            sentences.extend(parse_function(content, line_number))
+    except Exception as error:  # pylint: disable=broad-except
+        return dumps_sentences(sentences), error
+    return dumps_sentences(sentences), None
+
+
+def _load_range(
+        path: str,
+        future: Future
+) -> Iterator[Tuple[str, List[Sentence]]]:
+    """Yields the path of a range together with the sentences returned by
+    the given future of :func:`_parse_file_range`, raising its error
+    afterwards, if any.
+    """
+    data, error = future.result()
+    yield path, loads_sentences(data)
+    if error is not None:
+        raise error
+
+
+def _iter_parse_ranges(
+        file_ranges: Iterable[Tuple[str, int, int, int]],
+        encoding: str,
+        engine: str,
+        lazy_fields: bool,
+        fields: Optional[Tuple[str, ...]],
+        where: Optional[Callable[[List[str]], bool]],
+        keep_lines: bool,
+        workers: Optional[int],
+        executor: Optional[Executor]
+) -> Iterator[Tuple[str, List[Sentence]]]:
+    """Parses ranges of whole sentence blocks of *CoNLL-U* files using many
+    processes, yielding the path of each range together with its sentences,
+    in the order of the ranges.
+
+    Each range is given as the path of its file, the number of its first
+    line, and its start and end offsets. Only ``2 * workers`` ranges are
+    submitted in advance, so that the memory usage stays bounded.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(workers)
+
+    pending: deque = deque()
+    try:
+        for path, line_number, start, end in file_ranges:
+            pending.append((path, executor.submit(
+                _parse_file_range, path, start, end, line_number, encoding,
+                engine, lazy_fields, fields, where, keep_lines)))
+
+            if len(pending) >= 2 * workers:
+                yield from _load_range(*pending.popleft())
+
+        while pending:
+            yield from _load_range(*pending.popleft())
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
+def iter_parse_parallel(
+        path: Union[str, os.PathLike],
+        encoding: str = 'utf-8',
+        engine: str = 'fast',
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 2**22,
+        executor: Optional[Executor] = None,
+        keep_lines: bool = False
+) -> Iterator[Sentence]:
+    """Parses a *CoNLL-U* file using many processes, yielding the sentences
+    in their original order.
+
+    The file is split into ranges of roughly ``chunk_size`` bytes, ending at
+    sentence boundaries (see :func:`.splitter.split_ranges`), which are read
+    and parsed by the worker processes; only a few ranges per worker are
+    submitted in advance, so that the memory usage stays bounded even when
+    the sentences are consumed slowly. The parsed sentences are sent back in
+    the compact form provided by :mod:`.packing`, which costs much less than
+    parsing them.
+
+    Errors report the absolute line and column numbers; as for
+    :func:`colonel.conllu.parse_file`, the error raised is the one related
+    to the first invalid sentence of the file, after all the sentences
+    preceding it have been yielded.
+
+    A file made of one range only is parsed by the current process.
+    Otherwise, ``where`` is called by the worker processes: it must be
+    picklable (e.g. a module-level function), and can't keep track of the
+    comments of previous sentences, since each process sees only some of
+    them.
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the given options
+
+    :param path: the path of the *CoNLL-U* file
+    :param encoding: the encoding of the file; it must be *UTF-8* or any
+        other one where a newline byte always represents a newline character
+    :param engine: the name of the parsing engine (see :data:`.ENGINES`)
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires
+        the ``'fast'`` engine
+    :param fields: the names of the fields of the word lines to process,
+        leaving the attributes related to the other ones as ``None`` (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments, called before processing its word lines
+        (see :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param workers: the number of worker processes; by default, the number
+        of processors of the machine
+    :param chunk_size: the approximate size of each range, in bytes
+    :param executor: the :class:`concurrent.futures.Executor` running the
+        workers; by default, a new :class:`ProcessPoolExecutor`, shut down
+        at the end
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires the ``'fast'`` engine
+    :return: an iterator of parsed :class:`colonel.Sentence` items
+    """
+    if fields is not None:
+        fields = tuple(fields)  # sent to the worker processes
+    get_parse_function(engine, lazy_fields=lazy_fields, fields=fields,
+                       where=where, keep_lines=keep_lines)  # early check
+
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            ranges = []
+        else:
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+                ranges = list(split_ranges(buffer, chunk_size))
+
+    if not ranges or (len(ranges) == 1 and executor is None):
+        yield from parse_path(path, encoding, get_parse_function(
+            engine, lazy_fields=lazy_fields, fields=fields, where=where,
+            keep_lines=keep_lines))
+        return
+
+    file_ranges = ((os.fspath(path), line_number, start, end)
+                   for line_number, start, end in ranges)
+    for _, sentences in _iter_parse_ranges(
+            file_ranges, encoding, engine, lazy_fields, fields, where,
+            keep_lines, workers, executor):
+        yield from sentences
+
+
+def parse_parallel(
+        path: Union[str, os.PathLike],
+        encoding: str = 'utf-8',
+        engine: str = 'fast',
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 2**22,
+        executor: Optional[Executor] = None,
+        keep_lines: bool = False,
+        cache: Optional[ParseCache] = None
+) -> List[Sentence]:
+    """Parses a *CoNLL-U* file using many processes, returning a list of
+    sentences.
+
+    It is the same as :func:`iter_parse_parallel`, collecting all the
+    sentences in a list. With a ``cache``, the sentences are loaded from it
+    if the file has already been parsed with the same options, as done by
+    :func:`colonel.conllu.parse_file`.
+    """
+    if fields is not None:
+        fields = tuple(fields)  # used for the cache key and for parsing
+    if cache is not None:
+        return cache.fetch(
+            path, partial(parse_parallel, path, encoding, engine,
+                          fields=fields, workers=workers,
+                          chunk_size=chunk_size, executor=executor),
+            encoding, engine, fields, lazy_fields=lazy_fields, where=where,
+            keep_lines=keep_lines)
+
+    return list(iter_parse_parallel(path, encoding, engine, lazy_fields,
+                                    fields, where, workers, chunk_size,
+                                    executor, keep_lines))
+
+
+def _find_treebank_files(source: Union[str, os.PathLike]) -> List[str]:
+    """Returns the sorted paths of the *CoNLL-U* files of a treebank, given
+    either a directory, searched recursively for ``.conllu`` files, or a
+    glob pattern.
+    """
+    if os.path.isdir(source):
+        pattern = os.path.join(glob.escape(os.fspath(source)), '**',
+                               '*.conllu')
+    else:
+        pattern = os.fspath(source)
+
+    return sorted(path for path in glob.iglob(pattern, recursive=True)
+                  if os.path.isfile(path))
+
+
+def _split_file_ranges(
+        path: str,
+        chunk_size: int
+) -> Iterator[Tuple[str, int, int, int]]:
+    """Yields the ranges of a *CoNLL-U* file as expected by
+    :func:`_iter_parse_ranges`; an empty file is made of one empty range.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield path, 1, 0, 0
+            return
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+            for line_number, start, end in split_ranges(buffer, chunk_size):
+                yield path, line_number, start, end
+
+
+def iter_parse_treebank(
+        source: Union[str, os.PathLike],
+        encoding: str = 'utf-8',
+        engine: str = 'fast',
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 2**22,
+        executor: Optional[Executor] = None,
+        keep_lines: bool = False
+) -> Iterator[Tuple[str, Sentence]]:
+    """Parses the *CoNLL-U* files of a treebank using many processes,
+    yielding each sentence together with the path of its file.
+
+    The ``source`` is either a directory, whose ``.conllu`` files are
+    searched recursively, or a glob pattern (where ``**`` matches any
+    number of nested directories). Files are parsed, and their sentences
+    yielded, in the sorted order of their paths, so that the output never
+    depends on the scheduling of the workers.
+
+    For balancing the work among processes regardless of the file sizes,
+    every file is split into ranges of roughly ``chunk_size`` bytes, ending
+    at sentence boundaries, as :func:`iter_parse_parallel` does: a huge file
+    is parsed by many workers at once, while each small file is parsed by
+    one worker. Only a few ranges per worker are submitted in advance, so
+    that the memory usage stays bounded. As for :func:`iter_parse_parallel`,
+    ``where`` is called by the worker processes, so it must be picklable and
+    can't keep track of the comments of previous sentences.
+
+    Errors report the absolute line and column numbers related to their
+    file; the error raised is the one related to the first invalid sentence,
+    after all the sentences preceding it have been yielded. As for
+    :func:`colonel.conllu.parse_file`, an empty file raises
+    :class:`.parser.IllegalEofError`.
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+    :raise ValueError: if the engine is unknown, or if it does not support
+        the given options
+
+    :param source: the directory of the treebank, or a glob pattern matching
+        its *CoNLL-U* files
+    :param encoding: the encoding of the files; it must be *UTF-8* or any
+        other one where a newline byte always represents a newline character
+    :param engine: the name of the parsing engine (see :data:`.ENGINES`)
+    :param lazy_fields: whether or not to decode ``FEATS`` and ``DEPS``
+        values only on first access (see :mod:`.lazyfields`); it requires
+        the ``'fast'`` engine
+    :param fields: the names of the fields of the word lines to process,
+        leaving the attributes related to the other ones as ``None`` (see
+        :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments, called before processing its word lines
+        (see :meth:`.FastParser.parse`); it requires the ``'fast'`` engine
+    :param workers: the number of worker processes; by default, the number
+        of processors of the machine
+    :param chunk_size: the approximate size of each range, in bytes
+    :param executor: the :class:`concurrent.futures.Executor` running the
+        workers; by default, a new :class:`ProcessPoolExecutor`, shut down
+        at the end
+    :param keep_lines: whether or not to keep the original line of each
+        element, serializing it back verbatim until the element is changed
+        (see :mod:`.sourcelines`); it requires the ``'fast'`` engine
+    :return: an iterator of pairs composed by the path of a file, as found
+        in the directory or matched by the pattern, and one of its parsed
+        :class:`colonel.Sentence` items
+    """
+    if fields is not None:
+        fields = tuple(fields)  # sent to the worker processes
+    get_parse_function(engine, lazy_fields=lazy_fields, fields=fields,
+                       where=where, keep_lines=keep_lines)  # early check
+
+    paths = _find_treebank_files(source)
+    if not paths:
+        return
+
+    file_ranges = (file_range for path in paths
+                   for file_range in _split_file_ranges(path, chunk_size))
+
+    for path, sentences in _iter_parse_ranges(
+            file_ranges, encoding, engine, lazy_fields, fields, where,
+            keep_lines, workers, executor):
+        for sentence in sentences:
+            yield path, sentence
+
+
+def parse_treebank(
+        source: Union[str, os.PathLike],
+        encoding: str = 'utf-8',
+        engine: str = 'fast',
+        lazy_fields: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Callable[[List[str]], bool]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 2**22,
+        executor: Optional[Executor] = None,
+        keep_lines: bool = False
+) -> List[Tuple[str, Sentence]]:
+    """Parses the *CoNLL-U* files of a treebank using many processes,
+    returning a list of pairs composed by the path of a file and one of its
+    sentences.
+
+    It is the same as :func:`iter_parse_treebank`, collecting all the pairs
+    in a list.
+    """
+    return list(iter_parse_treebank(source, encoding, engine, lazy_fields,
+                                    fields, where, workers, chunk_size,
+                                    executor, keep_lines))
@@ -17,7 +17,8 @@
 exception classes.
 """
 
-from typing import Optional
+import copyreg
+from typing import Optional, List
 from ply.yacc import yacc, LRParser, YaccProduction  # type: ignore
 from ply.lex import LexToken  # type: ignore
 from colonel.conllu.lexer import ConlluLexerBuilder
@@ -27,10 +28,21 @@ from colonel.emptynode import EmptyNode
 from colonel.multiword import Multiword
 from colonel.upostag import UposTag
 
+#: Name of the module containing the precomputed parser tables, shipped
+#: within this package and generated with
+#: :meth:`.ConlluParserBuilder.write_table`.
+PARSETAB = 'colonel.conllu.parsetab'
+
 
 class ParserError(Exception):
     """Generic error class for :class:`.ConlluParserBuilder`."""
-    pass
+
+    def __reduce__(self) -> tuple:
+        # The constructors of the subclasses expect PLY objects, so errors
+        # are unpickled (e.g. when raised by another process) restoring
+        # their attributes, without calling any constructor.
+        state = dict(self.__dict__, args=self.args)
+        return copyreg.__newobj__, (type(self),), state  # type: ignore
 
 
 class IllegalTokenError(ParserError):
@@ -125,14 +137,26 @@ class ConlluParserBuilder:
     input, making use of the rules provided by the :class:`ConlluParserBuilder`
     class itself.
 
+    The lists of sentences, comments and word lines are built by appending
+    each new item to the list produced by the previous reduction of the same
+    left-recursive rule, so that parsing takes linear time in the size of the
+    input.
+
     As usual, this class is paired with an associated lexer, which in in this
     case is served by :class:`.ConlluLexerBuilder`.
+
+    By default, the parser is built in *PLY* optimized mode, loading the
+    precomputed *LALR* tables from the :data:`PARSETAB` module; no table or
+    debugging file is ever written to the filesystem. Whenever the grammar
+    rules are modified, such tables must be regenerated with
+    :meth:`write_table`.
     """
 
     @staticmethod
     def p_sentences_many(prod: YaccProduction) -> None:
         'sentences : sentences sentence'
-        prod[0] = prod[1] + [prod[2]]
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
 
     @staticmethod
     def p_sentences_one(prod: YaccProduction) -> None:
@@ -152,7 +176,8 @@ class ConlluParserBuilder:
     @staticmethod
     def p_comments_many(prod: YaccProduction) -> None:
         'comments : comments comment'
-        prod[0] = prod[1] + [prod[2]]
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
 
     @staticmethod
     def p_comments_one(prod: YaccProduction) -> None:
@@ -167,7 +192,8 @@ class ConlluParserBuilder:
     @staticmethod
     def p_wordlines_many(prod: YaccProduction) -> None:
         'wordlines : wordlines wordline'
-        prod[0] = prod[1] + [prod[2]]
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
 
     @staticmethod
     def p_wordlines_one(prod: YaccProduction) -> None:
@@ -234,11 +260,18 @@ class ConlluParserBuilder:
         else:
             raise IllegalEofError()
 
-    def __init__(self) -> None:
+    def __init__(self, optimize: bool = True) -> None:
         self.tokens = ConlluLexerBuilder.tokens
-        self.lexer = ConlluLexerBuilder.build()
-
-        self.parser = yacc(module=self)
+        self.lexer_builder = ConlluLexerBuilder(optimize)
+        self.lexer = self.lexer_builder.lexer
+
+        self.parser = yacc(
+            module=self,
+            tabmodule=PARSETAB,
+            optimize=optimize,
+            debug=False,
+            write_tables=False
+        )
 
     @classmethod
     def build(cls) -> LRParser:
@@ -248,3 +281,59 @@ class ConlluParserBuilder:
         :class:`ConlluParserBuilder`.
         """
         return cls().parser
+
+    @classmethod
+    def write_table(cls, outputdir: str) -> None:
+        """Generates the *LALR* tables from the grammar rules defined by
+        :class:`ConlluParserBuilder` and writes them to the ``parsetab.py``
+        module in the given directory.
+
+        :param outputdir: the directory where the module is written; in
+            order to update the tables shipped with this package, it must be
+            the directory of the :mod:`colonel.conllu` package
+        """
+        # A table module which cannot be imported forces PLY to generate the
+        # tables from scratch; only the last part of the name is used for
+        # naming the written file.
+        yacc(
+            module=cls(optimize=False),
+            tabmodule=f'{PARSETAB}.generated.parsetab',
+            outputdir=outputdir,
+            debug=False
+        )
+
+
+class Parser:  # pylint: disable=too-few-public-methods
+    """Reusable *CoNLL-U* parser.
+
+    Building lexer and parser instances with :class:`.ConlluLexerBuilder`
+    and :class:`ConlluParserBuilder` involves the compilation of regular
+    expressions and the validation of the grammar, which is much more
+    expensive than parsing a small input. A :class:`Parser` performs that
+    work only once, on creation, and then resets the state of its lexer
+    before processing each new input, so that the same instance can be
+    used for any number of :meth:`parse` calls.
+
+    The instances of this class are not thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._builder = ConlluParserBuilder()
+
+    def parse(self, content: str, line_number: int = 1) -> List[Sentence]:
+        """Parses a *CoNLL-U* string content, returning a list of sentences.
+
+        :raise lexer.LexerError: (any specific subclass) in case of invalid
+            input breaking the rules of the *CoNLL-U* lexer
+        :raise ParserError: (any specific subclass) in case of invalid input
+            breaking the rules of the *CoNLL-U* parser
+
+        :param content: *CoNLL-U* formatted string to be parsed
+        :param line_number: the line number of the first line of ``content``,
+            useful when it is a fragment of a larger input, so that errors
+            can still report absolute positions
+        :return: list of parsed :class:`colonel.Sentence` items
+        """
+        builder = self._builder
+        builder.lexer_builder.reset(line_number)
+        return builder.parser.parse(content, lexer=builder.lexer)
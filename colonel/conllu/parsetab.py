@@ -0,0 +1,42 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'COMMENT DECIMAL_ID DEPREL DEPS FEATS FORM HEAD INTEGER_ID LEMMA MISC NEWLINE RANGE_ID TAB UPOS XPOSsentences : sentences sentencesentences : sentencesentence : comments wordlines NEWLINEsentence : wordlines NEWLINEcomments : comments commentcomments : commentcomment : COMMENT NEWLINEwordlines : wordlines wordlinewordlines : wordlinewordline : INTEGER_ID TAB FORM TAB LEMMA TAB UPOS TAB XPOS TAB FEATS TAB HEAD TAB DEPREL TAB DEPS TAB MISC NEWLINEwordline : RANGE_ID TAB FORM TAB LEMMA TAB UPOS TAB XPOS TAB FEATS TAB HEAD TAB DEPREL TAB DEPS TAB MISC NEWLINEwordline : DECIMAL_ID TAB FORM TAB LEMMA TAB UPOS TAB XPOS TAB FEATS TAB HEAD TAB DEPREL TAB DEPS TAB MISC NEWLINE'
+    
+_lr_action_items = {'COMMENT':([0,1,2,3,5,11,13,14,16,20,],[7,7,-2,7,-6,-1,-5,-4,-7,-3,]),'INTEGER_ID':([0,1,2,3,4,5,6,11,12,13,14,15,16,20,72,73,74,],[8,8,-2,8,8,-6,-9,-1,8,-5,-4,-8,-7,-3,-10,-11,-12,]),'RANGE_ID':([0,1,2,3,4,5,6,11,12,13,14,15,16,20,72,73,74,],[9,9,-2,9,9,-6,-9,-1,9,-5,-4,-8,-7,-3,-10,-11,-12,]),'DECIMAL_ID':([0,1,2,3,4,5,6,11,12,13,14,15,16,20,72,73,74,],[10,10,-2,10,10,-6,-9,-1,10,-5,-4,-8,-7,-3,-10,-11,-12,]),'$end':([1,2,11,14,20,],[0,-2,-1,-4,-3,]),'NEWLINE':([4,6,7,12,15,69,70,71,72,73,74,],[14,-9,16,20,-8,72,73,74,-10,-11,-12,]),'TAB':([8,9,10,21,22,23,27,28,29,33,34,35,39,40,41,45,46,47,51,52,53,57,58,59,63,64,65,],[17,18,19,24,25,26,30,31,32,36,37,38,42,43,44,48,49,50,54,55,56,60,61,62,66,67,68,]),'FORM':([17,18,19,],[21,22,23,]),'LEMMA':([24,25,26,],[27,28,29,]),'UPOS':([30,31,32,],[33,34,35,]),'XPOS':([36,37,38,],[39,40,41,]),'FEATS':([42,43,44,],[45,46,47,]),'HEAD':([48,49,50,],[51,52,53,]),'DEPREL':([54,55,56,],[57,58,59,]),'DEPS':([60,61,62,],[63,64,65,]),'MISC':([66,67,68,],[69,70,71,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'sentences':([0,],[1,]),'sentence':([0,1,],[2,11,]),'comments':([0,1,],[3,3,]),'wordlines':([0,1,3,],[4,4,12,]),'comment':([0,1,3,],[5,5,13,]),'wordline':([0,1,3,4,12,],[6,6,6,15,15,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> sentences","S'",1,None,None,None),
+  ('sentences -> sentences sentence','sentences',2,'p_sentences_many','parser.py',149),
+  ('sentences -> sentence','sentences',1,'p_sentences_one','parser.py',155),
+  ('sentence -> comments wordlines NEWLINE','sentence',3,'p_sentence_with_comments','parser.py',160),
+  ('sentence -> wordlines NEWLINE','sentence',2,'p_sentence_without_comments','parser.py',165),
+  ('comments -> comments comment','comments',2,'p_comments_many','parser.py',170),
+  ('comments -> comment','comments',1,'p_comments_one','parser.py',176),
+  ('comment -> COMMENT NEWLINE','comment',2,'p_comment','parser.py',181),
+  ('wordlines -> wordlines wordline','wordlines',2,'p_wordlines_many','parser.py',186),
+  ('wordlines -> wordline','wordlines',1,'p_wordlines_one','parser.py',192),
+  ('wordline -> INTEGER_ID TAB FORM TAB LEMMA TAB UPOS TAB XPOS TAB FEATS TAB HEAD TAB DEPREL TAB DEPS TAB MISC NEWLINE','wordline',20,'p_wordline_word','parser.py',197),
+  ('wordline -> RANGE_ID TAB FORM TAB LEMMA TAB UPOS TAB XPOS TAB FEATS TAB HEAD TAB DEPREL TAB DEPS TAB MISC NEWLINE','wordline',20,'p_wordline_multiword','parser.py',214),
+  ('wordline -> DECIMAL_ID TAB FORM TAB LEMMA TAB UPOS TAB XPOS TAB FEATS TAB HEAD TAB DEPREL TAB DEPS TAB MISC NEWLINE','wordline',20,'p_wordline_emptynode','parser.py',229),
+]
@@ -0,0 +1,141 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing the building blocks of the error-tolerant parsing mode.
+
+Since nothing in the *CoNLL-U* grammar spans across the blank line which
+terminates a sentence, parsing can always resume at the next sentence block
+(see :mod:`.splitter`) after an error: the invalid block is skipped, and the
+error is recorded as a :class:`ErrorRecord`, keeping its absolute line and
+column numbers.
+"""
+
+from typing import Iterable, Iterator, Tuple, List, Callable, Optional, \
+    Union
+from colonel.sentence import Sentence
+from colonel.conllu.lexer import LexerError
+from colonel.conllu.parser import ParserError
+
+__all__ = ['ErrorRecord', 'parse_blocks']
+
+
+class ErrorRecord:
+    """An error encountered while parsing a sentence block, which has been
+    skipped.
+
+    :param error: the error raised while parsing (or decoding) the block
+    :param line_number: the number of the line where the error occurred
+    :param column_number: the column number, associated with ``line_number``,
+        where the error occurred, if known
+    """
+
+    __slots__ = ('error', 'line_number', 'column_number')
+
+    def __init__(
+            self,
+            error: Union[LexerError, ParserError, UnicodeDecodeError],
+            line_number: int,
+            column_number: Optional[int] = None
+    ) -> None:
+        #: The error raised while parsing (or decoding) the block
+        self.error: Union[LexerError, ParserError, UnicodeDecodeError] = error
+
+        #: The number of the line where the error occurred; for errors which
+        #: do not report any position, such as :class:`.IllegalEofError`,
+        #: it is the last line of the skipped block
+        self.line_number: int = line_number
+
+        #: The column number, associated with :attr:`line_number`, where the
+        #: error occurred; ``None`` for errors which only report a line
+        self.column_number: Optional[int] = column_number
+
+    @property
+    def message(self) -> str:
+        """The message of the error."""
+        return str(self.error)
+
+    def __repr__(self) -> str:
+        return (f'{type(self).__name__}({type(self.error).__name__}, '
+                f'line_number={self.line_number}, '
+                f'column_number={self.column_number})')
+
+    @classmethod
+    def from_error(
+            cls,
+            error: Union[LexerError, ParserError],
+            block: str,
+            line_number: int
+    ) -> 'ErrorRecord':
+        """Returns the record of a lexer or parser error raised while parsing
+        the given block, whose first line has the given number.
+        """
+        return cls(
+            error,
+            getattr(error, 'line_number', None) or
+            line_number + block.count('\n', 0, len(block) - 1),
+            getattr(error, 'column_number', None)
+        )
+
+    @classmethod
+    def from_decode_error(
+            cls,
+            error: UnicodeDecodeError,
+            line_number: int
+    ) -> 'ErrorRecord':
+        """Returns the record of an error raised while decoding a block of
+        encoded content, whose first line has the given number; the column
+        number counts the characters preceding the invalid bytes.
+        """
+        data = error.object
+        line_start = data.rfind(b'\n', 0, error.start) + 1
+        prefix = data[line_start:error.start].decode(error.encoding,
+                                                     errors='replace')
+        return cls(error, line_number + data.count(b'\n', 0, error.start),
+                   len(prefix) + 1)
+
+
+def parse_blocks(
+        blocks: Iterable[Tuple[int, Union[str, bytes]]],
+        parse_function: Callable[[str, int], List[Sentence]],
+        errors: List[ErrorRecord],
+        encoding: str = 'utf-8'
+) -> Iterator[Sentence]:
+    """Parses each sentence block on its own, yielding the sentences of the
+    valid ones and skipping the invalid ones.
+
+    :param blocks: pairs composed by the number of the first line of each
+        block and the block itself, either as a string or as encoded bytes
+    :param parse_function: a function parsing a string content given the
+        number of its first line
+    :param errors: the list where an :class:`ErrorRecord` is appended for
+        each skipped block
+    :param encoding: the encoding of the blocks given as bytes
+    """
+    for line_number, block in blocks:
+        if isinstance(block, bytes):
+            try:
+                block = block.decode(encoding)
+            except UnicodeDecodeError as error:
+                errors.append(
+                    ErrorRecord.from_decode_error(error, line_number))
+                continue
+
+        try:
+            sentences = parse_function(block, line_number)
+        except (LexerError, ParserError) as error:
+            errors.append(ErrorRecord.from_error(error, block, line_number))
+            continue
+
+        yield from sentences
@@ -0,0 +1,173 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing sentence elements which keep their original *CoNLL-U*
+line, writing it back verbatim until they are changed.
+
+Many pipelines read a treebank, change one field of some words, such as the
+``DEPREL`` predicted by a parser, and write the whole treebank back: most
+elements are serialized again exactly as they were read, formatting all their
+values, ``FEATS`` and ``DEPS`` included, only to get the same text again. The
+classes of this module, returned by :meth:`.FastParser.parse` when
+``keep_lines`` is enabled, keep the line they were parsed from, which
+:meth:`to_conllu` returns as it is; assigning a different value to any
+attribute discards the line, so that changed elements are formatted from
+their values as usual. Assigning an equal value, such as a ``DEPREL``
+predicted again with the same label, keeps the line.
+
+Only assignments are tracked: values changed in place, such as a list
+assigned to an attribute and then modified, are not noticed. Reading
+attributes costs the same as for the base classes.
+"""
+
+from typing import Optional, Any
+from colonel.emptynode import EmptyNode
+from colonel.multiword import Multiword
+from colonel.word import Word
+
+__all__ = ['SourceLineWord', 'SourceLineEmptyNode', 'SourceLineMultiword',
+           'NewWord', 'NewEmptyNode', 'NewMultiword', 'set_line']
+
+_set = object.__setattr__
+_UNSET = object()
+
+
+class _SourceLineMixin:
+    """Mixin for :class:`.BaseSentenceElement` subclasses, keeping the
+    original *CoNLL-U* line of the element until any attribute is assigned a
+    different value.
+
+    The concrete classes must define the ``_line`` slot.
+    """
+
+    __slots__ = ()
+
+    _line: Optional[str]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._line is not None:
+            current = getattr(self, name, _UNSET)
+            # pylint: disable=unidiomatic-typecheck
+            if type(current) is not type(value) or current != value:
+                _set(self, '_line', None)
+        _set(self, name, value)
+
+    def __setstate__(self, state: Any) -> None:
+        # the default pickling of objects with slots restores them through
+        # __setattr__, which would discard the line
+        _, slots = state
+        for name, value in slots.items():
+            _set(self, name, value)
+
+    @property
+    def source_line(self) -> Optional[str]:
+        """The original *CoNLL-U* line of the element, without the newline
+        character, or ``None`` if any attribute has been changed since then.
+        """
+        return self._line
+
+    def to_conllu(self) -> str:
+        """Returns the original *CoNLL-U* line of the element, if it is
+        unchanged, or a *CoNLL-U* formatted representation of its current
+        values otherwise (see :meth:`.BaseSentenceElement.to_conllu`).
+        """
+        line = self._line
+        if line is not None:
+            return line
+        # pylint: disable=no-member
+        return super(_SourceLineMixin, self).to_conllu()  # type: ignore
+
+
+class SourceLineWord(_SourceLineMixin, Word):
+    """A :class:`colonel.Word` which keeps its original *CoNLL-U* line, if
+    given, until any attribute is changed.
+    """
+
+    __slots__ = ('_line',)
+
+    def __init__(self, line: Optional[str] = None, **kwargs) -> None:
+        _set(self, '_line', None)
+        super(SourceLineWord, self).__init__(**kwargs)
+        _set(self, '_line', line)
+
+
+class SourceLineEmptyNode(_SourceLineMixin, EmptyNode):
+    """A :class:`colonel.EmptyNode` which keeps its original *CoNLL-U* line,
+    if given, until any attribute is changed.
+    """
+
+    __slots__ = ('_line',)
+
+    def __init__(self, line: Optional[str] = None, **kwargs) -> None:
+        _set(self, '_line', None)
+        super(SourceLineEmptyNode, self).__init__(**kwargs)
+        _set(self, '_line', line)
+
+
+class SourceLineMultiword(_SourceLineMixin, Multiword):
+    """A :class:`colonel.Multiword` which keeps its original *CoNLL-U* line,
+    if given, until any attribute is changed.
+    """
+
+    __slots__ = ('_line',)
+
+    def __init__(self, line: Optional[str] = None, **kwargs) -> None:
+        _set(self, '_line', None)
+        super(SourceLineMultiword, self).__init__(**kwargs)
+        _set(self, '_line', line)
+
+
+# The classes of the elements being built by FastParser: they have the same
+# layout of the classes above, without tracking assignments, so that their
+# slots can be filled at full speed; their class is switched by set_line().
+
+class NewWord(Word):  # pylint: disable=too-few-public-methods
+    """A word being built, which becomes a :class:`SourceLineWord` once
+    its line is set (see :func:`set_line`).
+    """
+
+    __slots__ = ('_line',)
+
+
+class NewEmptyNode(EmptyNode):  # pylint: disable=too-few-public-methods
+    """An empty node being built, which becomes a
+    :class:`SourceLineEmptyNode` once its line is set (see :func:`set_line`).
+    """
+
+    __slots__ = ('_line',)
+
+
+class NewMultiword(Multiword):  # pylint: disable=too-few-public-methods
+    """A multiword token being built, which becomes a
+    :class:`SourceLineMultiword` once its line is set (see :func:`set_line`).
+    """
+
+    __slots__ = ('_line',)
+
+
+_SOURCE_LINE_CLASSES = {
+    NewWord: SourceLineWord,
+    NewEmptyNode: SourceLineEmptyNode,
+    NewMultiword: SourceLineMultiword,
+}
+
+
+def set_line(element: Any, line: str) -> None:
+    """Sets the original line of a :class:`NewWord`, :class:`NewEmptyNode`
+    or :class:`NewMultiword` element, turning it into the related class of
+    this module.
+    """
+    element._line = line  # pylint: disable=protected-access
+    _set(element, '__class__', _SOURCE_LINE_CLASSES[type(element)])
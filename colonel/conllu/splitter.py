@@ -0,0 +1,183 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing functions for splitting *CoNLL-U* input into sentence
+blocks.
+
+A *sentence block* is the portion of *CoNLL-U* text going from the first
+comment or word line of a sentence up to and including the blank line which
+terminates it. Since the *CoNLL-U* grammar does not allow anything to span
+across that blank line, each block can be processed on its own, paired with
+the number of its first line, so that errors can still be reported with
+absolute positions.
+
+Blocks can be found among text lines (see :func:`split_lines`), within a
+whole string (see :func:`split_text`) or directly within a binary buffer,
+such as a memory-mapped file (see :func:`split_buffer`), so that only the
+bytes of each block need to be decoded.
+"""
+
+import re
+from mmap import mmap
+from typing import Iterable, Iterator, Tuple, IO, Union
+
+__all__ = ['iter_lines', 'split_lines', 'split_text', 'split_buffer',
+           'split_ranges']
+
+_BLANK_LINE = re.compile(b'\n\n')
+
+
+def iter_lines(
+        stream: Union[IO[str], IO[bytes]],
+        encoding: str = 'utf-8'
+) -> Iterator[str]:
+    """Yields the lines of a text or binary file object, one at a time.
+
+    Lines read from a binary stream are decoded with the given ``encoding``;
+    since a newline byte can never be part of a multi-byte *UTF-8* sequence,
+    decoding each line on its own is always safe.
+
+    :param stream: a file object opened in text or binary mode
+    :param encoding: the encoding used for decoding binary lines
+    """
+    for line in stream:
+        yield line.decode(encoding) if isinstance(line, bytes) else line
+
+
+def split_lines(
+        lines: Iterable[str],
+        line_number: int = 1
+) -> Iterator[Tuple[int, str]]:
+    """Groups a sequence of lines into sentence blocks.
+
+    Each yielded item is a pair composed by the line number of the first line
+    of the block and the text of the block itself. A block is closed by the
+    first blank line (``'\\n'``) encountered; any line left over at the end of
+    the input is yielded as a last, incomplete block, so that the parser can
+    report the proper error.
+
+    :param lines: the lines to group, each one including its trailing
+        newline character (except, possibly, the last one)
+    :param line_number: the number of the first line
+    """
+    block = []
+    start = line_number
+
+    for line in lines:
+        block.append(line)
+        line_number += 1
+        if line == '\n':
+            yield start, ''.join(block)
+            block = []
+            start = line_number
+
+    if block:
+        yield start, ''.join(block)
+
+
+def split_text(
+        content: str,
+        line_number: int = 1
+) -> Iterator[Tuple[int, str]]:
+    """Splits a *CoNLL-U* string content into sentence blocks.
+
+    Each yielded item is a pair composed by the line number of the first line
+    of the block and the text of the block itself, exactly as returned by
+    :func:`split_lines` for the lines of the content.
+
+    :param content: the *CoNLL-U* content
+    :param line_number: the number of the first line
+    """
+    position = 0
+    size = len(content)
+
+    while position < size:
+        if content[position] == '\n':
+            end = position + 1
+        else:
+            end = content.find('\n\n', position)
+            end = size if end < 0 else end + 2
+
+        block = content[position:end]
+        yield line_number, block
+
+        line_number += block.count('\n')
+        position = end
+
+
+def split_buffer(
+        buffer: Union[bytes, bytearray, memoryview, mmap],
+        line_number: int = 1
+) -> Iterator[Tuple[int, int, int]]:
+    """Finds the sentence blocks of an encoded *CoNLL-U* binary buffer.
+
+    Each yielded item is a tuple composed by the line number of the first
+    line of the block, and the start and end byte offsets of the block
+    within the buffer. The blocks are the same ones returned by
+    :func:`split_lines` for the decoded lines of the buffer, provided that
+    the encoding is *UTF-8* or any other one where a newline byte always
+    represents a newline character.
+
+    :param buffer: the encoded *CoNLL-U* content; a :class:`memoryview` must
+        be one-dimensional, with one byte items
+    :param line_number: the number of the first line
+    """
+    position = 0
+    size = len(buffer)
+
+    while position < size:
+        if buffer[position:position + 1] == b'\n':
+            end = position + 1
+        else:
+            match = _BLANK_LINE.search(buffer, position)
+            end = size if match is None else match.end()
+
+        yield line_number, position, end
+
+        line_number += bytes(buffer[position:end]).count(b'\n')
+        position = end
+
+
+def split_ranges(
+        buffer: Union[bytes, bytearray, memoryview, mmap],
+        size: int,
+        line_number: int = 1
+) -> Iterator[Tuple[int, int, int]]:
+    """Splits an encoded *CoNLL-U* binary buffer into ranges of whole
+    sentence blocks, each one of roughly the given size.
+
+    Each yielded item is a tuple composed by the line number of the first
+    line of the range, and the start and end byte offsets of the range
+    within the buffer. Each range ends at the first blank line found after
+    its first ``size`` bytes, so that it is composed by the same sentence
+    blocks returned by :func:`split_buffer` for the whole buffer; the last
+    range takes whatever is left.
+
+    :param buffer: the encoded *CoNLL-U* content; a :class:`memoryview` must
+        be one-dimensional, with one byte items
+    :param size: the minimum size of each range, in bytes
+    :param line_number: the number of the first line
+    """
+    position = 0
+    total = len(buffer)
+
+    while position < total:
+        match = _BLANK_LINE.search(buffer, position + max(size, 1) - 1)
+        end = total if match is None else match.end()
+
+        yield line_number, position, end
+
+        line_number += bytes(buffer[position:end]).count(b'\n')
+        position = end
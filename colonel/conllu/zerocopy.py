@@ -0,0 +1,427 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module providing sentence elements whose text fields are backed by the
+encoded source buffer, together with the :func:`parse_buffer` function
+returning them.
+
+A parsed treebank is mostly made of small strings: one for each ``FORM``,
+``LEMMA``, ``XPOS``, ``DEPREL`` and ``MISC`` value of every word, each one
+costing some tens of bytes on its own. For read-only processing of large
+files, especially memory-mapped ones, the elements of this module keep
+instead a reference to the buffer shared by the whole content, and the
+offset of their own line within it: each text field, as well as ``FEATS``
+and ``DEPS``, is decoded from the buffer every time the related attribute is
+read, without being stored. The other fields (``ID``, ``UPOS`` and
+``HEAD``) are small integers and shared constants, so they are stored as
+usual.
+
+The elements are fully compatible with :class:`colonel.Word` and
+:class:`colonel.EmptyNode`: assigning any attribute stores the given value,
+which is returned from then on. The buffer, and any memory-mapped file,
+is kept alive as long as any of its elements is, and it must not be
+changed meanwhile.
+"""
+
+import os
+from typing import List, Optional, Callable, Union, Dict, Any
+from mmap import mmap, ACCESS_READ
+from colonel.base_rich_sentence_element import BaseRichSentenceElement
+from colonel.base_sentence_element import BaseSentenceElement
+from colonel.conllu import fastparser
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.lexer import decode_feats, decode_deps
+from colonel.conllu.splitter import split_buffer
+from colonel.emptynode import EmptyNode
+from colonel.multiword import Multiword
+from colonel.sentence import Sentence
+from colonel.upostag import UposTag
+from colonel.word import Word
+
+__all__ = ['ZeroCopyWord', 'ZeroCopyEmptyNode', 'parse_buffer',
+           'parse_file']
+
+_new = object.__new__
+
+# Descriptors of the slots where the assigned values of the fields are
+# stored; they are shadowed by the properties below.
+_SLOTS: Dict[str, Any] = {
+    'form': BaseSentenceElement.__dict__['form'],
+    'misc': BaseSentenceElement.__dict__['misc'],
+    'lemma': BaseRichSentenceElement.__dict__['lemma'],
+    'xpos': BaseRichSentenceElement.__dict__['xpos'],
+    'feats': BaseRichSentenceElement.__dict__['feats'],
+    'deps': BaseRichSentenceElement.__dict__['deps'],
+    'deprel': Word.__dict__['deprel'],
+}
+
+
+class _Source:  # pylint: disable=too-few-public-methods
+    """The encoded buffer shared by the elements parsed from it."""
+
+    __slots__ = ('buffer', 'encoding')
+
+    def __init__(self, buffer: Union[bytes, mmap], encoding: str) -> None:
+        self.buffer: Union[bytes, mmap] = buffer
+        self.encoding: str = encoding
+
+
+def _identity(value: str) -> Optional[str]:
+    return value
+
+
+def _optional(value: str) -> Optional[str]:
+    return None if value == '_' else value
+
+
+def _decode_feats(value: str) -> Optional[Any]:
+    return None if value == '_' else decode_feats(value)
+
+
+def _decode_deps(value: str) -> Optional[Any]:
+    return None if value == '_' else decode_deps(value)
+
+
+class _BufferedField:  # pylint: disable=too-few-public-methods
+    """Descriptor reading the value of a field from the source buffer, until
+    a value is assigned to it.
+
+    :param name: the name of the attribute
+    :param column: the index of the field within the *CoNLL-U* line, which
+        is also the bit of the field in :attr:`_ZeroCopyMixin._buffered`
+    :param decode: the function converting the raw field value
+    :param doc: the docstring of the attribute
+    """
+
+    def __init__(
+            self,
+            name: str,
+            column: int,
+            decode: Callable[[str], Optional[Any]],
+            doc: str
+    ) -> None:
+        slot = _SLOTS[name]
+        self.get_slot = slot.__get__
+        self.set_slot = slot.__set__
+        self.column = column
+        self.flag = 1 << column
+        self.decode = decode
+        self.__doc__ = doc
+
+    def __get__(
+            self,
+            instance: Optional['_ZeroCopyMixin'],
+            owner: Optional[type] = None
+    ) -> Any:
+        if instance is None:
+            return self
+        if instance._buffered & self.flag:
+            return self.decode(instance._raw_field(self.column))
+        return self.get_slot(instance, owner)
+
+    def __set__(self, instance: '_ZeroCopyMixin', value: Any) -> None:
+        self.set_slot(instance, value)
+        instance._buffered &= ~self.flag  # type: ignore
+
+
+class _ZeroCopyMixin:  # pylint: disable=too-few-public-methods
+    """Mixin for :class:`.BaseRichSentenceElement` subclasses, replacing the
+    text attributes with properties which read their values from the source
+    buffer.
+
+    The concrete classes must define the ``_source``, ``_start`` and
+    ``_buffered`` slots, and the ``_BUFFERED_FIELDS`` flags.
+    """
+
+    # mypy can't tell that the slots are provided by the concrete classes,
+    # hence the "type: ignore" comments for each assignment below
+    __slots__ = ()
+
+    _source: Optional[_Source]
+    _start: int
+    _buffered: int
+
+    #: The flags of all the fields read from the buffer
+    _BUFFERED_FIELDS: int = 0
+
+    def _raw_field(self, column: int) -> str:
+        """Returns the raw value of a field, decoded from the buffer."""
+        source: _Source = self._source  # type: ignore
+        buffer = source.buffer
+        start = self._start
+        line = str(buffer[start:buffer.find(b'\n', start)], source.encoding)
+        return line.split('\t', column + 1)[column]
+
+    @property
+    def is_buffered(self) -> bool:
+        """Whether or not any field is still read from the source buffer."""
+        return bool(self._buffered)
+
+    form = _BufferedField(
+        'form', 1, _identity,
+        'Word form (see :attr:`.BaseSentenceElement.form`).')
+    lemma = _BufferedField(
+        'lemma', 2, _identity,
+        'Lemma (see :attr:`.BaseRichSentenceElement.lemma`).')
+    xpos = _BufferedField(
+        'xpos', 4, _optional,
+        'Language-specific part-of-speech tag (see '
+        ':attr:`.BaseRichSentenceElement.xpos`).')
+    feats = _BufferedField(
+        'feats', 5, _decode_feats,
+        'Morphological features (see '
+        ':attr:`.BaseRichSentenceElement.feats`), decoded on each access.')
+    deps = _BufferedField(
+        'deps', 8, _decode_deps,
+        'Enhanced dependency graph (see '
+        ':attr:`.BaseRichSentenceElement.deps`), decoded on each access.')
+    misc = _BufferedField(
+        'misc', 9, _optional,
+        'Any other annotation (see :attr:`.BaseSentenceElement.misc`).')
+
+    def _feats_to_conllu(self) -> str:
+        """Returns a *CoNLL-U*-compatible representation of :attr:`feats`,
+        without decoding a buffered value (see
+        :meth:`.BaseRichSentenceElement._feats_to_conllu`).
+        """
+        if self._buffered & (1 << 5):
+            return self._raw_field(5)
+        # pylint: disable=no-member
+        return super(_ZeroCopyMixin, self)._feats_to_conllu()  # type: ignore
+
+    def _deps_to_conllu(self) -> str:
+        """Returns a *CoNLL-U*-compatible representation of :attr:`deps`,
+        without decoding a buffered value (see
+        :meth:`.BaseRichSentenceElement._deps_to_conllu`).
+        """
+        if self._buffered & (1 << 8):
+            return self._raw_field(8)
+        # pylint: disable=no-member
+        return super(_ZeroCopyMixin, self)._deps_to_conllu()  # type: ignore
+
+
+class ZeroCopyWord(_ZeroCopyMixin, Word):  # type: ignore
+    """A :class:`colonel.Word` whose text fields, ``FEATS`` and ``DEPS`` are
+    read from the source buffer on each access, as long as no other value is
+    assigned to them.
+
+    Words built with this constructor are not backed by any buffer, and
+    behave exactly as :class:`colonel.Word` objects.
+    """
+
+    __slots__ = ('_source', '_start', '_buffered')
+
+    _BUFFERED_FIELDS = 0b1110110110
+
+    deprel = _BufferedField(
+        'deprel', 7, _optional,
+        'Universal dependency relation (see :attr:`colonel.Word.deprel`).')
+
+    def __init__(self, **kwargs) -> None:
+        self._source = None
+        self._start = 0
+        self._buffered = 0
+        super(ZeroCopyWord, self).__init__(**kwargs)
+
+
+class ZeroCopyEmptyNode(_ZeroCopyMixin, EmptyNode):  # type: ignore
+    """A :class:`colonel.EmptyNode` whose text fields, ``FEATS`` and ``DEPS``
+    are read from the source buffer on each access, as long as no other
+    value is assigned to them.
+
+    Empty nodes built with this constructor are not backed by any buffer,
+    and behave exactly as :class:`colonel.EmptyNode` objects.
+    """
+
+    __slots__ = ('_source', '_start', '_buffered')
+
+    _BUFFERED_FIELDS = 0b1100110110
+
+    def __init__(self, **kwargs) -> None:
+        self._source = None
+        self._start = 0
+        self._buffered = 0
+        super(ZeroCopyEmptyNode, self).__init__(**kwargs)
+
+
+def _new_word(
+        index: int,
+        upos: Optional[UposTag],
+        head: Optional[int],
+        **_fields: Any
+) -> ZeroCopyWord:
+    """Returns a new buffered word, without calling its constructor: the
+    slots of the buffered fields are left empty, and the source buffer is
+    assigned later on.
+    """
+    # pylint: disable=protected-access
+    word = _new(ZeroCopyWord)
+    word.index = index
+    word.upos = upos
+    word.head = head
+    word._buffered = ZeroCopyWord._BUFFERED_FIELDS
+    return word
+
+
+def _new_empty_node(
+        main_index: int,
+        sub_index: int,
+        upos: Optional[UposTag],
+        **_fields: Any
+) -> ZeroCopyEmptyNode:
+    """Returns a new buffered empty node, as :func:`_new_word` does."""
+    # pylint: disable=protected-access
+    node = _new(ZeroCopyEmptyNode)
+    node.main_index = main_index
+    node.sub_index = sub_index
+    node.upos = upos
+    node._buffered = ZeroCopyEmptyNode._BUFFERED_FIELDS
+    return node
+
+
+# Builders of FastParser (see fastparser._BUILDERS): the text values are
+# only validated, and never stored, except for the rare multiword tokens.
+# pylint: disable=protected-access
+_ZERO_COPY_BUILDERS = (fastparser._validate_feats, fastparser._validate_deps,
+                       _new_word, _new_empty_node, Multiword)
+# pylint: enable=protected-access
+
+
+def parse_buffer(
+        buffer: Union[bytes, mmap],
+        encoding: str = 'utf-8',
+        line_number: int = 1,
+        parser: Optional[FastParser] = None,
+        where: Optional[Callable[[List[str]], bool]] = None
+) -> List[Sentence]:
+    """Parses an encoded *CoNLL-U* buffer, returning a list of sentences
+    whose words and empty nodes are :class:`ZeroCopyWord` and
+    :class:`ZeroCopyEmptyNode` objects backed by the buffer.
+
+    Each sentence block (see :func:`.splitter.split_buffer`) is decoded and
+    validated as :meth:`.FastParser.parse` does, raising the same errors,
+    with absolute line and column numbers; the decoded text is discarded as
+    soon as the elements have been built. Multiword tokens, which are rare,
+    are returned as usual :class:`colonel.Multiword` objects.
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+
+    :param buffer: the encoded *CoNLL-U* content, which must not change as
+        long as any of the returned elements is in use
+    :param encoding: the encoding of the content; it must be *UTF-8* or any
+        other one where a newline byte always represents a newline character
+    :param line_number: the line number of the first line of the buffer
+    :param parser: the parser instance used for reporting errors; by
+        default, a new :class:`.FastParser`
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments (see :meth:`.FastParser.parse`)
+    :return: list of parsed :class:`colonel.Sentence` items
+    """
+    # pylint: disable=protected-access
+    if parser is None:
+        parser = FastParser()
+    if not buffer:
+        return parser.parse('')
+
+    source = _Source(buffer, encoding)
+    sentences: List[Sentence] = []
+
+    for line_number, start, end in split_buffer(buffer, line_number):
+        content = str(buffer[start:end], encoding)
+        lines = content.split('\n')
+
+        # any block not terminated by a blank line, or starting with one, is
+        # invalid, and makes the parser raise the related error
+        if len(lines) < 3 or lines[-2] or not lines[0]:
+            sentences.extend(parser.parse(content, line_number))
+            continue
+
+        del lines[-2:]
+        comments_count = 0
+        words_start = 0
+        while comments_count < len(lines) and \
+                lines[comments_count][0] == '#':
+            words_start += len(lines[comments_count]) + 1
+            comments_count += 1
+
+        # as done by FastParser, blocks not composed by comment lines
+        # followed by word lines are rejected before calling where, so that
+        # invalid input always raises the related error
+        if comments_count == len(lines) or \
+                content.find('\n#', words_start) >= 0:
+            sentences.extend(parser.parse(content, line_number))
+            continue
+
+        if where is not None and \
+                not where([line[1:].strip()
+                           for line in lines[:comments_count]]):
+            continue
+
+        sentence = parser.build_sentence(lines, _ZERO_COPY_BUILDERS)
+        if sentence is None:
+            sentences.extend(parser.parse(content, line_number))
+            continue
+
+        position = start
+        for _ in range(comments_count):
+            position = buffer.find(b'\n', position) + 1
+        for element in sentence.elements:
+            if isinstance(element, _ZeroCopyMixin):
+                element._source = source
+                element._start = position
+            position = buffer.find(b'\n', position) + 1
+
+        sentences.append(sentence)
+
+    return sentences
+
+
+def parse_file(
+        path: Union[str, os.PathLike],
+        encoding: str = 'utf-8',
+        parser: Optional[FastParser] = None,
+        where: Optional[Callable[[List[str]], bool]] = None
+) -> List[Sentence]:
+    """Parses a *CoNLL-U* file with :func:`parse_buffer`, memory-mapping it.
+
+    The file stays mapped as long as any of the returned elements is in
+    use, and it must not be modified meanwhile.
+
+    :raise lexer.LexerError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* lexer
+    :raise parser.ParserError: (any specific subclass) in case of invalid input
+        breaking the rules of the *CoNLL-U* parser
+
+    :param path: the path of the *CoNLL-U* file
+    :param encoding: the encoding of the file (see :func:`parse_buffer`)
+    :param parser: the parser instance used for reporting errors; by
+        default, a new :class:`.FastParser`
+    :param where: a function returning whether or not a sentence should be
+        parsed, given its comments (see :meth:`.FastParser.parse`)
+    :return: list of parsed :class:`colonel.Sentence` items
+    """
+    with open(path, 'rb') as file:
+        buffer: Union[bytes, mmap] = b''
+        if os.fstat(file.fileno()).st_size > 0:
+            buffer = mmap(file.fileno(), 0, access=ACCESS_READ)
+    try:
+        return parse_buffer(buffer, encoding, parser=parser, where=where)
+    except BaseException:
+        if isinstance(buffer, mmap):
+            buffer.close()
+        raise
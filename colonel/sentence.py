@@ -15,7 +15,8 @@
 
 """Module providing the :class:`colonel.Sentence` class."""
 
-from typing import Optional, List, Iterator, Union
+from typing import Optional, List, Iterator, Union, Any
+from colonel._packing import pack_sentence, unpack_sentence
 from colonel.base_sentence_element import BaseSentenceElement
 from colonel.word import Word
 from colonel.emptynode import EmptyNode
@@ -280,6 +281,67 @@ class Sentence:
         elements and values not compatible with *CoNLL-U* format could lead to
         an incorrect output value or raising of exceptions.
         """
-        comments = ''.join(f'# {c}\n' for c in self.comments or [])
-        word_lines = ''.join(f'{e.to_conllu()}\n' for e in self.elements)
-        return f'{comments}{word_lines}\n'
+        # one join of all the lines, followed by the terminating blank line
+        lines = [f'# {c}' for c in self.comments or []]
+        lines.extend([e.to_conllu() for e in self.elements])
+        lines.append('\n')
+        return '\n'.join(lines)
+
+    def __reduce_ex__(self, protocol: Any) -> Union[str, tuple]:
+        # Sentences are pickled as one positional tuple, holding the classes
+        # of the elements and the values of all their slots (see
+        # colonel._packing), instead of pickling each element with the names
+        # of its slots; objects with attributes outside of __slots__, such
+        # as lazy sentences, are pickled the default way.
+        try:
+            return unpack_sentence, pack_sentence(self)
+        except (TypeError, AttributeError):
+            return super(Sentence, self).__reduce_ex__(protocol)
+
+    def __copy__(self) -> 'Sentence':
+        # Shallow copies keep sharing the lists of elements and comments, as
+        # the default copy protocol does, instead of rebuilding the elements
+        # through the pickling representation.
+        cls = type(self)
+        result = cls.__new__(cls)
+        for klass in cls.__mro__:
+            for name in klass.__dict__.get('__slots__', ()):
+                descriptor = klass.__dict__[name]
+                try:
+                    descriptor.__set__(result, descriptor.__get__(self, cls))
+                except AttributeError:
+                    pass
+        if hasattr(self, '__dict__'):
+            result.__dict__.update(self.__dict__)
+        return result
+
+    @classmethod
+    def from_conllu(cls, content: str, line_number: int = 1) -> 'Sentence':
+        """Returns a new sentence parsed from its *CoNLL-U* formatted
+        representation, the counterpart of :meth:`to_conllu`.
+
+        The content must contain exactly one sentence; its terminating blank
+        line, or just the final newline, can be omitted.
+
+        This is meant for parsing one sentence at a time, such as one per
+        request in online services, with the lowest possible latency (see
+        :func:`colonel.conllu.parse_sentence`).
+
+        :raise colonel.conllu.lexer.LexerError: (any specific subclass) in
+            case of invalid input breaking the rules of the *CoNLL-U* lexer
+        :raise colonel.conllu.parser.ParserError: (any specific subclass) in
+            case of invalid input breaking the rules of the *CoNLL-U* parser
+        :raise ValueError: if the content is empty, or if it contains more
+            than one sentence
+
+        :param content: *CoNLL-U* formatted string of one sentence
+        :param line_number: the line number of the first line of ``content``,
+            useful when it is a fragment of a larger input, so that errors
+            can still report absolute positions
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from colonel.conllu import parse_sentence
+
+        sentence = parse_sentence(content, line_number)
+        return sentence if cls is Sentence else \
+            cls(sentence.elements, sentence.comments)
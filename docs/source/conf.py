@@ -16,6 +16,8 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath('../..'))
 
+from colonel import __version__  # noqa: E402
+
 
 # -- Project information -----------------------------------------------------
 
@@ -26,7 +28,7 @@ author = 'The NLP Odyssey Authors'
 # The short X.Y version
 version = ''
 # The full version, including alpha/beta/rc tags
-release = '2.0.1'
+release = __version__
 
 
 # -- General configuration ---------------------------------------------------
@@ -21,9 +21,14 @@ base_path = path.abspath(path.dirname(__file__))
 with open(path.join(base_path, 'README.rst'), encoding='utf-8') as f:
     long_description = f.read()
 
+about = {}
+with open(path.join(base_path, 'colonel', '_version.py'),
+          encoding='utf-8') as f:
+    exec(f.read(), about)
+
 setup(
     name='colonel',
-    version='2.0.1',
+    version=about['__version__'],
     license='Apache-2.0',
     description='A Python 3 library for handling CoNLL data formats',
     long_description=long_description,
@@ -48,7 +53,8 @@ setup(
         'Topic :: Utilities'
     ],
     keywords='conll conllu dependency parsing',
-    packages=find_packages(exclude=['tests', 'tests.*']),
+    packages=find_packages(
+        exclude=['tests', 'tests.*', 'benchmarks', 'benchmarks.*']),
     package_data={'colonel': ['py.typed']},
     zip_safe=False,
     python_requires='>=3.7, <4',
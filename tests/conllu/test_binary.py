@@ -0,0 +1,245 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import io
+import os
+import struct
+import tempfile
+import unittest
+from colonel.conllu import parse, to_conllu
+from colonel.conllu.binary import write_corpus, save_corpus, load_corpus, \
+    CorpusReader, InvalidCorpusError
+from colonel.emptynode import EmptyNode
+from colonel.multiword import Multiword
+from colonel.sentence import Sentence
+from colonel.upostag import UposTag
+from colonel.word import Word
+
+_CONTENT = '# sent_id = 1\n' \
+           '# text = Foobar\n' \
+           '1-2\tFoobar\t_\t_\t_\t_\t_\t_\t_\tSpaceAfter=No\n' \
+           '1\tFoo\tfoo\tNOUN\tNN\tA=B|C=D,E\t0\troot\t0:root\t_\n' \
+           '2\tbar\t_\tVERB\t_\t_\t1\tobj\t1:obj|3:conj\t_\n' \
+           '2.1\tBaz\t_\t_\t_\t_\t_\t_\t1:dep\t_\n' \
+           '\n' \
+           '1\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+           '\n' \
+           '# sent_id = 3\n' \
+           '1\tFoo\tfoo\tNOUN\t_\tA=B\t0\troot\t_\tFoo=Bar\n' \
+           '\n'
+
+
+class TestCorpus(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        sentences = parse(_CONTENT)
+        self.assertEqual(3, save_corpus(sentences, self.path))
+        result = load_corpus(self.path)
+
+        self.assertEqual(_CONTENT, to_conllu(result))
+        self.assertEqual(
+            [[type(element) for element in sentence.elements]
+             for sentence in sentences],
+            [[type(element) for element in sentence.elements]
+             for sentence in result]
+        )
+
+        word = result[0].elements[1]
+        self.assertIs(UposTag.NOUN, word.upos)
+        self.assertEqual((('A', ('B',)), ('C', ('D', 'E'))), word.feats)
+        self.assertEqual(((0, 'root'),), word.deps)
+        self.assertEqual(0, word.head)
+
+    def test_values_are_shared(self):
+        result = load_corpus(self._save(parse(_CONTENT)))
+        first = result[0].elements[1]
+        last = result[2].elements[0]
+
+        self.assertIs(first.lemma, last.lemma)
+        self.assertIs(first.deprel, last.deprel)
+
+    def test_missing_values(self):
+        sentence = Sentence(elements=[
+            Word(), EmptyNode(), Multiword(),
+            Word(index=-5, head=2 ** 31 - 1, misc='Foo')
+        ])
+        result = load_corpus(self._save([sentence]))[0]
+
+        for element, restored in zip(sentence.elements, result.elements):
+            for name in ('index', 'head', 'deprel', 'main_index',
+                         'sub_index', 'first_index', 'last_index', 'form',
+                         'lemma', 'upos', 'xpos', 'feats', 'deps', 'misc'):
+                self.assertEqual(getattr(element, name, None),
+                                 getattr(restored, name, None))
+
+    def test_empty_sentences(self):
+        self.assertEqual([], load_corpus(self._save([])))
+
+        result = load_corpus(self._save([Sentence(comments=['Foo']),
+                                         Sentence()]))
+        self.assertEqual([['Foo'], []], [s.comments for s in result])
+        self.assertEqual([[], []], [s.elements for s in result])
+
+    def test_other_element_variants(self):
+        for options in ({'lazy_fields': True}, {'keep_lines': True},
+                        {'lazy': True}):
+            with self.subTest(**options):
+                result = load_corpus(self._save(parse(_CONTENT, **options)))
+                self.assertEqual(_CONTENT, to_conllu(result))
+                self.assertIs(Word, type(result[0].elements[1]))
+
+    def test_write_to_stream(self):
+        stream = io.BytesIO()
+        self.assertEqual(3, write_corpus(iter(parse(_CONTENT)), stream))
+
+        with open(self.path, 'wb') as file:
+            file.write(stream.getvalue())
+        self.assertEqual(_CONTENT, to_conllu(load_corpus(self.path)))
+
+    def test_invalid_elements(self):
+        with self.assertRaises(TypeError):
+            write_corpus([Sentence(elements=[object()])], io.BytesIO())
+        with self.assertRaises(ValueError):
+            write_corpus([Sentence(elements=[Word(upos='NOUN')])],
+                         io.BytesIO())
+        with self.assertRaises(ValueError):
+            write_corpus([Sentence(elements=[Word(index=2 ** 31)])],
+                         io.BytesIO())
+        with self.assertRaises(ValueError):
+            write_corpus([Sentence(elements=[Word(misc=1.5)])], io.BytesIO())
+
+    def test_failed_save_leaves_no_files(self):
+        with self.assertRaises(TypeError):
+            save_corpus([Sentence(elements=[object()])], self.path)
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_invalid_files(self):
+        data = open(self._save(parse(_CONTENT)), 'rb').read()
+
+        for content in (b'', b'Foo' * 100, data[:-1], data[1:],
+                        data[:8] + data[12:]):
+            with open(self.path, 'wb') as file:
+                file.write(content)
+            with self.assertRaises(InvalidCorpusError):
+                load_corpus(self.path)
+            with self.assertRaises(InvalidCorpusError):
+                CorpusReader(self.path)
+
+    def test_invalid_value_tables(self):
+        data = open(self._save(parse(_CONTENT)), 'rb').read()
+        table_size = struct.unpack_from('<Q', data, len(data) - 16)[0]
+        table_start = len(data) - 48 - table_size
+
+        for position, value in ((table_start, b'x'),
+                                (table_start + 2, b'\xff'),
+                                (table_start + 2, b'\x7f')):
+            content = bytearray(data)
+            content[position:position + 1] = value
+            with open(self.path, 'wb') as file:
+                file.write(content)
+            with self.assertRaises(InvalidCorpusError):
+                load_corpus(self.path)
+
+    def test_invalid_rows(self):
+        data = bytearray(open(self._save(parse(_CONTENT)), 'rb').read())
+        # The form of the first element refers to a missing value
+        data[8 + 16:8 + 20] = struct.pack('<i', 10 ** 6)
+        with open(self.path, 'wb') as file:
+            file.write(data)
+
+        with self.assertRaises(InvalidCorpusError):
+            load_corpus(self.path)
+        with CorpusReader(self.path) as reader:
+            with self.assertRaises(InvalidCorpusError):
+                reader[0]  # pylint: disable=pointless-statement
+            self.assertEqual(1, len(reader[1].elements))
+
+    def test_load_restores_the_garbage_collector_state(self):
+        self._save(parse(_CONTENT))
+
+        self.assertTrue(gc.isenabled())
+        load_corpus(self.path)
+        self.assertTrue(gc.isenabled())
+
+        gc.disable()
+        try:
+            load_corpus(self.path)
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
+
+    def _save(self, sentences):
+        save_corpus(sentences, self.path)
+        return self.path
+
+
+class TestCorpusReader(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.bin')
+        self.sentences = parse(_CONTENT) * 4
+        save_corpus(self.sentences, self.path)
+        self.expected = [s.to_conllu() for s in self.sentences]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_item(self):
+        with CorpusReader(self.path) as reader:
+            self.assertEqual(12, len(reader))
+            self.assertEqual(self.expected[0], reader[0].to_conllu())
+            self.assertEqual(self.expected[4], reader[4].to_conllu())
+            self.assertEqual(self.expected[-1], reader[-1].to_conllu())
+            self.assertIsNot(reader[1], reader[1])
+
+            for index in (12, -13):
+                with self.assertRaises(IndexError):
+                    reader[index]  # pylint: disable=pointless-statement
+
+    def test_slices_and_take(self):
+        with CorpusReader(self.path) as reader:
+            self.assertEqual(self.expected[2:7],
+                             [s.to_conllu() for s in reader[2:7]])
+            self.assertEqual(self.expected[::-3],
+                             [s.to_conllu() for s in reader[::-3]])
+            self.assertEqual([], reader[7:2])
+            self.assertEqual([self.expected[5], self.expected[1]],
+                             [s.to_conllu() for s in reader.take([5, 1])])
+
+    def test_iteration(self):
+        with CorpusReader(self.path) as reader:
+            self.assertEqual(self.expected,
+                             [s.to_conllu() for s in reader])
+
+    def test_close_with_pending_iteration(self):
+        reader = CorpusReader(self.path)
+        iterator = iter(reader)
+        next(iterator)
+        reader.close()
+
+    def test_empty_corpus(self):
+        save_corpus([], self.path)
+        with CorpusReader(self.path) as reader:
+            self.assertEqual(0, len(reader))
+            self.assertEqual([], list(reader))
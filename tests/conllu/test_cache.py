@@ -0,0 +1,243 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from unittest.mock import patch
+from colonel.conllu import parse_file, parse_parallel, to_conllu
+from colonel.conllu.cache import ParseCache
+from colonel.sentence import Sentence
+
+_CONTENT = '# sent_id = 1\n' \
+           '1\tFoo\tfoo\tNOUN\t_\tA=B\t0\troot\t0:root\t_\n' \
+           '2\tbar\t_\t_\t_\t_\t1\tobj\t_\t_\n' \
+           '\n' \
+           '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+           '\n'
+
+
+class TemporaryCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.conllu')
+        self.cache_path = os.path.join(self.directory.name, 'cache')
+        self.cache = ParseCache(self.cache_path)
+        self.write(_CONTENT)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, content: str, path=None):
+        with open(path or self.path, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def entries(self):
+        return sorted(os.listdir(self.cache_path))
+
+
+class TestParseCache(TemporaryCacheTestCase):
+
+    def test_load_and_store(self):
+        key = self.cache.key(self.path)
+        self.assertIsNone(self.cache.load(key))
+
+        self.cache.store(key, parse_file(self.path))
+        self.assertEqual([key + '.bin'], self.entries())
+        self.assertEqual(_CONTENT, to_conllu(self.cache.load(key)))
+
+    def test_key_depends_on_file_and_options(self):
+        key = self.cache.key(self.path)
+
+        self.assertEqual(key, self.cache.key(self.path))
+        self.assertNotEqual(key, self.cache.key(self.path, 'latin-1'))
+        self.assertNotEqual(key, self.cache.key(self.path, fields=['form']))
+        self.assertNotEqual(key, self.cache.key(self.path, fields=[]))
+        self.assertEqual(self.cache.key(self.path, fields=['form', 'upos']),
+                         self.cache.key(self.path, fields=['upos', 'form']))
+
+        with patch('colonel.conllu.cache.__version__', '0.0.0'):
+            self.assertNotEqual(key, self.cache.key(self.path))
+
+        self.write(_CONTENT + _CONTENT)
+        self.assertNotEqual(key, self.cache.key(self.path))
+
+    def test_key_depends_on_modification_time(self):
+        key = self.cache.key(self.path)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertNotEqual(key, self.cache.key(self.path))
+
+    def test_key_with_hash_content(self):
+        cache = ParseCache(self.cache_path, hash_content=True)
+        other_path = os.path.join(self.directory.name, 'other.conllu')
+        self.write(_CONTENT, other_path)
+        key = cache.key(self.path)
+
+        self.assertEqual(key, cache.key(other_path))
+        self.assertNotEqual(key, self.cache.key(self.path))
+
+        self.write(_CONTENT.replace('Baz', 'Qux'), other_path)
+        self.assertNotEqual(key, cache.key(other_path))
+
+    def test_invalid_entries_are_removed(self):
+        key = self.cache.key(self.path)
+        with open(os.path.join(self.cache_path, key + '.bin'), 'wb') as file:
+            file.write(b'Foo')
+
+        self.assertIsNone(self.cache.load(key))
+        self.assertEqual([], self.entries())
+
+    def test_least_recently_used_entries_are_evicted(self):
+        sentences = parse_file(self.path)
+        self.cache.store('a', sentences)
+        entry_size = self.cache.size
+
+        cache = ParseCache(self.cache_path, max_size=2 * entry_size)
+        cache.store('b', sentences)
+        past = time.time() - 60
+        os.utime(os.path.join(self.cache_path, 'a.bin'), (past, past))
+        os.utime(os.path.join(self.cache_path, 'b.bin'),
+                 (past - 60, past - 60))
+
+        self.assertIsNotNone(cache.load('b'))  # refreshed
+        cache.store('c', sentences)
+
+        self.assertEqual(['b.bin', 'c.bin'], self.entries())
+        self.assertEqual(2 * entry_size, cache.size)
+
+    def test_stale_temporary_files_are_removed(self):
+        stale = os.path.join(self.cache_path, 'stale.tmp')
+        recent = os.path.join(self.cache_path, 'recent.tmp')
+        for path in (stale, recent):
+            self.write('', path)
+        past = time.time() - 7200
+        os.utime(stale, (past, past))
+
+        self.cache.evict(2 ** 30)
+        self.assertEqual(['recent.tmp'], self.entries())
+
+    def test_clear(self):
+        self.cache.store('a', parse_file(self.path))
+        self.cache.clear()
+        self.assertEqual([], self.entries())
+        self.assertEqual(0, self.cache.size)
+
+    def test_failed_store_leaves_no_files(self):
+        with self.assertRaises(TypeError):
+            self.cache.store('a', [Sentence(elements=[object()])])
+        self.assertEqual([], self.entries())
+
+    def test_concurrent_stores(self):
+        sentences = parse_file(self.path)
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(self.cache.store, ['a'] * 8, [sentences] * 8))
+
+        self.assertEqual(['a.bin'], self.entries())
+        self.assertEqual(_CONTENT, to_conllu(self.cache.load('a')))
+
+    def test_fetch(self):
+        calls = []
+
+        def parse_function():
+            calls.append(None)
+            return parse_file(self.path)
+
+        for _ in range(2):
+            sentences = self.cache.fetch(self.path, parse_function)
+            self.assertEqual(_CONTENT, to_conllu(sentences))
+        self.assertEqual(1, len(calls))
+
+        with self.assertRaises(ValueError):
+            self.cache.fetch(self.path, parse_function, lazy=True)
+        with self.assertRaises(ValueError):
+            self.cache.fetch(self.path, parse_function, engine='ply',
+                             fields=['form'])
+        self.cache.fetch(self.path, parse_function, lazy=False, where=None)
+        self.assertEqual(1, len(calls))
+
+    def test_fetch_fields_from_a_generator(self):
+        calls = []
+
+        def parse_function():
+            calls.append(None)
+            return parse_file(self.path, fields=['form'])
+
+        self.cache.fetch(self.path, parse_function,
+                         fields=(name for name in ['form']))
+        self.cache.fetch(self.path, parse_function, fields=['form'])
+        self.assertEqual(1, len(calls))
+
+
+class TestCachedParsing(TemporaryCacheTestCase):
+
+    def test_parse_file(self):
+        self.assertEqual(_CONTENT,
+                         to_conllu(parse_file(self.path, cache=self.cache)))
+        self.assertEqual(1, len(self.entries()))
+
+        with patch('colonel.conllu.engines.parse_buffer') as parse_buffer:
+            result = parse_file(self.path, cache=self.cache)
+        parse_buffer.assert_not_called()
+        self.assertEqual(_CONTENT, to_conllu(result))
+
+    def test_parse_file_after_changes(self):
+        parse_file(self.path, cache=self.cache)
+        self.write(_CONTENT.replace('Baz', 'Qux'))
+
+        result = parse_file(self.path, cache=self.cache)
+        self.assertEqual('Qux', result[1].elements[0].form)
+
+    def test_parse_file_with_fields(self):
+        parse_file(self.path, cache=self.cache)
+        result = parse_file(self.path, fields=['form'], cache=self.cache)
+
+        self.assertIsNone(result[0].elements[0].lemma)
+        self.assertEqual(2, len(self.entries()))
+
+    def test_fields_from_iterators(self):
+        for parse in (parse_file, partial(parse_parallel, workers=1)):
+            with self.subTest(parse=parse):
+                self.cache.clear()
+                for _ in range(2):
+                    result = parse(self.path,
+                                   fields=(name for name in ['form']),
+                                   cache=self.cache)
+                    self.assertEqual('Foo', result[0].elements[0].form)
+                    self.assertIsNone(result[0].elements[0].lemma)
+
+    def test_parse_parallel(self):
+        result = parse_parallel(self.path, workers=1, cache=self.cache)
+        self.assertEqual(_CONTENT, to_conllu(result))
+        self.assertEqual(_CONTENT,
+                         to_conllu(parse_file(self.path, cache=self.cache)))
+        self.assertEqual(1, len(self.entries()))
+
+    def test_unsupported_options(self):
+        for options in ({'lazy': True}, {'lazy_fields': True},
+                        {'where': bool}, {'zero_copy': True},
+                        {'keep_lines': True}):
+            with self.subTest(**options):
+                with self.assertRaises(ValueError):
+                    parse_file(self.path, cache=self.cache, **options)
+
+        with self.assertRaises(ValueError):
+            parse_file(self.path, engine='ply', fields=['form'],
+                       cache=self.cache)
+        self.assertEqual([], self.entries())
@@ -0,0 +1,610 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+from typing import List
+from unittest.mock import patch
+from colonel.conllu.fastparser import FastParser, FIELDS
+from colonel.conllu.lazyfields import LazyFieldsWord, LazyFieldsEmptyNode
+from colonel.conllu.lazysentence import LazySentence
+from colonel.conllu.lexer import IllegalCharacterError
+from colonel.conllu.parser import Parser, IllegalEofError
+from colonel.conllu.sourcelines import SourceLineWord, SourceLineEmptyNode, \
+    SourceLineMultiword
+from colonel.sentence import Sentence
+from colonel.upostag import UposTag
+from colonel.word import Word
+from colonel.emptynode import EmptyNode
+from colonel.multiword import Multiword
+
+# A valid document, making use of all kinds of lines and field values
+DOCUMENT = '# newdoc id = doc1\n' \
+           '# sent_id = 1\n' \
+           '#text = Foo bar!\n' \
+           '1-2\tFoobar\t_\t_\t_\t_\t_\t_\t_\tSpaceAfter=No\n' \
+           '1\tFoo\tfoo\tNOUN\tNN\tNumber=Sing\t0\troot\t0:root\t_\n' \
+           '2\tbar\tbar bar\tVERB\t_\tMood=Ind|Tense=Past,Pres' \
+           '\t1\tobl:tmod\t1:obl:tmod|3:conj\t_\n' \
+           '2.1\tbaz\t_\tX\t_\tAbbr[psor]=Yes\t_\t_\t2:ref\tFoo=Bar\n' \
+           '3\t!\t!\tPUNCT\t.\t_\t1\tpunct\t_\t_\n' \
+           '\n' \
+           '0.1\tQux\tqux\t_\tXX\t_\t_\t_\t_\t_\n' \
+           '1\tQuux\t_\tPROPN\t_\t_\t10\t_\t_\t_\n' \
+           '\n'
+
+# Hand-written samples, covering most of the lexer and parser rules
+CORPUS = [
+    DOCUMENT,
+    '',
+    '\n',
+    '\n\n',
+    '# Foo\n',
+    '# Foo\n\n',
+    '# Foo',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n1\tBar\t_\t_\t_\t_\t_\t_\t_\t_',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n# Bar\n\n',
+    '\n1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    ' \n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\r\n\r\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\r\n\n',
+    '# Foo\r\n1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '#\n1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t\n\n',
+    '1\t\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '0\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '01\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '10\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1a\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '١\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1-2\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1-2\tFoo\tfoo\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1-2\tFoo\t_\tNOUN\t_\t_\t_\t_\t_\t_\n\n',
+    '1-2\tFoo\t_\t_\t_\t_\t1\t_\t_\t_\n\n',
+    '1-2\tFoo\t_\t_\t_\t_\t_\t_\t1:foo\t_\n\n',
+    '1-2\tFoo\t_\t_\t_\tFoo\t_\t_\t_\t_\n\n',
+    '1-2\tFoo\t_\t_\t_\t_\t_\t_\t_\tfoo bar\n\n',
+    '0-1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1-0\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1-2-3\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1-2.3\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1.1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1.1\tFoo\t_\t_\t_\t_\t1\t_\t_\t_\n\n',
+    '1.1\tFoo\t_\t_\t_\t_\t_\tfoo\t_\t_\n\n',
+    '1.1\tFoo\t_\t_\t_\t_\t01\t_\t_\t_\n\n',
+    '0.0\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '01.1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '0.01\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1.1.1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo bar\tfoo bar\t_\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\tNOUNS\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\tnoun\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_NOUN\t_\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\tN N\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t__\t_\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tnumber=Sing\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tNumber=sing\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tNumber=Sing|\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tNumber=Sing,\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tNumber\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tA[b]=C\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tA[B]=C\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tA[]=C\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_A=B\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\tA=B=C\t_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t0\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t00\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t01\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t123\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t-1\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t1_\t_\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\tfoo bar\t_\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t0:root\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t01:root\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t1:\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t1:a b\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t1:a|\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t1:a||2:b\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t1:a|2:b:c\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t1.1:a\t_\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\tfoo bar\n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_ \n\n',
+    '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t__\n\n',
+] + [
+    f'1\tFoo\t_\t{tag.name}\t_\t_\t_\t_\t_\t_\n\n' for tag in UposTag
+]
+
+
+def _dump(sentences: List[Sentence]) -> list:
+    """Returns a plain structure with all the data of the given sentences,
+    suitable for comparison.
+    """
+    def slots(element):
+        for cls in type(element).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if not slot.startswith('_'):
+                    yield slot, getattr(element, slot)
+
+    def kind(element):
+        for cls in (Word, EmptyNode, Multiword):
+            if isinstance(element, cls):
+                return cls.__name__
+        return type(element).__name__
+
+    return [
+        (sentence.comments,
+         [(kind(e), sorted(slots(e))) for e in sentence.elements])
+        for sentence in sentences
+    ]
+
+
+def _outcome(parser, content: str, line_number: int = 1, **kwargs) -> tuple:
+    """Returns the result of parsing the given content, or the details of
+    the error raised.
+    """
+    try:
+        return 'ok', _dump(parser.parse(content, line_number, **kwargs))
+    except Exception as err:  # pylint: disable=broad-except
+        return 'error', type(err), str(err), \
+            getattr(err, 'line_number', None), \
+            getattr(err, 'column_number', None)
+
+
+def _mutate(rand: random.Random, content: str) -> str:
+    """Returns a copy of the content with a random small change."""
+    alphabet = '\t\n #_-.:=|,[]01239AZaz\ré'
+    position = rand.randrange(len(content))
+    action = rand.randrange(3)
+    if action == 0:
+        return content[:position] + content[position + 1:]
+    char = rand.choice(alphabet)
+    if action == 1:
+        return content[:position] + char + content[position:]
+    return content[:position] + char + content[position + 1:]
+
+
+class TestFastParser(unittest.TestCase):
+
+    def assertSameOutcome(self, content: str, line_number: int = 1):
+        # pylint: disable=invalid-name
+        self.assertEqual(
+            _outcome(Parser(), content, line_number),
+            _outcome(FastParser(), content, line_number),
+            repr(content)
+        )
+
+    def test_document(self):
+        result = FastParser().parse(DOCUMENT)
+        self.assertEqual(2, len(result))
+        self.assertEqual(DOCUMENT.replace('#text', '# text'),
+                         ''.join(s.to_conllu() for s in result))
+
+    def test_same_result_as_ply_for_corpus(self):
+        for content in CORPUS:
+            self.assertSameOutcome(content)
+
+    def test_same_result_as_ply_for_concatenated_corpus(self):
+        for content in CORPUS:
+            self.assertSameOutcome(DOCUMENT + content)
+            self.assertSameOutcome(DOCUMENT + content + DOCUMENT)
+
+    def test_same_result_as_ply_with_custom_line_number(self):
+        for content in CORPUS:
+            self.assertSameOutcome(DOCUMENT + content, 42)
+
+    def test_same_result_as_ply_for_random_changes(self):
+        rand = random.Random(0)
+        for _ in range(1000):
+            self.assertSameOutcome(_mutate(rand, DOCUMENT))
+
+    def test_ply_is_not_used_for_valid_input(self):
+        with patch.object(Parser, 'parse') as method:
+            FastParser().parse(DOCUMENT)
+        method.assert_not_called()
+
+    def test_ply_is_used_only_for_the_invalid_sentence(self):
+        content = DOCUMENT + '1\tXyz\t_\t_\t_\t_\t_\t_\t_\t_ \n\n' + DOCUMENT
+        with patch.object(Parser, 'parse', return_value=[]) as method:
+            result = FastParser().parse(content)
+        self.assertEqual(4, len(result))
+        method.assert_called_once_with(
+            '1\tXyz\t_\t_\t_\t_\t_\t_\t_\t_ \n\n', 13)
+
+    def test_error_line_and_column(self):
+        content = DOCUMENT + '1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'
+
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            FastParser().parse(content)
+
+        self.assertEqual(13, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_empty_input(self):
+        with self.assertRaises(IllegalEofError):
+            FastParser().parse('')
+
+    def test_parser_is_reusable_after_an_error(self):
+        parser = FastParser()
+
+        with self.assertRaises(IllegalEofError):
+            parser.parse('1\tFoo\t_\tNOUN')
+
+        self.assertEqual(2, len(parser.parse(DOCUMENT)))
+
+
+class LazyFastParser(FastParser):
+    """Parser returning lazy sentences by default, for differential tests."""
+
+    def parse(self, content, line_number=1, lazy=True, **kwargs):
+        return super(LazyFastParser, self).parse(
+            content, line_number, lazy, **kwargs)
+
+
+class TestFastParserLazyMode(unittest.TestCase):
+
+    def assertSameOutcome(self, content: str, line_number: int = 1):
+        # pylint: disable=invalid-name
+        self.assertEqual(
+            _outcome(Parser(), content, line_number),
+            _outcome(LazyFastParser(), content, line_number),
+            repr(content)
+        )
+
+    def test_returns_lazy_sentences(self):
+        result = FastParser().parse(DOCUMENT, lazy=True)
+        self.assertEqual(2, len(result))
+        for sentence in result:
+            self.assertIsInstance(sentence, LazySentence)
+            self.assertFalse(sentence.is_materialized)
+
+    def test_comments(self):
+        result = FastParser().parse(DOCUMENT, lazy=True)
+        self.assertEqual(
+            ['newdoc id = doc1', 'sent_id = 1', 'text = Foo bar!'],
+            result[0].comments
+        )
+        self.assertEqual([], result[1].comments)
+
+    def test_word_lines_are_not_parsed(self):
+        parser = FastParser()
+        with patch.object(parser, 'build_sentence') as build_sentence, \
+                patch.object(Parser, 'parse') as ply_parse:
+            parser.parse(DOCUMENT, lazy=True)
+        build_sentence.assert_not_called()
+        ply_parse.assert_not_called()
+
+    def test_to_conllu_returns_the_original_text(self):
+        result = FastParser().parse(DOCUMENT, lazy=True)
+        self.assertEqual(DOCUMENT, ''.join(s.to_conllu() for s in result))
+
+    def test_same_result_as_ply_for_corpus(self):
+        for content in CORPUS:
+            self.assertSameOutcome(content)
+            self.assertSameOutcome(DOCUMENT + content + DOCUMENT, 42)
+
+    def test_same_result_as_ply_for_random_changes(self):
+        rand = random.Random(0)
+        for _ in range(1000):
+            self.assertSameOutcome(_mutate(rand, DOCUMENT))
+
+    def test_word_line_error_is_raised_on_first_access(self):
+        content = DOCUMENT + '1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'
+        result = FastParser().parse(content, lazy=True)
+        self.assertEqual(3, len(result))
+
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            result[2].elements
+
+        self.assertEqual(13, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_structural_errors_are_raised_immediately(self):
+        word_line = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n'
+
+        for content in ['\n', '# Foo\n\n', word_line,
+                        f'{word_line}# Bar\n\n']:
+            expected = _outcome(Parser(), DOCUMENT + content)
+            self.assertEqual('error', expected[0])
+            with self.assertRaises(expected[1]):
+                FastParser().parse(DOCUMENT + content, lazy=True)
+
+    def test_empty_input(self):
+        with self.assertRaises(IllegalEofError):
+            FastParser().parse('', lazy=True)
+
+
+class TestFastParserLazyFields(unittest.TestCase):
+
+    def test_returns_lazy_fields_elements(self):
+        result = FastParser().parse(DOCUMENT, lazy_fields=True)
+        classes = [type(e) for s in result for e in s.elements]
+        self.assertEqual(4, classes.count(LazyFieldsWord))
+        self.assertEqual(2, classes.count(LazyFieldsEmptyNode))
+
+    def test_to_conllu_does_not_decode_fields(self):
+        result = FastParser().parse(DOCUMENT, lazy_fields=True)
+        self.assertEqual(DOCUMENT.replace('#text', '# text'),
+                         ''.join(s.to_conllu() for s in result))
+        self.assertFalse(result[0].elements[2].is_decoded)
+
+    def test_same_result_as_ply_for_corpus(self):
+        parser = FastParser()
+        for content in CORPUS:
+            self.assertEqual(
+                _outcome(Parser(), DOCUMENT + content),
+                _outcome(parser, DOCUMENT + content, lazy_fields=True),
+                repr(content)
+            )
+
+    def test_same_result_as_ply_with_lazy_sentences(self):
+        parser = FastParser()
+        for content in CORPUS:
+            self.assertEqual(
+                _outcome(Parser(), DOCUMENT + content),
+                _outcome(parser, DOCUMENT + content, lazy=True,
+                         lazy_fields=True),
+                repr(content)
+            )
+
+
+class TestFastParserFields(unittest.TestCase):
+
+    def test_only_requested_fields_are_set(self):
+        result = FastParser().parse(DOCUMENT, fields=['FORM', 'upos', 'Head'])
+        multiword, word, _, empty_node, _ = result[0].elements
+
+        self.assertEqual((1, 2, 'Foobar', None),
+                         (multiword.first_index, multiword.last_index,
+                          multiword.form, multiword.misc))
+        self.assertEqual(
+            (1, 'Foo', None, UposTag.NOUN, None, None, 0, None, None, None),
+            (word.index, word.form, word.lemma, word.upos, word.xpos,
+             word.feats, word.head, word.deprel, word.deps, word.misc)
+        )
+        self.assertEqual(
+            (2, 1, 'baz', None, UposTag.X, None, None, None, None),
+            (empty_node.main_index, empty_node.sub_index, empty_node.form,
+             empty_node.lemma, empty_node.upos, empty_node.xpos,
+             empty_node.feats, empty_node.deps, empty_node.misc)
+        )
+
+    def test_each_field_has_the_same_value_as_in_full_parsing(self):
+        expected = FastParser().parse(DOCUMENT)
+        for name in FIELDS:
+            result = FastParser().parse(DOCUMENT, fields=[name])
+            for sentence, expected_sentence in zip(result, expected):
+                for element, expected_element in zip(
+                        sentence.elements, expected_sentence.elements):
+                    for attribute in FIELDS:
+                        if not hasattr(expected_element, attribute):
+                            continue
+                        self.assertEqual(
+                            getattr(expected_element, attribute)
+                            if attribute == name else None,
+                            getattr(element, attribute),
+                            (name, attribute)
+                        )
+
+    def test_no_fields(self):
+        result = FastParser().parse(DOCUMENT, fields=[])
+        self.assertEqual('1\t_\t_\t_\t_\t_\t_\t_\t_\t_',
+                         result[1].elements[1].to_conllu())
+
+    def test_other_fields_are_not_validated(self):
+        content = '1\tFoo\t_\tFOO\tfoo bar\tFoo\tfoo\tfoo bar\tfoo\t_\n\n'
+
+        result = FastParser().parse(content, fields=['form', 'misc'])
+        self.assertEqual('Foo', result[0].elements[0].form)
+
+        with self.assertRaises(IllegalCharacterError):
+            FastParser().parse(content, fields=['form', 'xpos'])
+
+    def test_line_structure_is_validated(self):
+        for content in ['1\tFoo\t_\t_\t_\t_\t_\t_\t_\n\n',
+                        'A\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n',
+                        '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n# Foo\n\n',
+                        '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n']:
+            self.assertEqual(
+                _outcome(Parser(), content)[:2],
+                _outcome(FastParser(), content, fields=['form'])[:2],
+                repr(content)
+            )
+
+    def test_unknown_fields(self):
+        with self.assertRaises(ValueError):
+            FastParser().parse(DOCUMENT, fields=['form', 'foo'])
+
+        with self.assertRaises(ValueError):
+            FastParser().parse(DOCUMENT, lazy=True, fields=['foo'])
+
+    def test_id_is_always_processed(self):
+        result = FastParser().parse(DOCUMENT, fields=['id'])
+        self.assertEqual(1, result[0].elements[1].index)
+        self.assertIsNone(result[0].elements[1].form)
+
+    def test_with_lazy_fields(self):
+        result = FastParser().parse(DOCUMENT, lazy_fields=True,
+                                    fields=['feats'])
+        word = result[0].elements[1]
+
+        self.assertIsInstance(word, LazyFieldsWord)
+        self.assertFalse(word.is_decoded)
+        self.assertEqual((('Number', ('Sing',)),), word.feats)
+        self.assertIsNone(word.form)
+
+    def test_with_lazy_sentences(self):
+        generator = (name for name in ['form'])
+        result = FastParser().parse(DOCUMENT, lazy=True, fields=generator)
+
+        self.assertIsInstance(result[0], LazySentence)
+        self.assertEqual(['Quux', None],
+                         [result[1].elements[1].form,
+                          result[1].elements[1].lemma])
+
+
+class TestFastParserWhere(unittest.TestCase):
+
+    _CONTENT = '# newdoc id = a\n' \
+               '# sent_id = a-1\n' \
+               '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+               '\n' \
+               '# sent_id = a-2\n' \
+               '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+               '\n' \
+               '# newdoc id = b\n' \
+               '# sent_id = b-1\n' \
+               '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+               '\n'
+
+    @staticmethod
+    def _forms(sentences: List[Sentence]) -> List[str]:
+        return [sentence.elements[0].form for sentence in sentences]
+
+    def test_rejected_sentences_are_skipped(self):
+        result = FastParser().parse(self._CONTENT,
+                                    where=lambda c: c[-1].endswith('-2'))
+
+        self.assertEqual(['Bar'], self._forms(result))
+        self.assertEqual(['sent_id = a-2'], result[0].comments)
+
+    def test_where_sees_the_comments_of_each_sentence_in_order(self):
+        seen = []
+        FastParser().parse(self._CONTENT,
+                           where=lambda comments: seen.append(comments))
+
+        self.assertEqual([['newdoc id = a', 'sent_id = a-1'],
+                          ['sent_id = a-2'],
+                          ['newdoc id = b', 'sent_id = b-1']], seen)
+
+    def test_stateful_where(self):
+        documents = []
+
+        def in_document_a(comments):
+            for comment in comments:
+                if comment.startswith('newdoc id = '):
+                    documents.append(comment[12:])
+            return documents[-1] == 'a'
+
+        result = FastParser().parse(self._CONTENT, where=in_document_a)
+        self.assertEqual(['Foo', 'Bar'], self._forms(result))
+
+    def test_word_lines_of_rejected_sentences_are_not_processed(self):
+        content = self._CONTENT.replace('Bar\t_\t_\t_',
+                                        'Bar\t_\t_\tfoo bar')
+
+        with patch.object(FastParser, '_build_element',
+                          wraps=FastParser._build_element) as method:
+            result = FastParser().parse(
+                content, where=lambda c: c[-1] != 'sent_id = a-2')
+
+        self.assertEqual(['Foo', 'Baz'], self._forms(result))
+        self.assertEqual(2, method.call_count)
+
+    def test_errors_of_accepted_sentences_have_absolute_position(self):
+        content = self._CONTENT.replace('Baz\t_\t_\t_',
+                                        'Baz\t_\t_\tfoo bar')
+
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            FastParser().parse(content, line_number=3,
+                               where=lambda c: c[-1] != 'sent_id = a-2')
+
+        self.assertEqual(12, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_structural_errors_are_raised(self):
+        for content in ['', '# Foo\n\n', self._CONTENT + '1\tQux']:
+            self.assertEqual(
+                _outcome(Parser(), content)[:2],
+                _outcome(FastParser(), content, where=lambda c: False)[:2],
+                repr(content)
+            )
+
+    def test_same_result_as_ply_for_corpus(self):
+        parser = FastParser()
+        for content in CORPUS:
+            self.assertEqual(
+                _outcome(Parser(), DOCUMENT + content),
+                _outcome(parser, DOCUMENT + content, where=lambda c: True),
+                repr(content)
+            )
+
+    def test_with_lazy_sentences_and_fields(self):
+        result = FastParser().parse(
+            self._CONTENT, lazy=True, fields=['id'],
+            where=lambda c: c[-1].startswith('sent_id = b'))
+
+        self.assertEqual(1, len(result))
+        self.assertIsInstance(result[0], LazySentence)
+        self.assertEqual([None], self._forms(result))
+
+
+class TestFastParserKeepLines(unittest.TestCase):
+
+    def test_returns_source_line_elements(self):
+        result = FastParser().parse(DOCUMENT, keep_lines=True)
+        lines = [line for line in DOCUMENT.split('\n')
+                 if line and line[0] != '#']
+
+        self.assertEqual(
+            [SourceLineMultiword, SourceLineWord, SourceLineWord,
+             SourceLineEmptyNode, SourceLineWord, SourceLineEmptyNode,
+             SourceLineWord],
+            [type(e) for s in result for e in s.elements]
+        )
+        self.assertEqual(lines, [e.source_line for s in result
+                                 for e in s.elements])
+
+    def test_to_conllu_writes_unchanged_lines_verbatim(self):
+        result = FastParser().parse(DOCUMENT, keep_lines=True)
+        expected = DOCUMENT.replace('#text', '# text')
+
+        with patch.object(Word, 'to_conllu') as to_conllu:
+            self.assertEqual(expected,
+                             ''.join(s.to_conllu() for s in result))
+            to_conllu.assert_not_called()
+
+        result[0].elements[2].deprel = 'nsubj'
+        self.assertEqual(expected.replace('\tobl:tmod\t1:', '\tnsubj\t1:'),
+                         ''.join(s.to_conllu() for s in result))
+
+    def test_same_result_as_ply_for_corpus(self):
+        parser = FastParser()
+        for content in CORPUS:
+            self.assertEqual(
+                _outcome(Parser(), DOCUMENT + content),
+                _outcome(parser, DOCUMENT + content, keep_lines=True),
+                repr(content)
+            )
+
+    def test_with_lazy_sentences_and_where(self):
+        result = FastParser().parse(DOCUMENT, lazy=True, keep_lines=True,
+                                    where=lambda c: not c)
+
+        self.assertIsInstance(result[0], LazySentence)
+        self.assertIsInstance(result[0].elements[0], SourceLineEmptyNode)
+        self.assertEqual('0.1\tQux\tqux\t_\tXX\t_\t_\t_\t_\t_',
+                         result[0].elements[0].source_line)
+
+    def test_with_lazy_fields_or_fields(self):
+        for options in [{'lazy_fields': True}, {'fields': ['form']}]:
+            with self.assertRaises(ValueError):
+                FastParser().parse(DOCUMENT, keep_lines=True, **options)
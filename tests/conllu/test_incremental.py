@@ -0,0 +1,190 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from typing import List
+from colonel.conllu import parse, to_conllu
+from colonel.conllu.incremental import IncrementalParser
+from colonel.conllu.lazysentence import LazySentence
+from colonel.conllu.lexer import IllegalCharacterError
+from colonel.conllu.parser import Parser, IllegalEofError
+
+_CONTENT = '# Föo\n' \
+           '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+           '\n' \
+           '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+           '2\tQüx\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+           '\n'
+
+
+def _chunks(content, size: int) -> List:
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+def _feed_all(parser: IncrementalParser, chunks: List) -> List:
+    sentences = []
+    for chunk in chunks:
+        sentences.extend(parser.feed(chunk))
+    sentences.extend(parser.close())
+    return sentences
+
+
+class TestIncrementalParser(unittest.TestCase):
+
+    def test_text_chunks(self):
+        for size in [1, 2, 5, 1000]:
+            result = _feed_all(IncrementalParser(), _chunks(_CONTENT, size))
+            self.assertEqual(_CONTENT, to_conllu(result))
+
+    def test_binary_chunks_splitting_characters(self):
+        content = _CONTENT.encode('utf-8')
+        for size in [1, 2, 3, 7, 1000]:
+            result = _feed_all(IncrementalParser(), _chunks(content, size))
+            self.assertEqual(_CONTENT, to_conllu(result))
+
+    def test_binary_chunks_with_custom_encoding(self):
+        content = _CONTENT.encode('utf-16')
+        result = _feed_all(IncrementalParser(encoding='utf-16'),
+                           _chunks(content, 3))
+        self.assertEqual(_CONTENT, to_conllu(result))
+
+    def test_sentences_are_returned_as_soon_as_completed(self):
+        parser = IncrementalParser()
+
+        self.assertEqual([], parser.feed('# Föo\n1\tBär\t_\t_\t_\t_\t_'))
+        self.assertEqual([], parser.feed('\t_\t_\t_\n'))
+
+        first = parser.feed('\n1\tBaz')
+        self.assertEqual(['Bär'], [s.elements[0].form for s in first])
+
+        self.assertEqual([], parser.feed('\t_\t_\t_\t_\t_\t_\t_\t_\n'))
+
+        second = parser.feed('\n')
+        self.assertEqual(['Baz'], [s.elements[0].form for s in second])
+
+        self.assertEqual([], parser.close())
+
+    def test_blank_line_split_across_chunks(self):
+        parser = IncrementalParser()
+        self.assertEqual([], parser.feed('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n'))
+        self.assertEqual(1, len(parser.feed('\n1\tBar')))
+        self.assertEqual(['1\tBar'], parser._pieces)
+
+    def test_callback(self):
+        received = []
+        parser = IncrementalParser(received.append)
+        result = _feed_all(parser, _chunks(_CONTENT, 4))
+
+        self.assertEqual(2, len(received))
+        self.assertEqual(result, received)
+
+    def test_error_has_absolute_position(self):
+        content = '1\tFöo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '# Bar\n' \
+                  '1\tBäz\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        for size in [1, 4, 1000]:
+            with self.assertRaises(IllegalCharacterError) as err_context:
+                _feed_all(IncrementalParser(),
+                          _chunks(content.encode('utf-8'), size))
+
+            self.assertEqual(4, err_context.exception.line_number)
+            self.assertEqual(14, err_context.exception.column_number)
+
+    def test_truncated_input(self):
+        parser = IncrementalParser()
+        self.assertEqual(1, len(parser.feed(_CONTENT[:-1] + '1\tFoo')))
+
+        with self.assertRaises(IllegalEofError):
+            parser.close()
+
+    def test_empty_input(self):
+        with self.assertRaises(IllegalEofError):
+            IncrementalParser().close()
+
+        with self.assertRaises(IllegalEofError):
+            _feed_all(IncrementalParser(), [b'', b''])
+
+    def test_truncated_character(self):
+        parser = IncrementalParser()
+        parser.feed(_CONTENT.encode('utf-8') + 'ä'.encode('utf-8')[:1])
+
+        with self.assertRaises(UnicodeDecodeError):
+            parser.close()
+
+    def test_mixed_chunks(self):
+        parser = IncrementalParser()
+        parser.feed('1\tFoo')
+
+        with self.assertRaises(TypeError):
+            parser.feed(b'\t_')
+
+    def test_closed_parser(self):
+        parser = IncrementalParser()
+        parser.feed(_CONTENT)
+        parser.close()
+
+        with self.assertRaises(ValueError):
+            parser.feed(_CONTENT)
+
+        with self.assertRaises(ValueError):
+            parser.close()
+
+    def test_lazy(self):
+        result = _feed_all(IncrementalParser(lazy=True), _chunks(_CONTENT, 3))
+
+        self.assertTrue(all(isinstance(s, LazySentence) for s in result))
+        self.assertEqual(_CONTENT, to_conllu(result))
+
+    def test_ply_parser(self):
+        result = _feed_all(IncrementalParser(parser=Parser()),
+                           _chunks(_CONTENT, 3))
+        self.assertEqual(_CONTENT, to_conllu(result))
+
+    def test_fields(self):
+        parser = IncrementalParser(fields=(name for name in ['form']))
+        result = _feed_all(parser, _chunks(_CONTENT, 3))
+
+        self.assertEqual(to_conllu(parse(_CONTENT, fields=['form'])),
+                         to_conllu(result))
+        self.assertTrue(all(element.lemma is None for sentence in result
+                            for element in sentence.elements
+                            if hasattr(element, 'lemma')))
+
+    def test_where(self):
+        def where(comments):
+            return 'Föo' not in comments
+
+        result = _feed_all(IncrementalParser(where=where),
+                           _chunks(_CONTENT, 3))
+        self.assertEqual(['Baz'], [s.elements[0].form for s in result])
+        self.assertEqual(to_conllu(parse(_CONTENT, where=where)),
+                         to_conllu(result))
+
+    def test_keep_lines(self):
+        result = _feed_all(IncrementalParser(keep_lines=True),
+                           _chunks(_CONTENT, 3))
+
+        self.assertIsNotNone(result[0].elements[0].source_line)
+        self.assertEqual(to_conllu(parse(_CONTENT)), to_conllu(result))
+
+    def test_ply_parser_with_lazy_options(self):
+        for options in [{'lazy': True}, {'lazy_fields': True},
+                        {'fields': ['form']}, {'where': bool},
+                        {'keep_lines': True}]:
+            with self.assertRaises(ValueError):
+                IncrementalParser(parser=Parser(), **options)
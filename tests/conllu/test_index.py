@@ -0,0 +1,251 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from colonel.conllu import parse
+from colonel.conllu.index import SentenceIndex, IndexedReader, \
+    InvalidIndexError, SIDECAR_SUFFIX
+from colonel.conllu.lexer import IllegalCharacterError
+
+_SENTENCES = [
+    f'# sent_id = {number}\n'
+    f'1\tFöo{number}\t_\t_\t_\t_\t_\t_\t_\t_\n'
+    f'2\tBär{number}\t_\t_\t_\t_\t_\t_\t_\t_\n'
+    '\n'
+    for number in range(20)
+]
+
+_CONTENT = ''.join(_SENTENCES)
+
+
+class TemporaryFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.conllu')
+        self.write(_CONTENT)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, content: str):
+        with open(self.path, 'wb') as file:
+            file.write(content.encode('utf-8'))
+
+
+class TestSentenceIndex(TemporaryFileTestCase):
+
+    def test_build(self):
+        buffer = b'1\tFoo\n\n# Bar\n1\tBaz\n\n'
+        index = SentenceIndex.build(buffer)
+
+        self.assertEqual(2, len(index))
+        self.assertEqual((1, 0, 7), index.span(0))
+        self.assertEqual((3, 7, 20), index.span(1))
+        self.assertEqual((3, 7, 20), index.span(-1))
+
+    def test_build_empty_buffer(self):
+        index = SentenceIndex.build(b'')
+        self.assertEqual(0, len(index))
+        with self.assertRaises(IndexError):
+            index.span(0)
+
+    def test_build_from_file(self):
+        index = SentenceIndex.build_from_file(self.path)
+        stat = os.stat(self.path)
+
+        self.assertEqual(20, len(index))
+        self.assertEqual(stat.st_size, index.file_size)
+        self.assertEqual(stat.st_mtime_ns, index.file_mtime_ns)
+        self.assertEqual(stat.st_size, index.offsets[-1])
+
+    def test_build_from_empty_file(self):
+        self.write('')
+        self.assertEqual(0, len(SentenceIndex.build_from_file(self.path)))
+
+    def test_save_and_load(self):
+        index = SentenceIndex.build_from_file(self.path)
+        index_path = self.path + SIDECAR_SUFFIX
+        index.save(index_path)
+
+        loaded = SentenceIndex.load(index_path, self.path)
+
+        self.assertEqual(index.offsets, loaded.offsets)
+        self.assertEqual(index.line_numbers, loaded.line_numbers)
+        self.assertEqual(index.file_size, loaded.file_size)
+        self.assertEqual(index.file_mtime_ns, loaded.file_mtime_ns)
+        self.assertEqual([SIDECAR_SUFFIX[1:]], [
+            name.rsplit('.', 1)[1] for name in os.listdir(self.directory.name)
+            if name != 'test.conllu'
+        ])
+
+    def test_load_out_of_date_index(self):
+        index_path = self.path + SIDECAR_SUFFIX
+        SentenceIndex.build_from_file(self.path).save(index_path)
+        self.write(_CONTENT + _SENTENCES[0])
+
+        with self.assertRaises(InvalidIndexError):
+            SentenceIndex.load(index_path, self.path)
+
+        self.assertEqual(20, len(SentenceIndex.load(index_path)))
+
+    def test_load_invalid_index(self):
+        index_path = self.path + SIDECAR_SUFFIX
+
+        for content in [b'', b'foo', b'X' * 32]:
+            with open(index_path, 'wb') as file:
+                file.write(content)
+            with self.assertRaises(InvalidIndexError):
+                SentenceIndex.load(index_path)
+
+    def test_load_truncated_index(self):
+        index_path = self.path + SIDECAR_SUFFIX
+        SentenceIndex.build_from_file(self.path).save(index_path)
+
+        with open(index_path, 'r+b') as file:
+            file.truncate(os.path.getsize(index_path) - 1)
+
+        with self.assertRaises(InvalidIndexError):
+            SentenceIndex.load(index_path)
+
+
+class TestIndexedReader(TemporaryFileTestCase):
+
+    def test_len(self):
+        with IndexedReader(self.path) as reader:
+            self.assertEqual(20, len(reader))
+
+    def test_get_item(self):
+        expected = parse(_CONTENT)
+
+        with IndexedReader(self.path) as reader:
+            for position in [0, 7, 19, -1, -20]:
+                self.assertEqual(expected[position].to_conllu(),
+                                 reader[position].to_conllu())
+
+    def test_get_item_out_of_range(self):
+        with IndexedReader(self.path) as reader:
+            for position in [20, -21]:
+                with self.assertRaises(IndexError):
+                    reader[position]
+
+    def test_slice(self):
+        with IndexedReader(self.path) as reader:
+            result = reader[3:9:2]
+
+        self.assertEqual(''.join(_SENTENCES[3:9:2]),
+                         ''.join(s.to_conllu() for s in result))
+
+    def test_take(self):
+        with IndexedReader(self.path) as reader:
+            result = reader.take([12, 2, 12, -1])
+
+        self.assertEqual(
+            [_SENTENCES[12], _SENTENCES[2], _SENTENCES[12], _SENTENCES[19]],
+            [s.to_conllu() for s in result]
+        )
+
+    def test_only_requested_sentences_are_parsed(self):
+        with IndexedReader(self.path) as reader:
+            with patch.object(reader._parser, 'parse',
+                              wraps=reader._parser.parse) as mock:
+                reader.take([5, 9])
+
+        self.assertEqual(2, mock.call_count)
+        mock.assert_any_call(_SENTENCES[5], 21)
+        mock.assert_any_call(_SENTENCES[9], 37)
+
+    def test_lru_cache(self):
+        with IndexedReader(self.path, cache_size=2) as reader:
+            with patch.object(reader._parser, 'parse',
+                              wraps=reader._parser.parse) as mock:
+                first = reader[0]
+                reader[1]
+                self.assertIs(first, reader[0])
+                self.assertEqual(2, mock.call_count)
+
+                reader[2]  # evicts the least recently used, that is 1
+                self.assertIs(first, reader[0])
+                self.assertEqual(3, mock.call_count)
+
+                reader[1]
+                self.assertEqual(4, mock.call_count)
+
+    def test_error_has_absolute_position(self):
+        sentences = list(_SENTENCES)
+        sentences[10] = '1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'
+        self.write(''.join(sentences))
+
+        with IndexedReader(self.path) as reader:
+            self.assertEqual(_SENTENCES[11], reader[11].to_conllu())
+
+            with self.assertRaises(IllegalCharacterError) as err_context:
+                reader[10]
+
+        self.assertEqual(41, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_empty_file(self):
+        self.write('')
+        with IndexedReader(self.path) as reader:
+            self.assertEqual(0, len(reader))
+            self.assertEqual([], reader[:])
+
+    def test_file_is_closed_if_mapping_fails(self):
+        files = []
+
+        def open_file(*args):
+            files.append(open(*args))
+            return files[-1]
+
+        index = SentenceIndex.build_from_file(self.path)
+        with patch('colonel.conllu.index.open', open_file, create=True), \
+                patch('colonel.conllu.index.mmap', side_effect=OSError):
+            with self.assertRaises(OSError):
+                IndexedReader(self.path, index)
+
+        self.assertEqual(1, len(files))
+        self.assertTrue(files[0].closed)
+
+    def test_given_index(self):
+        index = SentenceIndex.build_from_file(self.path)
+        with IndexedReader(self.path, index) as reader:
+            self.assertIs(index, reader.index)
+
+    def test_sidecar_is_created_and_reused(self):
+        index_path = self.path + SIDECAR_SUFFIX
+
+        with IndexedReader(self.path, sidecar=True) as reader:
+            self.assertEqual(_SENTENCES[4], reader[4].to_conllu())
+        self.assertTrue(os.path.exists(index_path))
+
+        with patch.object(SentenceIndex, 'build_from_file') as mock:
+            with IndexedReader(self.path, sidecar=True) as reader:
+                self.assertEqual(_SENTENCES[4], reader[4].to_conllu())
+        mock.assert_not_called()
+
+    def test_out_of_date_sidecar_is_rebuilt(self):
+        with IndexedReader(self.path, sidecar=True):
+            pass
+        self.write(_CONTENT + _SENTENCES[0])
+
+        with IndexedReader(self.path, sidecar=True) as reader:
+            self.assertEqual(21, len(reader))
+
+        index_path = self.path + SIDECAR_SUFFIX
+        self.assertEqual(21, len(SentenceIndex.load(index_path, self.path)))
@@ -13,28 +13,869 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
+from types import GeneratorType
+from typing import List
 from unittest.mock import patch, Mock
 
-from colonel.conllu import parse, to_conllu
-from colonel.conllu.parser import ConlluParserBuilder
+from colonel import conllu
+from colonel.conllu import parallel
+from colonel.conllu import parse, parse_tolerant, iter_parse, aparse, \
+    parse_file, parse_parallel, iter_parse_parallel, parse_treebank, \
+    iter_parse_treebank, parse_sentence, to_conllu, write_conllu
+from colonel.conllu.lexer import LexerError, IllegalCharacterError
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.lazyfields import LazyFieldsWord
+from colonel.conllu.lazysentence import LazySentence
+from colonel.conllu.parser import Parser, ParserError, IllegalTokenError, \
+    IllegalEofError, IllegalMultiwordError
+from colonel.conllu.sourcelines import SourceLineWord
+from colonel.conllu.zerocopy import ZeroCopyWord
 from colonel.sentence import Sentence
+from colonel.upostag import UposTag
 
 
 class TestConlluModule(unittest.TestCase):
 
-    def test_parse_builds_a_parser_and_returns_its_parsed_result(self):
+    def test_parse_returns_the_result_of_the_shared_parser(self):
         content = 'foo'  # The input content
         result = Mock()  # The expected final result
 
-        parser = Mock()  # The parser built by ConlluParserBuilder
-        parser.parse = Mock(return_value=result)
+        for engine, cls in [('fast', FastParser), ('ply', Parser)]:
+            with patch.object(cls, 'parse', return_value=result) as method:
+                actual_result = parse(content, engine=engine)
 
-        with patch.object(ConlluParserBuilder, 'build', return_value=parser):
-            actual_result = parse(content)
+            method.assert_called_once_with(content)
+            self.assertIs(result, actual_result)
 
-        parser.parse.assert_called_once_with(content)
-        self.assertIs(result, actual_result)
+    def test_parse_uses_the_fast_engine_by_default(self):
+        with patch.object(FastParser, 'parse') as method:
+            parse('foo')
+        method.assert_called_once_with('foo')
+
+    def test_import_does_not_load_optional_modules(self):
+        code = 'import sys, colonel.conllu; ' \
+               'print(*sorted(set(sys.modules).intersection([' \
+               '"asyncio", "multiprocessing", "hashlib", ' \
+               '"colonel.conllu.cache", "colonel.conllu.parallel"])))'
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE).stdout
+        self.assertEqual(b'\n', output)
+
+    def test_lazily_imported_names(self):
+        for name in ['CorpusReader', 'ParseCache', 'aparse', 'parse_parallel',
+                     'iter_parse_parallel', 'parse_treebank',
+                     'iter_parse_treebank']:
+            self.assertIn(name, conllu.__all__)
+            self.assertIn(name, dir(conllu))
+            self.assertIs(getattr(conllu, name), getattr(conllu, name))
+
+        with self.assertRaises(AttributeError):
+            getattr(conllu, 'foo')
+
+    def test_parse_reuses_the_same_parser(self):
+        for engine, cls in [('fast', FastParser), ('ply', Parser)]:
+            parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', engine)
+            parser = conllu.get_parser(engine)
+            parse('1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n\n', engine)
+            self.assertIsInstance(parser, cls)
+            self.assertIs(parser, conllu.get_parser(engine))
+
+    def test_parse_with_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 'foo')
+
+    def test_parse_binary_content(self):
+        content = '# Föo\n' \
+                  '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '2\tQüx\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+        encoded = content.encode('utf-8')
+
+        for binary in [encoded, bytearray(encoded), memoryview(encoded)]:
+            result = parse(binary)
+            self.assertEqual(2, len(result))
+            self.assertEqual(content, to_conllu(result))
+
+    def test_parse_memoryview_slice(self):
+        content = b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+        view = memoryview(b'XYZ' + content + b'XYZ')[3:-3]
+        self.assertEqual(content.decode(), to_conllu(parse(view)))
+
+    def test_parse_binary_content_with_custom_encoding(self):
+        content = '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+        result = parse(content.encode('latin-1'), encoding='latin-1')
+        self.assertEqual('Bär', result[0].elements[0].form)
+
+    def test_parse_binary_content_is_decoded_one_block_at_a_time(self):
+        content = b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  b'\n' \
+                  b'1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  b'\n'
+
+        with patch.object(FastParser, 'parse', return_value=[]) as method:
+            parse(content)
+
+        self.assertEqual(2, method.call_count)
+        method.assert_any_call('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 1)
+        method.assert_any_call('1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 3)
+
+    def test_parse_empty_binary_content(self):
+        for binary in [b'', bytearray(), memoryview(b'')]:
+            with self.assertRaises(IllegalEofError):
+                parse(binary)
+
+    def test_parse_binary_content_incomplete_last_sentence(self):
+        content = b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  b'\n' \
+                  b'1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n'
+
+        with self.assertRaises(IllegalEofError):
+            parse(content)
+
+    def test_parse_binary_content_error_position_is_in_characters(self):
+        content = '1\tFöö\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '# Bär\n' \
+                  '1\tBäz\tqüx\t_\tfoo bar\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            parse(content.encode('utf-8'))
+
+        # the character column, while the byte column would be 18
+        self.assertEqual(4, err_context.exception.line_number)
+        self.assertEqual(16, err_context.exception.column_number)
+
+    def test_parse_binary_content_lazy(self):
+        content = '# Föo\n1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+        result = parse(memoryview(content.encode('utf-8')), lazy=True)
+        self.assertIsInstance(result[0], LazySentence)
+        self.assertEqual(content, to_conllu(result))
+
+    def test_parse_lazy(self):
+        content = '# Foo\n' \
+                  '#Bar\n' \
+                  '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        result = parse(content, lazy=True)
+
+        self.assertIsInstance(result[0], LazySentence)
+        self.assertEqual(['Foo', 'Bar'], result[0].comments)
+        self.assertEqual(content, to_conllu(result))
+
+    def test_parse_lazy_fields(self):
+        content = '1\tFoo\t_\t_\t_\tFoo=Bar\t_\t_\t_\t_\n\n'
+
+        result = parse(content, lazy_fields=True)
+
+        self.assertIsInstance(result[0].elements[0], LazyFieldsWord)
+        self.assertEqual(content, to_conllu(result))
+        self.assertEqual((('Foo', ('Bar',)),), result[0].elements[0].feats)
+
+    def test_lazy_fields_is_not_supported_by_the_ply_engine(self):
+        with self.assertRaises(ValueError):
+            parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 'ply',
+                  lazy_fields=True)
+
+    def test_parse_fields(self):
+        content = '1\tFoo\tfoo\tNOUN\t_\tFoo=Bar\t0\troot\t_\t_\n\n'
+
+        for data in [content, content.encode('utf-8')]:
+            word = parse(data, fields=['form', 'head'])[0].elements[0]
+            self.assertEqual(('Foo', None, None, None, 0, None),
+                             (word.form, word.lemma, word.upos, word.feats,
+                              word.head, word.deprel))
+
+        word = parse(content, fields=[])[0].elements[0]
+        self.assertEqual((1, None), (word.index, word.form))
+
+    def test_parse_fields_from_a_generator(self):
+        content = '1\tFoo\t_\t_\t_\t_\t0\troot\t_\t_\n\n' \
+                  '1\tBar\t_\t_\t_\t_\t0\troot\t_\t_\n\n'
+        data = content.encode('utf-8')
+
+        def fields():
+            return (name for name in ['form', 'deprel'])
+
+        with self._temporary_file(data) as path:
+            results = [
+                parse(content, fields=fields()),
+                parse(data, fields=fields()),
+                list(iter_parse(io.StringIO(content), fields=fields())),
+                parse_tolerant(content, fields=fields())[0],
+                parse_tolerant(data, fields=fields())[0],
+                _run_aparse([data], fields=fields(), chunk_size=1),
+                parse_file(path, fields=fields()),
+            ]
+
+        for result in results:
+            self.assertEqual(
+                [('Foo', None, 'root'), ('Bar', None, 'root')],
+                [(s.elements[0].form, s.elements[0].head,
+                  s.elements[0].deprel) for s in result])
+
+    def test_parse_where(self):
+        content = '# sent_id = 1\n1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n' \
+                  '# sent_id = 2\n1\tBar\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n' \
+                  '# sent_id = 3\n1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+
+        for data in [content, content.encode('utf-8')]:
+            result = parse(data, where=_is_odd_sentence)
+            self.assertEqual(['Foo', 'Baz'],
+                             [s.elements[0].form for s in result])
+
+        result = list(iter_parse(io.StringIO(content), where=_is_odd_sentence))
+        self.assertEqual(['Foo', 'Baz'], [s.elements[0].form for s in result])
+
+    def test_where_is_not_supported_by_the_ply_engine(self):
+        with self.assertRaises(ValueError):
+            parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 'ply',
+                  where=_is_odd_sentence)
+
+    def test_parse_keep_lines(self):
+        content = '# Foo\n1\tFoo\t_\t_\t_\tB=C|A=B\t0\troot\t_\t_\n\n'
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            results = [
+                parse(content, keep_lines=True),
+                parse(content.encode('utf-8'), keep_lines=True),
+                list(iter_parse(io.StringIO(content), keep_lines=True)),
+                parse_file(path, keep_lines=True),
+                parse_tolerant(content, keep_lines=True)[0],
+            ]
+
+        for result in results:
+            self.assertIsInstance(result[0].elements[0], SourceLineWord)
+            self.assertEqual(content, to_conllu(result))
+
+    def test_keep_lines_is_not_supported_by_the_ply_engine(self):
+        with self.assertRaises(ValueError):
+            parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 'ply',
+                  keep_lines=True)
+
+    def test_fields_is_not_supported_by_the_ply_engine(self):
+        with self.assertRaises(ValueError):
+            parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 'ply',
+                  fields=['form'])
+
+    def test_lazy_is_not_supported_by_the_ply_engine(self):
+        with self.assertRaises(ValueError):
+            parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n', 'ply', lazy=True)
+        with self.assertRaises(ValueError):
+            list(iter_parse(io.StringIO(''), engine='ply', lazy=True))
+
+    def test_iter_parse_lazy(self):
+        content = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBar\t_\t_\t_\t_\t_\t_\t_\tfoo bar\n' \
+                  '\n'
+
+        result = list(iter_parse(io.StringIO(content), lazy=True))
+
+        self.assertEqual(2, len(result))
+        self.assertEqual('Foo', result[0].elements[0].form)
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            result[1].elements
+        self.assertEqual(3, err_context.exception.line_number)
+
+    def test_iter_parse_with_both_engines(self):
+        content = '# Foo\n' \
+                  '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        for engine in ['fast', 'ply']:
+            result = list(iter_parse(io.StringIO(content), engine=engine))
+            self.assertEqual(content, to_conllu(result))
+
+    def test_iter_parse_returns_a_generator(self):
+        self.assertIsInstance(iter_parse(io.StringIO('')), GeneratorType)
+
+    def test_iter_parse_text_stream(self):
+        content = '# Foo\n' \
+                  '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '2\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        result = list(iter_parse(io.StringIO(content)))
+
+        self.assertEqual(2, len(result))
+        self.assertEqual(['Foo'], result[0].comments)
+        self.assertEqual(['Bar'], [e.form for e in result[0].elements])
+        self.assertEqual([], result[1].comments)
+        self.assertEqual(['Baz', 'Qux'], [e.form for e in result[1].elements])
+        self.assertEqual(to_conllu(parse(content)), to_conllu(result))
+
+    def test_iter_parse_binary_stream(self):
+        content = '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+
+        result = list(iter_parse(io.BytesIO(content.encode('utf-8'))))
+
+        self.assertEqual(1, len(result))
+        self.assertEqual('Bär', result[0].elements[0].form)
+
+    def test_iter_parse_yields_sentences_before_reading_further(self):
+        lines = iter([
+            '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n',
+            '\n',
+            '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n',
+            '\n'
+        ])
+
+        sentences = iter_parse(lines)
+
+        self.assertEqual('Foo', next(sentences).elements[0].form)
+        self.assertEqual('1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n', next(lines))
+
+    def test_iter_parse_empty_stream(self):
+        with self.assertRaises(IllegalEofError):
+            list(iter_parse(io.StringIO('')))
+
+    def test_iter_parse_incomplete_last_sentence(self):
+        content = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n'
+
+        sentences = iter_parse(io.StringIO(content))
+        self.assertEqual('Foo', next(sentences).elements[0].form)
+
+        with self.assertRaises(IllegalEofError):
+            next(sentences)
+
+    def test_iter_parse_lexer_error_has_absolute_position(self):
+        content = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '# Bar\n' \
+                  '1\tBaz\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            list(iter_parse(io.StringIO(content)))
+
+        self.assertEqual(4, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_iter_parse_parser_error_has_absolute_position(self):
+        content = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '\n'
+
+        with self.assertRaises(IllegalTokenError) as expected:
+            parse(content)
+
+        with self.assertRaises(IllegalTokenError) as err_context:
+            list(iter_parse(io.StringIO(content)))
+
+        self.assertEqual(4, err_context.exception.line_number)
+        self.assertEqual(1, err_context.exception.column_number)
+        self.assertEqual(str(expected.exception), str(err_context.exception))
+
+    def test_iter_parse_multiword_error_has_absolute_line_number(self):
+        content = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1-2\tBar\tbar\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        with self.assertRaises(IllegalMultiwordError) as err_context:
+            list(iter_parse(io.StringIO(content)))
+
+        self.assertEqual(3, err_context.exception.line_number)
+
+    def test_parse_tolerant(self):
+        content = '# Foo\n' \
+                  '1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  'foo\n' \
+                  '\n' \
+                  '1\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tQuux'
+
+        for engine in conllu.ENGINES:
+            for data in [content, content.encode('utf-8')]:
+                sentences, errors = parse_tolerant(data, engine)
+
+                self.assertEqual(['Bär', 'Qux'],
+                                 [s.elements[0].form for s in sentences])
+                self.assertEqual(
+                    [(IllegalCharacterError, 2, 14),
+                     (IllegalCharacterError, 7, 1),
+                     (IllegalEofError, 11, None)],
+                    [(type(e.error), e.line_number, e.column_number)
+                     for e in errors]
+                )
+
+    def test_parse_tolerant_valid_content(self):
+        content = '# Foo\n' \
+                  '1-2\tFoobar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '1\tFoo\t_\t_\t_\tA=B\t0\troot\t0:root\t_\n' \
+                  '2\tbar\t_\t_\t_\t_\t1\tdep\t_\t_\n' \
+                  '\n' \
+                  '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '1.1\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        sentences, errors = parse_tolerant(content)
+
+        self.assertEqual([], errors)
+        self.assertEqual(content, to_conllu(sentences))
+
+    def test_parse_tolerant_empty_content(self):
+        for content in ['', b'']:
+            sentences, errors = parse_tolerant(content)
+            self.assertEqual([], sentences)
+            self.assertEqual([IllegalEofError],
+                             [type(e.error) for e in errors])
+
+    def test_parse_tolerant_decode_error(self):
+        content = b'1\tF\xff\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  b'\n' \
+                  b'1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  b'\n'
+
+        sentences, errors = parse_tolerant(content)
+
+        self.assertEqual(['Bar'], [s.elements[0].form for s in sentences])
+        self.assertIsInstance(errors[0].error, UnicodeDecodeError)
+        self.assertEqual((1, 4),
+                         (errors[0].line_number, errors[0].column_number))
+
+    def test_parse_tolerant_lazy_fields(self):
+        content = '1\tFoo\t_\t_\t_\tFoo=Bar\t_\t_\t_\t_\n\n'
+        sentences, _ = parse_tolerant(content, lazy_fields=True)
+        self.assertIsInstance(sentences[0].elements[0], LazyFieldsWord)
+
+        with self.assertRaises(ValueError):
+            parse_tolerant(content, engine='ply', lazy_fields=True)
+
+    def test_aparse(self):
+        content = '# Föo\n' \
+                  '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '2\tQüx\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        for chunk_size in [1, 2, 3, 7, 1000]:
+            result = _run_aparse([content.encode('utf-8')],
+                                 chunk_size=chunk_size)
+            self.assertEqual(content, to_conllu(result))
+
+    def test_aparse_yields_sentences_as_soon_as_they_are_complete(self):
+        async def run():
+            reader = asyncio.StreamReader()
+            sentences = aparse(reader)
+
+            reader.feed_data(b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n')
+            reader.feed_data(b'\n1\tBar\t_\t_')
+            first = await sentences.__anext__()
+
+            reader.feed_data(b'\t_\t_\t_\t_\t_\t_\n\n')
+            reader.feed_eof()
+            rest = [sentence async for sentence in sentences]
+            return first, rest
+
+        first, rest = asyncio.run(run())
+
+        self.assertEqual('Foo', first.elements[0].form)
+        self.assertEqual(['Bar'], [s.elements[0].form for s in rest])
+
+    def test_aparse_uses_the_executor_for_large_chunks(self):
+        sentence = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+        chunks = [sentence.encode(), (sentence * 10).encode()]
+
+        with ThreadPoolExecutor(1) as executor:
+            with patch.object(executor, 'submit',
+                              wraps=executor.submit) as submit:
+                result = _run_aparse(chunks, executor=executor,
+                                     executor_threshold=len(sentence) * 2)
+
+        self.assertEqual(11, len(result))
+        submit.assert_called_once()
+
+    def test_aparse_lazy(self):
+        content = b'# Foo\n1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+        result = _run_aparse([content], lazy=True)
+        self.assertIsInstance(result[0], LazySentence)
+
+    def test_aparse_empty_stream(self):
+        with self.assertRaises(IllegalEofError):
+            _run_aparse([])
+
+    def test_aparse_incomplete_last_sentence(self):
+        content = b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  b'\n' \
+                  b'1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n'
+
+        with self.assertRaises(IllegalEofError):
+            _run_aparse([content], chunk_size=5)
+
+    def test_aparse_error_has_absolute_position(self):
+        content = '1\tFöo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '# Bar\n' \
+                  '1\tBäz\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        for chunk_size in [1, 4, 1000]:
+            with self.assertRaises(IllegalCharacterError) as err_context:
+                _run_aparse([content.encode('utf-8')], chunk_size=chunk_size)
+
+            self.assertEqual(4, err_context.exception.line_number)
+            self.assertEqual(14, err_context.exception.column_number)
+
+    def test_aparse_with_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            _run_aparse([b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'],
+                        engine='foo')
+
+    def test_parse_file(self):
+        content = '# Foo\n' \
+                  '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '2\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        for engine in ['fast', 'ply']:
+            with self._temporary_file(content.encode('utf-8')) as path:
+                result = parse_file(path, engine=engine)
+
+            self.assertEqual(2, len(result))
+            self.assertEqual(content, to_conllu(result))
+
+    def test_parse_file_lazy(self):
+        content = '# Foo\n' \
+                  '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            result = parse_file(path, lazy=True)
+
+        self.assertIsInstance(result[0], LazySentence)
+        self.assertEqual(content, to_conllu(result))
+
+    def test_parse_file_with_custom_encoding(self):
+        content = '1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+
+        with self._temporary_file(content.encode('latin-1')) as path:
+            result = parse_file(path, encoding='latin-1')
+
+        self.assertEqual('Bär', result[0].elements[0].form)
+
+    def test_parse_file_empty_file(self):
+        with self._temporary_file(b'') as path:
+            with self.assertRaises(IllegalEofError):
+                parse_file(path)
+
+    def test_parse_file_incomplete_last_sentence(self):
+        content = b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  b'\n' \
+                  b'1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n'
+
+        with self._temporary_file(content) as path:
+            with self.assertRaises(IllegalEofError):
+                parse_file(path)
+
+    def test_parse_file_error_has_absolute_position(self):
+        content = '1\tFöo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n' \
+                  '# Bär\n' \
+                  '1\tBäz\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            with self.assertRaises(IllegalCharacterError) as err_context:
+                parse_file(path)
+
+        self.assertEqual(4, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_parse_zero_copy(self):
+        content = '# Föo\n1\tBär\tbär\tNOUN\t_\tA=B\t0\troot\t_\t_\n\n'
+        data = content.encode('utf-8')
+
+        for binary in [data, bytearray(data), memoryview(data)]:
+            result = parse(binary, zero_copy=True)
+            self.assertIsInstance(result[0].elements[0], ZeroCopyWord)
+            self.assertEqual('Bär', result[0].elements[0].form)
+            self.assertEqual(content, to_conllu(result))
+
+        with self.assertRaises(TypeError):
+            parse(content, zero_copy=True)
+
+    def test_zero_copy_unsupported_options(self):
+        data = b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+        for options in [{'engine': 'ply'}, {'lazy': True},
+                        {'lazy_fields': True}, {'fields': ['form']},
+                        {'keep_lines': True}]:
+            with self.assertRaises(ValueError):
+                parse(data, zero_copy=True, **options)
+
+    def test_parse_file_zero_copy(self):
+        content = '# Föo\n1\tBär\tbär\tNOUN\t_\tA=B\t0\troot\t_\t_\n\n' \
+                  '# Baz\n1\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            result = parse_file(path, zero_copy=True)
+            self.assertEqual(content, to_conllu(result))
+
+            result = parse_file(path, zero_copy=True,
+                                where=lambda comments: comments == ['Baz'])
+            self.assertEqual(['Qux'], [s.elements[0].form for s in result])
+
+            word = result[0].elements[0]
+            del result
+
+        # the mapping outlives the file and its directory
+        self.assertEqual('Qux', word.form)
+
+    def test_parse_file_zero_copy_errors(self):
+        with self._temporary_file(b'') as path:
+            with self.assertRaises(IllegalEofError):
+                parse_file(path, zero_copy=True)
+
+        content = b'1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'
+        with self._temporary_file(content) as path:
+            with self.assertRaises(IllegalCharacterError):
+                parse_file(path, zero_copy=True)
+            with self.assertRaises(ValueError):
+                parse_file(path, zero_copy=True, lazy=True)
+
+    def test_parse_parallel(self):
+        content = ''.join(
+            f'# sent_id = {number}\n'
+            f'1\tFöo{number}\t_\tNOUN\t_\tA=B\t0\troot\t0:root\t_\n'
+            f'1.1\tBär\t_\t_\t_\t_\t_\t_\t1:dep\t_\n'
+            '\n'
+            for number in range(100)
+        )
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            with ProcessPoolExecutor(2) as executor:
+                for engine in conllu.ENGINES:
+                    result = parse_parallel(path, engine=engine,
+                                            chunk_size=300, executor=executor)
+                    self.assertEqual(content, to_conllu(result))
+
+            result = parse_parallel(path, workers=2, chunk_size=1000,
+                                    lazy_fields=True)
+            self.assertIsInstance(result[0].elements[0], LazyFieldsWord)
+            self.assertEqual(content, to_conllu(result))
+
+    def test_iter_parse_parallel_yields_sentences_in_order(self):
+        content = ''.join(
+            f'1\tFoo{number}\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+            for number in range(50)
+        )
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            with ProcessPoolExecutor(2) as executor:
+                result = iter_parse_parallel(path, chunk_size=40,
+                                             workers=2, executor=executor)
+                self.assertIsInstance(result, GeneratorType)
+                self.assertEqual(
+                    [f'Foo{number}' for number in range(50)],
+                    [sentence.elements[0].form for sentence in result]
+                )
+
+    def test_parse_parallel_error_has_absolute_position(self):
+        sentences = [f'1\tFöo{number}\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+                     for number in range(50)]
+        sentences[31] = '1\tBär\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'
+        sentences[42] = '1\tBaz\t_\t_\t_\t_\t_\t_\t_\n\n'
+        content = ''.join(sentences).encode('utf-8')
+
+        with self._temporary_file(content) as path:
+            with ProcessPoolExecutor(2) as executor:
+                for chunk_size in [50, 1000]:
+                    parsed = []
+                    with self.assertRaises(IllegalCharacterError) as context:
+                        for sentence in iter_parse_parallel(
+                                path, chunk_size=chunk_size,
+                                executor=executor):
+                            parsed.append(sentence)
+
+                    # all the sentences preceding the error are yielded,
+                    # even when they share the range of the invalid one
+                    self.assertEqual(31, len(parsed))
+                    self.assertEqual('Föo30', parsed[-1].elements[0].form)
+                    self.assertEqual(63, context.exception.line_number)
+                    self.assertEqual(14, context.exception.column_number)
+
+    def test_parse_parallel_small_file_is_parsed_in_process(self):
+        content = b'1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+
+        with self._temporary_file(content) as path:
+            with patch.object(parallel, 'ProcessPoolExecutor') as mock:
+                result = parse_parallel(path)
+
+        mock.assert_not_called()
+        self.assertEqual(content.decode(), to_conllu(result))
+
+    def test_parse_parallel_empty_file(self):
+        with self._temporary_file(b'') as path:
+            with ProcessPoolExecutor(1) as executor:
+                with self.assertRaises(IllegalEofError):
+                    parse_parallel(path, executor=executor)
+
+    def test_parse_parallel_fields(self):
+        content = ''.join(
+            f'1\tFoo{number}\tfoo\tNOUN\t_\tA=B\t0\troot\t_\t_\n\n'
+            for number in range(20)
+        )
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            expected = parse_file(path, fields=['upos'])
+            with ProcessPoolExecutor(2) as executor:
+                result = parse_parallel(path, chunk_size=100,
+                                        executor=executor,
+                                        fields=(name for name in ['upos']))
+
+        self.assertEqual(to_conllu(expected), to_conllu(result))
+        self.assertEqual((None, UposTag.NOUN),
+                         (result[0].elements[0].form,
+                          result[0].elements[0].upos))
+
+    def test_parse_parallel_where(self):
+        content = ''.join(
+            f'# sent_id = {number}\n'
+            f'1\tFoo{number}\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+            for number in range(20)
+        )
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            with ProcessPoolExecutor(2) as executor:
+                result = parse_parallel(path, chunk_size=100,
+                                        executor=executor,
+                                        where=_is_odd_sentence)
+
+        self.assertEqual([f'Foo{number}' for number in range(1, 20, 2)],
+                         [s.elements[0].form for s in result])
+
+    def test_parse_parallel_keep_lines(self):
+        content = ''.join(f'1\tFoo{number}\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+                          for number in range(20))
+
+        with self._temporary_file(content.encode('utf-8')) as path:
+            with ProcessPoolExecutor(2) as executor:
+                result = parse_parallel(path, chunk_size=100,
+                                        executor=executor, keep_lines=True)
+
+        self.assertEqual(content, to_conllu(result))
+        self.assertEqual('1\tFoo0\t_\t_\t_\t_\t_\t_\t_\t_',
+                         result[0].elements[0].source_line)
+
+    def test_parse_parallel_unsupported_options(self):
+        with self._temporary_file(b'') as path:
+            with self.assertRaises(ValueError):
+                parse_parallel(path, engine='ply', lazy_fields=True)
+
+    def test_parse_treebank(self):
+        with self._temporary_treebank() as directory:
+            expected = [
+                (path, sentence.to_conllu())
+                for path in sorted(self._treebank_paths(directory))
+                for sentence in parse_file(path)
+            ]
+
+            with ProcessPoolExecutor(2) as executor:
+                for engine in conllu.ENGINES:
+                    result = parse_treebank(directory, engine=engine,
+                                            chunk_size=100, executor=executor)
+                    self.assertEqual(
+                        expected,
+                        [(path, sentence.to_conllu())
+                         for path, sentence in result]
+                    )
+
+            result = parse_treebank(directory, workers=2, lazy_fields=True)
+            self.assertIsInstance(result[0][1].elements[0], LazyFieldsWord)
+            self.assertEqual(
+                expected,
+                [(path, sentence.to_conllu()) for path, sentence in result]
+            )
+
+    def test_parse_treebank_with_glob_pattern(self):
+        with self._temporary_treebank() as directory:
+            pattern = os.path.join(directory, '**', '*-train.conllu')
+            with ProcessPoolExecutor(1) as executor:
+                result = iter_parse_treebank(pattern, executor=executor)
+                self.assertIsInstance(result, GeneratorType)
+                self.assertEqual(
+                    [(os.path.join(directory, 'a', 'a-train.conllu'), 'A0'),
+                     (os.path.join(directory, 'b', 'b-train.conllu'), 'B0'),
+                     (os.path.join(directory, 'b', 'b-train.conllu'), 'B1')],
+                    [(path, sentence.elements[0].form)
+                     for path, sentence in result]
+                )
+
+    def test_parse_treebank_error_has_absolute_position(self):
+        with self._temporary_treebank() as directory:
+            path = os.path.join(directory, 'b', 'b-train.conllu')
+            with open(path, 'ab') as file:
+                file.write(b'1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n')
+
+            with ProcessPoolExecutor(2) as executor:
+                for chunk_size in [30, 2**22]:
+                    parsed = []
+                    with self.assertRaises(IllegalCharacterError) as context:
+                        for pair in iter_parse_treebank(
+                                directory, chunk_size=chunk_size,
+                                executor=executor):
+                            parsed.append(pair)
+
+                    self.assertEqual(11, len(parsed))
+                    self.assertEqual((path, 'B1'),
+                                     (parsed[-1][0],
+                                      parsed[-1][1].elements[0].form))
+                    self.assertEqual(5, context.exception.line_number)
+                    self.assertEqual(14, context.exception.column_number)
+
+    def test_parse_treebank_without_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual([], parse_treebank(directory))
+
+    def test_parse_treebank_unsupported_options(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                parse_treebank(directory, engine='ply', lazy_fields=True)
+
+    def test_parse_sentence(self):
+        content = '# sent_id = 1\n1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+
+        for text in (content, content[:-1], content[:-2]):
+            sentence = parse_sentence(text)
+            self.assertIs(Sentence, type(sentence))
+            self.assertEqual(content, sentence.to_conllu())
+
+    def test_parse_sentence_errors(self):
+        with self.assertRaises(IllegalCharacterError) as context:
+            parse_sentence('1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n', 7)
+        self.assertEqual(7, context.exception.line_number)
+
+        for content in ('', '\n\n',
+                        '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+                        '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n'):
+            with self.assertRaises(ValueError):
+                parse_sentence(content)
 
     def test_to_conllu_with_empty_array(self):
         self.assertEqual('', to_conllu([]))
@@ -56,6 +897,182 @@ class TestConlluModule(unittest.TestCase):
         expected = 'Foo\nBar\nBaz\n'
         self.assertEqual(expected, to_conllu(sentences))
 
+    def test_write_conllu_to_text_stream(self):
+        stream = io.StringIO()
+        sentences = (FakeSentence(f'{text}\n') for text in ['Foo', 'Bar'])
+
+        self.assertEqual(2, write_conllu(sentences, stream))
+        self.assertEqual('Foo\nBar\n', stream.getvalue())
+
+    def test_write_conllu_to_binary_stream(self):
+        stream = io.BytesIO()
+        sentences = [FakeSentence('Föo\n'), FakeSentence('Bär\n')]
+
+        self.assertEqual(2, write_conllu(sentences, stream,
+                                         encoding='latin-1'))
+        self.assertEqual('Föo\nBär\n'.encode('latin-1'), stream.getvalue())
+
+    def test_write_conllu_to_binary_file(self):
+        content = '# Föo\n1\tBär\t_\t_\t_\t_\t_\t_\t_\t_\n\n' * 3
+
+        with self._temporary_file(b'') as path:
+            with open(path, 'wb') as file:
+                write_conllu(parse(content), file)
+            with open(path, 'rb') as file:
+                self.assertEqual(content.encode('utf-8'), file.read())
+
+    def test_write_conllu_in_batches(self):
+        stream = Mock(spec=['write'])
+        sentences = [FakeSentence(f'{text}\n')
+                     for text in ['Foo', 'Bar', 'Baz', 'Qux', 'Quux']]
+
+        self.assertEqual(5, write_conllu(sentences, stream, buffer_size=8))
+        self.assertEqual(
+            [(('Foo\nBar\n',),), (('Baz\nQux\n',),), (('Quux\n',),)],
+            stream.write.call_args_list
+        )
+
+    def test_write_conllu_with_no_sentences(self):
+        stream = Mock(spec=['write'])
+        self.assertEqual(0, write_conllu([], stream))
+        stream.write.assert_not_called()
+
+    @staticmethod
+    @contextmanager
+    def _temporary_file(content: bytes):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'test.conllu')
+            with open(path, 'wb') as file:
+                file.write(content)
+            yield path
+
+    @staticmethod
+    @contextmanager
+    def _temporary_treebank():
+        files = {
+            ('a', 'a-dev.conllu'): 8,
+            ('a', 'a-train.conllu'): 1,
+            ('b', 'b-train.conllu'): 2,
+            ('b', 'README.txt'): 0,
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            for (subdirectory, name), size in files.items():
+                os.makedirs(os.path.join(directory, subdirectory),
+                            exist_ok=True)
+                prefix = subdirectory.upper()
+                with open(os.path.join(directory, subdirectory, name),
+                          'w', encoding='utf-8') as file:
+                    for number in range(size):
+                        file.write(f'1\t{prefix}{number}\t_\t_\t_\t_\t_\t_'
+                                   f'\t_\t_\n\n')
+            yield directory
+
+    @staticmethod
+    def _treebank_paths(directory: str) -> List[str]:
+        return [os.path.join(directory, 'a', 'a-dev.conllu'),
+                os.path.join(directory, 'a', 'a-train.conllu'),
+                os.path.join(directory, 'b', 'b-train.conllu')]
+
+
+class TestConcurrentParsing(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+
+        for number in range(32):
+            path = os.path.join(self.directory.name, f'{number}.conllu')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(self._make_content(number))
+            self.paths.append(path)
+
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # forces frequent thread switches
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+        self.directory.cleanup()
+
+    @staticmethod
+    def _make_content(number: int) -> str:
+        sentences = []
+        for index in range(20 + number):
+            misc = 'foo bar' if number % 4 == 3 and index == number else '_'
+            sentences.append(
+                f'# sent_id = {number}-{index}\n'
+                f'1-2\tFöo{index}\t_\t_\t_\t_\t_\t_\t_\t_\n'
+                f'1\tFö\tfö\tNOUN\t_\tA=B|C=D\t0\troot\t0:root\t_\n'
+                f'2\to{index}\to\tADP\t_\t_\t1\tcase\t1:case\t{misc}\n'
+                f'2.1\tBär\t_\t_\t_\t_\t_\t_\t1:dep\t_\n'
+                '\n'
+            )
+        return ''.join(sentences)
+
+    @staticmethod
+    def _parse_outcome(function, *args, **kwargs):
+        try:
+            return to_conllu(function(*args, **kwargs))
+        except (LexerError, ParserError) as error:
+            return type(error), str(error)
+
+    def _parse_all(self, executor=None):
+        tasks = []
+        for engine in conllu.ENGINES:
+            for path in self.paths:
+                with open(path, encoding='utf-8') as file:
+                    content = file.read()
+                tasks.append((parse, content, engine))
+                tasks.append((parse_file, path, 'utf-8', engine))
+
+        if executor is None:
+            return [self._parse_outcome(*task) for task in tasks]
+        return list(executor.map(lambda task: self._parse_outcome(*task),
+                                 tasks))
+
+    def test_parse_from_many_threads(self):
+        expected = self._parse_all()
+        self.assertTrue(any(isinstance(item, tuple) for item in expected))
+
+        with ThreadPoolExecutor(8) as executor:
+            for _ in range(2):
+                self.assertEqual(expected, self._parse_all(executor))
+
+    def test_each_thread_owns_its_parsers(self):
+        parsers = {}
+
+        def get_parsers(name):
+            parsers[name] = [conllu.get_parser(engine)
+                             for engine in ['fast', 'ply', 'fast']]
+
+        threads = [threading.Thread(target=get_parsers, args=(name,))
+                   for name in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIs(parsers[0][0], parsers[0][2])
+        self.assertIsNot(parsers[0][0], parsers[1][0])
+        self.assertIsNot(parsers[0][1], parsers[1][1])
+
+
+def _run_aparse(chunks: List[bytes], **kwargs) -> List[Sentence]:
+    """Runs :func:`aparse` over a stream providing the given chunks, and
+    returns the list of all the parsed sentences.
+    """
+    async def run():
+        reader = asyncio.StreamReader()
+        for chunk in chunks:
+            reader.feed_data(chunk)
+        reader.feed_eof()
+        return [sentence async for sentence in aparse(reader, **kwargs)]
+
+    return asyncio.run(run())
+
+
+def _is_odd_sentence(comments: List[str]) -> bool:
+    return int(comments[0].split(' = ')[1]) % 2 == 1
+
 
 class FakeSentence(Sentence):
     def __init__(self, fake_conllu):
@@ -0,0 +1,103 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from colonel.conllu.lazyfields import LazyFieldsWord, LazyFieldsEmptyNode
+from colonel.emptynode import EmptyNode
+from colonel.upostag import UposTag
+from colonel.word import Word
+
+
+class TestLazyFieldsWord(unittest.TestCase):
+
+    def setUp(self):
+        self.word = LazyFieldsWord(
+            index=1,
+            form='Foo',
+            upos=UposTag.NOUN,
+            feats='Number=Sing|Abbr[psor]=Yes,No',
+            head=0,
+            deprel='root',
+            deps='0:root|2:obl:tmod'
+        )
+
+    def test_is_a_word(self):
+        self.assertIsInstance(self.word, Word)
+        self.assertTrue(self.word.is_valid())
+
+    def test_init_without_fields(self):
+        word = LazyFieldsWord(index=1)
+        self.assertIsNone(word.feats)
+        self.assertIsNone(word.deps)
+        self.assertTrue(word.is_decoded)
+        self.assertEqual('1\t_\t_\t_\t_\t_\t_\t_\t_\t_', word.to_conllu())
+
+    def test_fields_are_decoded_on_access(self):
+        self.assertFalse(self.word.is_decoded)
+
+        self.assertEqual(
+            (('Number', ('Sing',)), ('Abbr[psor]', ('Yes', 'No'))),
+            self.word.feats
+        )
+        self.assertFalse(self.word.is_decoded)
+        self.assertIs(self.word.feats, self.word.feats)
+
+        self.assertEqual(((0, 'root'), (2, 'obl:tmod')), self.word.deps)
+        self.assertTrue(self.word.is_decoded)
+
+    def test_fields_can_be_assigned(self):
+        self.word.feats = (('Foo', ('Bar',)),)
+        self.word.deps = None
+
+        self.assertTrue(self.word.is_decoded)
+        self.assertEqual((('Foo', ('Bar',)),), self.word.feats)
+        self.assertIsNone(self.word.deps)
+
+    def test_to_conllu_with_raw_fields(self):
+        self.assertEqual(
+            '1\tFoo\t_\tNOUN\t_\tNumber=Sing|Abbr[psor]=Yes,No\t0\troot\t'
+            '0:root|2:obl:tmod\t_',
+            self.word.to_conllu()
+        )
+        self.assertFalse(self.word.is_decoded)
+
+    def test_to_conllu_with_decoded_fields(self):
+        expected = self.word.to_conllu()
+        self.word.feats
+        self.word.deps
+        self.assertEqual(expected, self.word.to_conllu())
+
+    def test_to_conllu_with_assigned_fields(self):
+        self.word.feats = 'Foo=Bar'
+        self.word.deps = ((1, 'nsubj'),)
+        self.assertEqual(
+            '1\tFoo\t_\tNOUN\t_\tFoo=Bar\t0\troot\t1:nsubj\t_',
+            self.word.to_conllu()
+        )
+
+
+class TestLazyFieldsEmptyNode(unittest.TestCase):
+
+    def test_fields_are_decoded_on_access(self):
+        node = LazyFieldsEmptyNode(main_index=1, sub_index=1, form='Foo',
+                                   feats='Foo=Bar', deps='1:nsubj')
+
+        self.assertIsInstance(node, EmptyNode)
+        self.assertEqual('1.1\tFoo\t_\t_\t_\tFoo=Bar\t_\t_\t1:nsubj\t_',
+                         node.to_conllu())
+        self.assertFalse(node.is_decoded)
+        self.assertEqual((('Foo', ('Bar',)),), node.feats)
+        self.assertEqual(((1, 'nsubj'),), node.deps)
+        self.assertTrue(node.is_decoded)
@@ -0,0 +1,130 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+from colonel.conllu.engines import get_parser
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.lazysentence import LazySentence
+from colonel.sentence import Sentence
+from colonel.word import Word
+
+_CONTENT = '#sent_id = 1\n' \
+           '# text =  Foo bar \n' \
+           '1\tFoo\t_\t_\t_\t_\t0\troot\t_\t_\n' \
+           '2\tbar\t_\t_\t_\t_\t1\tobj\t_\t_\n' \
+           '\n'
+
+
+@contextmanager
+def _record_calls():
+    """Records the parser instance and the arguments of each call of
+    FastParser.parse(), in the yielded list.
+    """
+    calls = []
+    parse = FastParser.parse
+
+    def wrapper(parser, content, line_number, **options):
+        calls.append((parser, content, line_number))
+        return parse(parser, content, line_number, **options)
+
+    with patch.object(FastParser, 'parse', wrapper):
+        yield calls
+
+
+class TestLazySentence(unittest.TestCase):
+
+    def setUp(self):
+        self.sentence = LazySentence(
+            _CONTENT, 1, ['sent_id = 1', 'text =  Foo bar'])
+
+    def test_is_a_sentence(self):
+        self.assertIsInstance(self.sentence, Sentence)
+
+    def test_elements_are_built_on_first_access(self):
+        self.assertFalse(self.sentence.is_materialized)
+
+        with _record_calls() as calls:
+            elements = self.sentence.elements
+            self.assertIs(elements, self.sentence.elements)
+
+        self.assertEqual([(get_parser(), _CONTENT, 1)], calls)
+        self.assertTrue(self.sentence.is_materialized)
+        self.assertEqual(['Foo', 'bar'], [e.form for e in elements])
+
+    def test_elements_are_built_by_the_parser_of_the_current_thread(self):
+        parsers = []
+
+        def materialize():
+            parsers.append(get_parser())
+            self.assertEqual(2, len(self.sentence.elements))
+
+        with _record_calls() as calls:
+            thread = threading.Thread(target=materialize)
+            thread.start()
+            thread.join()
+
+        self.assertIsNot(get_parser(), parsers[0])
+        self.assertEqual([(parsers[0], _CONTENT, 1)], calls)
+
+    def test_options(self):
+        sentence = LazySentence(_CONTENT, 1, [], {'fields': ('form',)})
+        self.assertEqual(['Foo', 'bar'], [e.form for e in sentence.elements])
+        self.assertEqual([None, None], [e.head for e in sentence.elements])
+
+    def test_sentence_methods(self):
+        self.assertTrue(self.sentence.is_valid())
+        self.assertEqual(['Foo', 'bar'],
+                         [w.form for w in self.sentence.words()])
+
+    def test_elements_can_be_replaced(self):
+        self.sentence.elements = [Word(index=1, form='Baz')]
+        self.assertTrue(self.sentence.is_materialized)
+        self.assertEqual(
+            '# sent_id = 1\n'
+            '# text =  Foo bar\n'
+            '1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n'
+            '\n',
+            self.sentence.to_conllu()
+        )
+
+    def test_to_conllu_returns_the_original_text(self):
+        self.assertEqual(_CONTENT, self.sentence.to_conllu())
+        self.assertFalse(self.sentence.is_materialized)
+
+    def test_to_conllu_after_access_to_elements(self):
+        self.sentence.elements[1].deprel = 'nsubj'
+        self.assertEqual(
+            '# sent_id = 1\n'
+            '# text =  Foo bar\n'
+            '1\tFoo\t_\t_\t_\t_\t0\troot\t_\t_\n'
+            '2\tbar\t_\t_\t_\t_\t1\tnsubj\t_\t_\n'
+            '\n',
+            self.sentence.to_conllu()
+        )
+
+    def test_to_conllu_after_changing_comments(self):
+        self.sentence.comments.append('Baz')
+        self.assertEqual(
+            '# sent_id = 1\n'
+            '# text =  Foo bar\n'
+            '# Baz\n'
+            '1\tFoo\t_\t_\t_\t_\t0\troot\t_\t_\n'
+            '2\tbar\t_\t_\t_\t_\t1\tobj\t_\t_\n'
+            '\n',
+            self.sentence.to_conllu()
+        )
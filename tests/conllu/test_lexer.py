@@ -13,12 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib.util
+import os
+import pickle
+import tempfile
 import unittest
 from typing import List
 from ply.lex import Lexer, LexToken
+from colonel.conllu import lextab
 from colonel.conllu.lexer import ConlluLexerBuilder, IllegalCharacterError
 
 
+class _NoRfindString(str):
+    def rfind(self, *args):
+        raise AssertionError('unexpected search')
+
+
 class TestConlluLexerBuilder(unittest.TestCase):
 
     @staticmethod
@@ -30,6 +40,44 @@ class TestConlluLexerBuilder(unittest.TestCase):
     def test_build_returns_a_lexer(self):
         self.assertIsInstance(ConlluLexerBuilder.build(), Lexer)
 
+    def test_build_returns_an_optimized_lexer(self):
+        self.assertTrue(ConlluLexerBuilder.build().lexoptimize)
+
+    def test_build_without_optimization(self):
+        lexer = ConlluLexerBuilder(optimize=False).lexer
+        self.assertFalse(lexer.lexoptimize)
+        lexer.input('1\t_\t_\t_\t_\t_\t_\t_\t_\t_')
+        self.assertEqual(19, len(list(lexer)))
+
+    def test_shipped_table_is_up_to_date(self):
+        with tempfile.TemporaryDirectory() as outputdir:
+            ConlluLexerBuilder.write_table(outputdir)
+            path = os.path.join(outputdir, 'lextab.py')
+            spec = importlib.util.spec_from_file_location('lextab', path)
+            generated = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(generated)
+
+        for name in ['_lextokens', '_lexreflags', '_lexliterals',
+                     '_lexstateinfo', '_lexstatere', '_lexstateignore',
+                     '_lexstateerrorf', '_lexstateeoff']:
+            self.assertEqual(
+                getattr(generated, name), getattr(lextab, name),
+                f'{name} differs: please regenerate the lexer table')
+
+    def test_reset(self):
+        builder = ConlluLexerBuilder()
+        builder.lexer.input('1\tFoo\t_')
+        list(builder.lexer)
+
+        builder.reset(5)
+        builder.lexer.input('1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n')
+        tokens = list(builder.lexer)
+
+        self.assertEqual(20, len(tokens))
+        self.assertEqual('Bar', tokens[2].value)
+        self.assertEqual(5, tokens[0].lineno)
+        self.assertEqual(6, builder.lexer.lineno)
+
     def test_lexer_error_has_correct_line_and_column(self):
         data = '# Foo\n' \
                '# Bar\n' \
@@ -41,6 +89,45 @@ class TestConlluLexerBuilder(unittest.TestCase):
         self.assertEqual(3, err_context.exception.line_number)
         self.assertEqual(12, err_context.exception.column_number)
 
+    def test_lexer_error_can_be_pickled(self):
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            self._tokenize('# Foo\n1\t_\t_\t_\tfoo bar')
+
+        error = err_context.exception
+        restored = pickle.loads(pickle.dumps(error))
+
+        self.assertIsInstance(restored, IllegalCharacterError)
+        self.assertEqual(str(error), str(restored))
+        self.assertEqual((2, 12),
+                         (restored.line_number, restored.column_number))
+
+    def test_find_column_uses_the_tracked_line_start(self):
+        lexer = ConlluLexerBuilder.build()
+        lexer.input('# Foo\n1\tBar')
+        tokens = list(lexer)
+
+        lexer.lexdata = _NoRfindString(lexer.lexdata)
+        lexer.line_start_data = lexer.lexdata
+
+        self.assertEqual([1, 2, 3], [
+            ConlluLexerBuilder.find_column(token) for token in tokens[2:]
+        ])
+
+    def test_find_column_ignores_line_start_of_previous_input(self):
+        data = '# Foo\n# Bar\n1\t_\t_\t_\tfoo bar\t_\t_\t_\t_\t_'
+        builder = ConlluLexerBuilder()
+        lexer = builder.lexer
+        lexer.input(data)
+        with self.assertRaises(IllegalCharacterError):
+            list(lexer)
+
+        for new_data in [data, '1\t_\t_\t_\tfoo bar\t_\t_\t_\t_\t_']:
+            builder.reset()
+            lexer.input(new_data)
+            with self.assertRaises(IllegalCharacterError) as err_context:
+                list(lexer)
+            self.assertEqual(12, err_context.exception.column_number)
+
     def test_comment(self):
         data = '# A comment'
         tokens = self._tokenize(data)
@@ -0,0 +1,101 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import pickle
+import unittest
+from colonel.conllu import parse, to_conllu
+from colonel.conllu.packing import pack_sentences, unpack_sentences, \
+    dumps_sentences, loads_sentences
+from colonel.sentence import Sentence
+from colonel.upostag import UposTag
+from colonel.word import Word
+
+_CONTENT = '# sent_id = 1\n' \
+           '1-2\tFoobar\t_\t_\t_\t_\t_\t_\t_\tSpaceAfter=No\n' \
+           '1\tFoo\tfoo\tNOUN\tNN\tA=B|C=D,E\t0\troot\t0:root\t_\n' \
+           '2\tbar\t_\tVERB\t_\t_\t1\tobj\t1:obj|3:conj\t_\n' \
+           '2.1\tBaz\t_\t_\t_\t_\t_\t_\t1:dep\t_\n' \
+           '\n' \
+           '1\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+           '\n'
+
+
+class TestPacking(unittest.TestCase):
+
+    def _round_trip(self, sentences):
+        packed = pickle.loads(pickle.dumps(pack_sentences(sentences)))
+        return unpack_sentences(packed)
+
+    def test_round_trip(self):
+        sentences = parse(_CONTENT)
+        result = self._round_trip(sentences)
+
+        self.assertEqual(_CONTENT, to_conllu(result))
+        for sentence, restored in zip(sentences, result):
+            self.assertIs(type(sentence), type(restored))
+            self.assertEqual(sentence.comments, restored.comments)
+            self.assertEqual(
+                [type(element) for element in sentence.elements],
+                [type(element) for element in restored.elements]
+            )
+
+        word = result[0].elements[1]
+        self.assertIs(UposTag.NOUN, word.upos)
+        self.assertEqual((('A', ('B',)), ('C', ('D', 'E'))), word.feats)
+        self.assertEqual(((0, 'root'),), word.deps)
+
+    def test_lazy_fields_are_not_decoded(self):
+        result = self._round_trip(parse(_CONTENT, lazy_fields=True))
+        word = result[0].elements[1]
+
+        self.assertFalse(word.is_decoded)
+        self.assertEqual(_CONTENT, to_conllu(result))
+        self.assertEqual((('A', ('B',)), ('C', ('D', 'E'))), word.feats)
+
+    def test_empty_sentence(self):
+        result = self._round_trip([Sentence(elements=[], comments=['Foo'])])
+        self.assertEqual([], result[0].elements)
+        self.assertEqual(['Foo'], result[0].comments)
+
+    def test_lazy_sentences_cannot_be_packed(self):
+        with self.assertRaises(TypeError):
+            pack_sentences(parse(_CONTENT, lazy=True))
+
+    def test_objects_with_dict_cannot_be_packed(self):
+        class CustomWord(Word):
+            pass
+
+        with self.assertRaises(TypeError):
+            pack_sentences([Sentence(elements=[CustomWord(index=1)])])
+
+    def test_dumps_and_loads(self):
+        data = dumps_sentences(parse(_CONTENT))
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(_CONTENT, to_conllu(loads_sentences(data)))
+
+    def test_loads_restores_the_garbage_collector_state(self):
+        data = dumps_sentences(parse(_CONTENT))
+
+        self.assertTrue(gc.isenabled())
+        loads_sentences(data)
+        self.assertTrue(gc.isenabled())
+
+        gc.disable()
+        try:
+            loads_sentences(data)
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
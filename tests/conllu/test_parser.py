@@ -13,11 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib.util
+import os
+import pickle
+import tempfile
+import time
 import unittest
 from typing import List
 from ply.yacc import LRParser
-from colonel.conllu.parser import ConlluParserBuilder, IllegalTokenError, \
-    IllegalEofError, IllegalMultiwordError, IllegalEmptyNodeError
+from colonel.conllu import parsetab
+from colonel.conllu.lexer import IllegalCharacterError
+from colonel.conllu.parser import ConlluParserBuilder, ParserError, \
+    IllegalTokenError, IllegalEofError, IllegalMultiwordError, \
+    IllegalEmptyNodeError, Parser
 from colonel.sentence import Sentence
 from colonel.word import Word
 from colonel.emptynode import EmptyNode
@@ -35,6 +43,72 @@ class TestConlluParserBuilder(unittest.TestCase):
     def test_build_returns_a_parser(self):
         self.assertIsInstance(ConlluParserBuilder.build(), LRParser)
 
+    def test_build_does_not_write_files(self):
+        directory = os.path.dirname(parsetab.__file__)
+        files = set(os.listdir(directory))
+        ConlluParserBuilder.build()
+        ConlluParserBuilder(optimize=False)
+        self.assertEqual(files, set(os.listdir(directory)))
+
+    def test_build_without_optimization(self):
+        parser = ConlluParserBuilder(optimize=False).parser
+        result = parser.parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n')
+        self.assertEqual('Foo', result[0].elements[0].form)
+
+    def test_shipped_table_is_up_to_date(self):
+        with tempfile.TemporaryDirectory() as outputdir:
+            ConlluParserBuilder.write_table(outputdir)
+            path = os.path.join(outputdir, 'parsetab.py')
+            spec = importlib.util.spec_from_file_location('parsetab', path)
+            generated = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(generated)
+
+        message = 'please regenerate the parser table'
+
+        for name in ['_lr_method', '_lr_signature', '_lr_action',
+                     '_lr_goto']:
+            self.assertEqual(
+                getattr(generated, name), getattr(parsetab, name),
+                f'{name} differs: {message}')
+
+        # Line numbers of the grammar rules are only used for debugging
+        self.assertEqual(
+            [item[:4] for item in generated._lr_productions],
+            [item[:4] for item in parsetab._lr_productions],
+            f'_lr_productions differs: {message}')
+
+    def test_parsing_time_grows_linearly_with_sentences(self):
+        parser = ConlluParserBuilder.build()
+        sentence = '# Foo\n' \
+                   '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                   '\n'
+
+        time_per_sentence = []
+
+        for count in [1000, 10000, 100000]:
+            data = sentence * count
+            start = time.perf_counter()
+            result = parser.parse(data)
+            time_per_sentence.append((time.perf_counter() - start) / count)
+            self.assertEqual(count, len(result))
+
+        # A generous bound, only meant to catch a quadratic growth
+        self.assertLess(time_per_sentence[2], time_per_sentence[0] * 3)
+        self.assertLess(time_per_sentence[1], time_per_sentence[0] * 3)
+
+    def test_long_sentence(self):
+        data = ''.join(f'# Comment {i}\n' for i in range(10000)) + \
+            ''.join(f'{i}\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n'
+                    for i in range(1, 10001)) + '\n'
+
+        result = self._parse(data)
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(10000, len(result[0].comments))
+        self.assertEqual(10000, len(result[0].elements))
+        self.assertEqual('Comment 9999', result[0].comments[-1])
+        self.assertEqual(10000, result[0].elements[-1].index)
+
     def test_token_error_has_expected_attributes(self):
         data = '# Foo\n' \
                '# Bar\n' \
@@ -55,6 +129,21 @@ class TestConlluParserBuilder(unittest.TestCase):
         with self.assertRaises(IllegalEofError):
             self._parse(data)
 
+    def test_errors_can_be_pickled(self):
+        for data in ['1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n\n',
+                     '# Foo\n',
+                     '1-2\tFoo\t_\t_\tNOUN\t_\t_\t_\t_\t_\n\n',
+                     '1.1\tFoo\t_\t_\t_\t_\t0\t_\t_\t_\n\n']:
+            with self.assertRaises(ParserError) as err_context:
+                self._parse(data)
+
+            error = err_context.exception
+            restored = pickle.loads(pickle.dumps(error))
+
+            self.assertIs(type(error), type(restored))
+            self.assertEqual(str(error), str(restored))
+            self.assertEqual(vars(error), vars(restored))
+
     def test_one_sentence(self):
         data = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
                '2\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
@@ -389,3 +478,59 @@ class TestConlluParserBuilder(unittest.TestCase):
             self._parse(data)
 
         self.assertEqual(1, err_context.exception.line_number)
+
+
+class TestParser(unittest.TestCase):
+
+    def test_parse_returns_sentences(self):
+        data = '# Foo\n' \
+               '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+               '\n'
+
+        result = Parser().parse(data)
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(['Foo'], result[0].comments)
+        self.assertEqual('Bar', result[0].elements[0].form)
+
+    def test_parse_many_times(self):
+        parser = Parser()
+
+        for form in ['Foo', 'Bar', 'Baz']:
+            data = f'1\t{form}\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+            result = parser.parse(data)
+            self.assertEqual(1, len(result))
+            self.assertEqual(form, result[0].elements[0].form)
+
+    def test_line_numbers_are_reset_between_calls(self):
+        parser = Parser()
+        data = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+               '\n' \
+               '\n'
+
+        for _ in range(2):
+            with self.assertRaises(IllegalTokenError) as err_context:
+                parser.parse(data)
+            self.assertEqual(4, err_context.exception.line_number)
+
+    def test_custom_first_line_number(self):
+        data = '1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'
+
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            Parser().parse(data, 42)
+
+        self.assertEqual(42, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_lexer_state_is_reset_after_an_error(self):
+        parser = Parser()
+
+        with self.assertRaises(IllegalCharacterError):
+            parser.parse('1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n')
+
+        with self.assertRaises(IllegalEofError):
+            parser.parse('1\tFoo\t_\tNOUN')
+
+        result = parser.parse('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n')
+        self.assertEqual(1, len(result))
+        self.assertEqual('Foo', result[0].elements[0].form)
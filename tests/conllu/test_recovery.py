@@ -0,0 +1,79 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.lexer import IllegalCharacterError
+from colonel.conllu.parser import IllegalTokenError, IllegalEofError, \
+    IllegalMultiwordError
+from colonel.conllu.recovery import ErrorRecord, parse_blocks
+
+
+class TestParseBlocks(unittest.TestCase):
+
+    def setUp(self):
+        self.parse = FastParser().parse
+
+    def test_valid_blocks(self):
+        blocks = [(1, '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'),
+                  (3, '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n\n'.encode('utf-8'))]
+        errors = []
+
+        sentences = list(parse_blocks(blocks, self.parse, errors))
+
+        self.assertEqual(['Foo', 'Bar'],
+                         [s.elements[0].form for s in sentences])
+        self.assertEqual([], errors)
+
+    def test_invalid_blocks_are_skipped(self):
+        blocks = [
+            (1, '1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'),
+            (3, '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n\n'),
+            (5, '\n'),
+            (6, '# Baz\n1-2\tBaz\t_\t_\tNOUN\t_\t_\t_\t_\t_\n\n'),
+            (9, '1\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n1\tQuux'),
+        ]
+        errors = []
+
+        sentences = list(parse_blocks(blocks, self.parse, errors))
+
+        self.assertEqual(['Bar'], [s.elements[0].form for s in sentences])
+        self.assertEqual(
+            [(IllegalCharacterError, 1, 14), (IllegalTokenError, 6, 1),
+             (IllegalMultiwordError, 7, None), (IllegalEofError, 10, None)],
+            [(type(e.error), e.line_number, e.column_number) for e in errors]
+        )
+
+    def test_decode_error(self):
+        blocks = [(4, '# Föo\n1\tBär\t_'.encode('utf-8')[:-4])]
+        errors = []
+
+        self.assertEqual([], list(parse_blocks(blocks, self.parse, errors)))
+        self.assertIsInstance(errors[0].error, UnicodeDecodeError)
+        self.assertEqual(5, errors[0].line_number)
+        self.assertEqual(4, errors[0].column_number)
+
+
+class TestErrorRecord(unittest.TestCase):
+
+    def test_message(self):
+        error = IllegalEofError()
+        self.assertEqual(str(error), ErrorRecord(error, 1).message)
+
+    def test_repr(self):
+        self.assertEqual(
+            'ErrorRecord(IllegalEofError, line_number=3, column_number=None)',
+            repr(ErrorRecord(IllegalEofError(), 3))
+        )
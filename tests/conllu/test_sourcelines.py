@@ -0,0 +1,117 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import pickle
+import unittest
+from colonel.conllu.sourcelines import SourceLineWord, SourceLineEmptyNode, \
+    SourceLineMultiword
+from colonel.emptynode import EmptyNode
+from colonel.multiword import Multiword
+from colonel.upostag import UposTag
+from colonel.word import Word
+
+_LINE = '1\tFoo\tfoo\tNOUN\t_\tB=C|A=B\t0\troot\t_\t_'
+
+
+class TestSourceLineWord(unittest.TestCase):
+
+    def setUp(self):
+        self.word = SourceLineWord(
+            line=_LINE,
+            index=1,
+            form='Foo',
+            lemma='foo',
+            upos=UposTag.NOUN,
+            feats=(('B', ('C',)), ('A', ('B',))),
+            head=0,
+            deprel='root'
+        )
+
+    def test_is_a_word(self):
+        self.assertIsInstance(self.word, Word)
+        self.assertTrue(self.word.is_valid())
+
+    def test_init_without_line(self):
+        word = SourceLineWord(index=1, form='Foo')
+        self.assertIsNone(word.source_line)
+        self.assertEqual('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_', word.to_conllu())
+
+    def test_to_conllu_returns_the_line(self):
+        self.assertIs(_LINE, self.word.source_line)
+        self.assertIs(_LINE, self.word.to_conllu())
+
+    def test_reading_does_not_discard_the_line(self):
+        self.assertEqual('Foo', self.word.form)
+        self.assertEqual(0, self.word.head)
+        self.assertIs(_LINE, self.word.source_line)
+
+    def test_assignment_discards_the_line(self):
+        self.word.deprel = 'nsubj'
+
+        self.assertIsNone(self.word.source_line)
+        self.assertEqual(
+            '1\tFoo\tfoo\tNOUN\t_\tB=C|A=B\t0\tnsubj\t_\t_',
+            self.word.to_conllu()
+        )
+
+    def test_assignment_of_equal_values_keeps_the_line(self):
+        self.word.deprel = 'root'
+        self.word.feats = (('B', ('C',)), ('A', ('B',)))
+        self.assertIs(_LINE, self.word.source_line)
+
+        self.word.head = False
+        self.assertIsNone(self.word.source_line)
+
+    def test_pickle_and_copy_keep_the_line(self):
+        for word in (pickle.loads(pickle.dumps(self.word)),
+                     copy.copy(self.word), copy.deepcopy(self.word)):
+            self.assertIs(SourceLineWord, type(word))
+            self.assertEqual(_LINE, word.source_line)
+            self.assertEqual('root', word.deprel)
+
+        self.word.misc = 'Foo=Bar'
+        word = pickle.loads(pickle.dumps(self.word))
+        self.assertIsNone(word.source_line)
+        self.assertEqual('Foo=Bar', word.misc)
+
+
+class TestSourceLineEmptyNode(unittest.TestCase):
+
+    def test_line_is_kept_until_assignment(self):
+        line = '1.1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_'
+        node = SourceLineEmptyNode(line=line, main_index=1, sub_index=1,
+                                   form='Foo')
+
+        self.assertIsInstance(node, EmptyNode)
+        self.assertIs(line, node.to_conllu())
+
+        node.sub_index = 2
+        self.assertEqual('1.2\tFoo\t_\t_\t_\t_\t_\t_\t_\t_', node.to_conllu())
+
+
+class TestSourceLineMultiword(unittest.TestCase):
+
+    def test_line_is_kept_until_assignment(self):
+        line = '1-2\tFoo\t_\t_\t_\t_\t_\t_\t_\t_'
+        multiword = SourceLineMultiword(line=line, first_index=1,
+                                        last_index=2, form='Foo')
+
+        self.assertIsInstance(multiword, Multiword)
+        self.assertIs(line, multiword.to_conllu())
+
+        multiword.form = 'Bar'
+        self.assertEqual('1-2\tBar\t_\t_\t_\t_\t_\t_\t_\t_',
+                         multiword.to_conllu())
@@ -0,0 +1,150 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+from colonel.conllu.splitter import iter_lines, split_lines, split_text, \
+    split_buffer, split_ranges
+
+
+class TestIterLines(unittest.TestCase):
+
+    def test_text_stream(self):
+        stream = io.StringIO('Foo\nBar\n')
+        self.assertEqual(['Foo\n', 'Bar\n'], list(iter_lines(stream)))
+
+    def test_binary_stream_is_decoded(self):
+        stream = io.BytesIO('Foo\nBär\n'.encode('utf-8'))
+        self.assertEqual(['Foo\n', 'Bär\n'], list(iter_lines(stream)))
+
+    def test_binary_stream_with_custom_encoding(self):
+        stream = io.BytesIO('Bär\n'.encode('latin-1'))
+        self.assertEqual(['Bär\n'], list(iter_lines(stream, 'latin-1')))
+
+
+class TestSplitLines(unittest.TestCase):
+
+    def test_empty_input(self):
+        self.assertEqual([], list(split_lines([])))
+
+    def test_one_block(self):
+        lines = ['# Foo\n', '1\tBar\n', '\n']
+        expected = [(1, '# Foo\n1\tBar\n\n')]
+        self.assertEqual(expected, list(split_lines(lines)))
+
+    def test_many_blocks(self):
+        lines = ['1\tFoo\n', '\n', '# Bar\n', '1\tBaz\n', '\n']
+        expected = [(1, '1\tFoo\n\n'), (3, '# Bar\n1\tBaz\n\n')]
+        self.assertEqual(expected, list(split_lines(lines)))
+
+    def test_incomplete_last_block(self):
+        lines = ['1\tFoo\n', '\n', '1\tBar\n']
+        expected = [(1, '1\tFoo\n\n'), (3, '1\tBar\n')]
+        self.assertEqual(expected, list(split_lines(lines)))
+
+    def test_consecutive_blank_lines(self):
+        lines = ['1\tFoo\n', '\n', '\n']
+        expected = [(1, '1\tFoo\n\n'), (3, '\n')]
+        self.assertEqual(expected, list(split_lines(lines)))
+
+    def test_custom_first_line_number(self):
+        lines = ['1\tFoo\n', '\n', '1\tBar\n', '\n']
+        expected = [(10, '1\tFoo\n\n'), (12, '1\tBar\n\n')]
+        self.assertEqual(expected, list(split_lines(lines, 10)))
+
+
+class TestSplitText(unittest.TestCase):
+
+    def test_empty_content(self):
+        self.assertEqual([], list(split_text('')))
+
+    def test_incomplete_last_block(self):
+        expected = [(1, '1\tFoo\n\n'), (3, '1\tBar')]
+        self.assertEqual(expected, list(split_text('1\tFoo\n\n1\tBar')))
+
+    def test_custom_first_line_number(self):
+        expected = [(10, '1\tFoo\n\n'), (12, '\n')]
+        self.assertEqual(expected, list(split_text('1\tFoo\n\n\n', 10)))
+
+    def test_same_blocks_as_split_lines(self):
+        content = '\n# Foo\n1\tBär\n\n\n1\tBaz\n2\tQux\n\n1\tQuux\n'
+        lines = io.StringIO(content).readlines()
+        self.assertEqual(list(split_lines(lines)), list(split_text(content)))
+
+
+class TestSplitBuffer(unittest.TestCase):
+
+    def test_empty_buffer(self):
+        self.assertEqual([], list(split_buffer(b'')))
+
+    def test_many_blocks(self):
+        buffer = b'1\tFoo\n\n# Bar\n1\tBaz\n\n'
+        expected = [(1, 0, 7), (3, 7, 20)]
+        self.assertEqual(expected, list(split_buffer(buffer)))
+
+    def test_incomplete_last_block(self):
+        buffer = b'1\tFoo\n\n1\tBar'
+        expected = [(1, 0, 7), (3, 7, 12)]
+        self.assertEqual(expected, list(split_buffer(buffer)))
+
+    def test_leading_and_consecutive_blank_lines(self):
+        buffer = b'\n1\tFoo\n\n\n'
+        expected = [(1, 0, 1), (2, 1, 8), (4, 8, 9)]
+        self.assertEqual(expected, list(split_buffer(buffer)))
+
+    def test_custom_first_line_number(self):
+        buffer = b'1\tFoo\n\n1\tBar\n\n'
+        expected = [(10, 0, 7), (12, 7, 14)]
+        self.assertEqual(expected, list(split_buffer(buffer, 10)))
+
+    def test_same_blocks_as_split_lines(self):
+        content = '\n# Foo\n1\tBär\n\n\n1\tBaz\n2\tQux\n\n1\tQuux\n'
+        buffer = content.encode('utf-8')
+
+        blocks = [
+            (line_number, buffer[start:end].decode('utf-8'))
+            for line_number, start, end in split_buffer(buffer)
+        ]
+
+        lines = io.StringIO(content).readlines()
+        self.assertEqual(list(split_lines(lines)), blocks)
+
+
+class TestSplitRanges(unittest.TestCase):
+
+    def test_empty_buffer(self):
+        self.assertEqual([], list(split_ranges(b'', 10)))
+
+    def test_ranges_end_at_sentence_boundaries(self):
+        buffer = b'1\tFoo\n\n1\tBar\n2\tBaz\n\n\n1\tQux\n\n1\tQuux'
+        expected = [(1, 0, 7), (3, 7, 20), (6, 20, 28), (9, 28, 34)]
+        self.assertEqual(expected, list(split_ranges(buffer, 6)))
+
+    def test_large_size(self):
+        buffer = b'1\tFoo\n\n1\tBar\n\n'
+        self.assertEqual([(5, 0, 14)], list(split_ranges(buffer, 1000, 5)))
+
+    def test_same_blocks_as_split_buffer(self):
+        buffer = b'\n# Foo\n1\tBar\n\n\n\n1\tBaz\n2\tQux\n\n1\tQuux\n'
+        blocks = list(split_buffer(buffer))
+
+        for size in range(1, len(buffer) + 2):
+            range_blocks = [
+                (line_number, start + offset, end + offset)
+                for first_line, offset, range_end in split_ranges(buffer, size)
+                for line_number, start, end in split_buffer(
+                    buffer[offset:range_end], first_line)
+            ]
+            self.assertEqual(blocks, range_blocks)
@@ -0,0 +1,191 @@
+# Copyright 2018 The NLP Odyssey Authors.
+# Copyright 2018 Marco Nicola <marconicola@disroot.org>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from mmap import mmap
+from unittest.mock import patch
+from colonel.conllu.fastparser import FastParser
+from colonel.conllu.lexer import IllegalCharacterError
+from colonel.conllu.parser import IllegalEofError
+from colonel.conllu.zerocopy import ZeroCopyWord, ZeroCopyEmptyNode, \
+    parse_buffer, parse_file
+from colonel.multiword import Multiword
+from colonel.upostag import UposTag
+from colonel.word import Word
+
+_CONTENT = '# sent_id = 1\n' \
+           '# text = Föo bär\n' \
+           '1-2\tFöobär\t_\t_\t_\t_\t_\t_\t_\tSpaceAfter=No\n' \
+           '1\tFöo\tföo\tNOUN\tNN\tA=B|C=D,E\t0\troot\t0:root\t_\n' \
+           '2\tbär\t_\tVERB\t_\t_\t1\tobj\t1:obj|3:conj\tFoo=Bar\n' \
+           '2.1\tBaz\tbaz\t_\tXX\tF=G\t_\t_\t1:dep\t_\n' \
+           '\n' \
+           '1\tQux\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+           '\n'
+
+_ATTRIBUTES = ['index', 'main_index', 'sub_index', 'first_index',
+               'last_index', 'form', 'lemma', 'upos', 'xpos', 'feats',
+               'head', 'deprel', 'deps', 'misc']
+
+
+def _values(sentences) -> list:
+    return [
+        (sentence.comments,
+         [[getattr(element, name, None) for name in _ATTRIBUTES]
+          for element in sentence.elements])
+        for sentence in sentences
+    ]
+
+
+class TestParseBuffer(unittest.TestCase):
+
+    def test_same_values_as_fast_parser(self):
+        result = parse_buffer(_CONTENT.encode('utf-8'))
+
+        self.assertEqual(_values(FastParser().parse(_CONTENT)),
+                         _values(result))
+        self.assertEqual(
+            [Multiword, ZeroCopyWord, ZeroCopyWord, ZeroCopyEmptyNode],
+            [type(element) for element in result[0].elements]
+        )
+        self.assertEqual(_CONTENT, ''.join(s.to_conllu() for s in result))
+
+    def test_text_values_are_not_stored(self):
+        result = parse_buffer(_CONTENT.encode('utf-8'))
+        word = result[0].elements[1]
+
+        self.assertTrue(word.is_buffered)
+        for name in ['form', 'lemma', 'xpos', 'feats', 'deprel', 'deps',
+                     'misc']:
+            slot = next(cls.__dict__[name] for cls in Word.__mro__
+                        if name in cls.__dict__.get('__slots__', ()))
+            with self.assertRaises(AttributeError):
+                slot.__get__(word)
+
+        self.assertEqual('Föo', word.form)
+        self.assertEqual(UposTag.NOUN, word.upos)
+
+    def test_assigned_values_replace_buffered_ones(self):
+        word = parse_buffer(_CONTENT.encode('utf-8'))[0].elements[2]
+
+        word.deprel = 'nsubj'
+        word.feats = None
+
+        self.assertEqual('nsubj', word.deprel)
+        self.assertIsNone(word.feats)
+        self.assertEqual('bär', word.form)
+        self.assertTrue(word.is_buffered)
+        self.assertEqual(
+            '2\tbär\t_\tVERB\t_\t_\t1\tnsubj\t1:obj|3:conj\tFoo=Bar',
+            word.to_conllu())
+
+        for name in ['form', 'lemma', 'xpos', 'deps', 'misc']:
+            setattr(word, name, None)
+        self.assertFalse(word.is_buffered)
+
+    def test_to_conllu_does_not_decode_fields(self):
+        sentences = parse_buffer(_CONTENT.encode('utf-8'))
+
+        with patch('colonel.conllu.zerocopy.decode_feats') as feats, \
+                patch('colonel.conllu.zerocopy.decode_deps') as deps:
+            self.assertEqual(_CONTENT,
+                             ''.join(s.to_conllu() for s in sentences))
+
+        feats.assert_not_called()
+        deps.assert_not_called()
+
+    def test_mmap_buffer(self):
+        data = _CONTENT.encode('utf-8')
+        with mmap(-1, len(data)) as buffer:
+            buffer.write(data)
+            result = parse_buffer(buffer)
+            self.assertEqual(_values(FastParser().parse(_CONTENT)),
+                             _values(result))
+
+    def test_parse_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'test.conllu')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(_CONTENT)
+
+            result = parse_file(path)
+            self.assertEqual(_values(FastParser().parse(_CONTENT)),
+                             _values(result))
+
+            empty_path = os.path.join(directory, 'empty.conllu')
+            with open(empty_path, 'w', encoding='utf-8'):
+                pass
+            with self.assertRaises(IllegalEofError):
+                parse_file(empty_path)
+
+    def test_error_has_absolute_position(self):
+        content = _CONTENT + '1\tFoo\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n\n'
+
+        with self.assertRaises(IllegalCharacterError) as err_context:
+            parse_buffer(content.encode('utf-8'), line_number=3)
+
+        self.assertEqual(12, err_context.exception.line_number)
+        self.assertEqual(14, err_context.exception.column_number)
+
+    def test_invalid_structure(self):
+        for content in ['', '\n', '# Foo\n\n', _CONTENT + '1\tFoo',
+                        _CONTENT + '\n']:
+            with self.assertRaises(Exception) as expected:
+                FastParser().parse(content)
+            with self.assertRaises(type(expected.exception)):
+                parse_buffer(content.encode('utf-8'))
+
+        with self.assertRaises(IllegalEofError):
+            parse_buffer(b'')
+
+    def test_where(self):
+        result = parse_buffer(_CONTENT.encode('utf-8'),
+                              where=lambda comments: not comments)
+
+        self.assertEqual(1, len(result))
+        self.assertEqual('Qux', result[0].elements[0].form)
+
+    def test_where_does_not_skip_invalid_structure(self):
+        word = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n'
+        for content in ['# Foo\n\n', f'# Foo\n{word}# Bar\n\n',
+                        f'{word}# Foo\n{word}\n']:
+            with self.assertRaises(Exception) as expected:
+                FastParser().parse(content, where=lambda comments: False)
+            with self.assertRaises(type(expected.exception)) as context:
+                parse_buffer(content.encode('utf-8'),
+                             where=lambda comments: False)
+            self.assertEqual(
+                (expected.exception.line_number,
+                 expected.exception.column_number),
+                (context.exception.line_number,
+                 context.exception.column_number))
+
+
+class TestZeroCopyElements(unittest.TestCase):
+
+    def test_constructed_elements_are_not_buffered(self):
+        word = ZeroCopyWord(index=1, form='Foo', deprel='root',
+                            feats=(('A', ('B',)),))
+        self.assertFalse(word.is_buffered)
+        self.assertEqual('Foo', word.form)
+        self.assertEqual('1\tFoo\t_\t_\t_\tA=B\t_\troot\t_\t_',
+                         word.to_conllu())
+
+        node = ZeroCopyEmptyNode(main_index=1, sub_index=2, lemma='bar')
+        self.assertFalse(node.is_buffered)
+        self.assertEqual('1.2\t_\tbar\t_\t_\t_\t_\t_\t_\t_', node.to_conllu())
+        self.assertFalse(hasattr(node, 'deprel'))
@@ -13,10 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
 import unittest
 from colonel.base_sentence_element import BaseSentenceElement
 
 
+class _CustomElement(BaseSentenceElement):
+    pass
+
+
 class TestBaseSentenceElement(unittest.TestCase):
 
     def test_init_form(self):
@@ -38,3 +44,31 @@ class TestBaseSentenceElement(unittest.TestCase):
     def test_to_conllu_is_not_implemented(self):
         with self.assertRaises(NotImplementedError):
             BaseSentenceElement().to_conllu()
+
+    def test_pickle(self):
+        element = BaseSentenceElement(form='Foo', misc='Bar')
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                result = pickle.loads(pickle.dumps(element, protocol))
+                self.assertIs(BaseSentenceElement, type(result))
+                self.assertEqual('Foo', result.form)
+                self.assertEqual('Bar', result.misc)
+
+    def test_pickle_objects_with_dict(self):
+        element = _CustomElement(form='Foo')
+        element.extra = 'Bar'
+
+        result = pickle.loads(pickle.dumps(element))
+
+        self.assertIs(_CustomElement, type(result))
+        self.assertEqual('Foo', result.form)
+        self.assertEqual('Bar', result.extra)
+
+    def test_copy(self):
+        element = BaseSentenceElement(form='Foo', misc='Bar')
+        result = copy.copy(element)
+
+        self.assertIsNot(element, result)
+        self.assertEqual('Foo', result.form)
+        self.assertEqual('Bar', result.misc)
@@ -1,4 +1,6 @@
 
+import copy
+import pickle
 import unittest
 from typing import Generator
 
@@ -7,10 +9,75 @@ from colonel.word import Word
 from colonel.emptynode import EmptyNode
 from colonel.multiword import Multiword
 from colonel.base_sentence_element import BaseSentenceElement
+from colonel.conllu.lexer import IllegalCharacterError
+from colonel.conllu.parser import IllegalTokenError
+from colonel.upostag import UposTag
+
+
+class _CustomSentence(Sentence):
+    pass
 
 
 class TestSentence(unittest.TestCase):
 
+    def test_from_conllu(self):
+        content = '# sent_id = 1\n' \
+                  '1-2\tFoobar\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '1\tFoo\tfoo\tNOUN\t_\tA=B\t0\troot\t0:root\t_\n' \
+                  '2\tbar\t_\t_\t_\t_\t1\tobj\t_\t_\n' \
+                  '2.1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '\n'
+
+        sentence = Sentence.from_conllu(content)
+
+        self.assertIs(Sentence, type(sentence))
+        self.assertEqual(['sent_id = 1'], sentence.comments)
+        self.assertEqual([Multiword, Word, Word, EmptyNode],
+                         [type(element) for element in sentence.elements])
+        self.assertIs(UposTag.NOUN, sentence.elements[1].upos)
+        self.assertEqual((('A', ('B',)),), sentence.elements[1].feats)
+        self.assertEqual(content, sentence.to_conllu())
+
+    def test_from_conllu_without_terminating_newlines(self):
+        content = '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+
+        for text in (content, content[:-1], content[:-2]):
+            self.assertEqual(content, Sentence.from_conllu(text).to_conllu())
+
+    def test_from_conllu_reports_exact_error_positions(self):
+        content = '# Foo\n' \
+                  '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n' \
+                  '2\tbar\t_\t_\tfoo bar\t_\t_\t_\t_\t_\n'
+
+        with self.assertRaises(IllegalCharacterError) as context:
+            Sentence.from_conllu(content, line_number=10)
+        self.assertEqual(12, context.exception.line_number)
+        self.assertEqual(14, context.exception.column_number)
+
+    def test_from_conllu_with_comment_after_word_lines(self):
+        with self.assertRaises(IllegalTokenError):
+            Sentence.from_conllu('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n'
+                                 '# Bar\n')
+
+    def test_from_conllu_with_empty_content(self):
+        for content in ('', '\n', '\n\n'):
+            with self.assertRaises(ValueError):
+                Sentence.from_conllu(content)
+
+    def test_from_conllu_with_many_sentences(self):
+        with self.assertRaises(ValueError):
+            Sentence.from_conllu('1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n'
+                                 '1\tBar\t_\t_\t_\t_\t_\t_\t_\t_\n\n')
+
+    def test_from_conllu_on_subclass(self):
+        class CustomSentence(Sentence):
+            pass
+
+        sentence = CustomSentence.from_conllu(
+            '1\tFoo\t_\t_\t_\t_\t_\t_\t_\t_\n\n')
+        self.assertIs(CustomSentence, type(sentence))
+        self.assertEqual('Foo', sentence.elements[0].form)
+
     def test_init_with_some_elements(self):
         elements = [Word(index=1), Word(index=2)]
 
@@ -402,3 +469,63 @@ class TestSentence(unittest.TestCase):
             '2.1\tBaz\t_\t_\t_\t_\t_\t_\t_\t_\n'
             '\n',
             sentence.to_conllu())
+
+    def _make_sentence(self):
+        return Sentence(
+            comments=['sent_id = 1'],
+            elements=[
+                Multiword(first_index=1, last_index=2, form='Foobar'),
+                Word(index=1, form='Foo', upos=UposTag.NOUN,
+                     feats=(('A', ('B',)),), head=0, deprel='root'),
+                Word(index=2, form='bar'),
+                EmptyNode(main_index=2, sub_index=1, form='Baz',
+                          deps=((1, 'dep'),))
+            ]
+        )
+
+    def test_pickle(self):
+        sentence = self._make_sentence()
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                result = pickle.loads(pickle.dumps(sentence, protocol))
+                self.assertIs(Sentence, type(result))
+                self.assertEqual(sentence.comments, result.comments)
+                self.assertEqual(
+                    [type(element) for element in sentence.elements],
+                    [type(element) for element in result.elements]
+                )
+                self.assertEqual(sentence.to_conllu(), result.to_conllu())
+
+    def test_pickle_is_smaller_than_default(self):
+        sentence = self._make_sentence()
+        default = object.__reduce_ex__(sentence, 4)
+
+        self.assertLess(len(pickle.dumps(sentence, 4)),
+                        len(pickle.dumps(default, 4)))
+
+    def test_pickle_objects_with_dict(self):
+        sentence = _CustomSentence(elements=[Word(index=1, form='Foo')])
+        sentence.extra = 'Bar'
+
+        result = pickle.loads(pickle.dumps(sentence))
+
+        self.assertIs(_CustomSentence, type(result))
+        self.assertEqual('Bar', result.extra)
+        self.assertEqual(sentence.to_conllu(), result.to_conllu())
+
+    def test_copy_shares_elements_and_comments(self):
+        sentence = self._make_sentence()
+        result = copy.copy(sentence)
+
+        self.assertIsNot(sentence, result)
+        self.assertIs(sentence.elements, result.elements)
+        self.assertIs(sentence.comments, result.comments)
+
+    def test_deepcopy(self):
+        sentence = self._make_sentence()
+        result = copy.deepcopy(sentence)
+
+        self.assertIsNot(sentence.elements[1], result.elements[1])
+        self.assertIsNot(sentence.comments, result.comments)
+        self.assertEqual(sentence.to_conllu(), result.to_conllu())